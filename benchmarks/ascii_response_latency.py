@@ -0,0 +1,183 @@
+"""
+Benchmark for the response latency of the ASCII readers.
+
+Runs a DeskID ISO (HF) and a Pulsar MX (UHF) class reader with a simulated ASCII reader that
+answers every command after a fixed delay. Measures the mean time of sequential single
+inventories and tag requests, from the call until the parsed response is returned. The readers
+are compared with the former implementation, which polled the last response timestamp every
+10 milliseconds. Also checks that a continuous inventory without a callback can be fetched.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/ascii_response_latency.py [calls] [delay]
+"""
+import asyncio
+import sys
+from time import perf_counter, time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from metratec_rfid.connection.connection import Connection
+from metratec_rfid.hf_reader_ascii import HfReaderAscii
+from metratec_rfid.reader_exception import RfidReaderException
+from metratec_rfid.uhf_reader_ascii import UhfReaderAscii
+
+HF_INVENTORY = "E0040150954F02B1\rE200600311753E33\rIVF 02\r\n"
+HF_REQUEST = "TDT\r0011112222B7DD\rCOK\rNCL\r\n"
+UHF_INVENTORY = "3034257BF468D480000003EC\r3034257BF468D480000003EC\r-55\rIVF 001\r\n"
+
+
+class SimulatedAsciiConnection(Connection):
+    """ stand-in connection that answers the ASCII commands after a delay """
+
+    def __init__(self, hardware: str, inventory: str, delay: float) -> None:
+        super().__init__()
+        self._hardware: str = hardware
+        self._inventory: str = inventory
+        self._delay: float = delay
+        self._connected: bool = False
+        self._separator: str = "\r"
+        self._continuous: bool = False
+
+    def get_info(self) -> str:
+        return "simulated"
+
+    def connect(self) -> None:
+        self._connected = True
+        asyncio.get_running_loop().call_soon(self._cb_connection_made)  # type: ignore
+
+    def disconnect(self) -> None:
+        self._connected = False
+        self._continuous = False
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def set_separator(self, separator: str) -> None:
+        self._separator = separator
+
+    def send(self, data: bytes) -> None:
+        asyncio.get_running_loop().call_later(self._delay, self._answer, data.decode().strip("\r"))
+
+    def _answer(self, command: str) -> None:
+        if command == "BRK":
+            response = "BRA\r\n" if self._continuous else "NCM\r" if self._separator == "\r" else "NCM\r\n"
+            self._continuous = False
+        elif command.startswith("CNR INV"):
+            self._continuous = True
+            asyncio.get_running_loop().call_later(self._delay, self._continue_inventory)
+            return
+        elif command in ("HWR", "RFW"):
+            response = f"{self._hardware}      0400 \r\n"
+        elif command.startswith("INV") or command.startswith("RDT"):
+            response = self._inventory
+        elif command.startswith("REQ"):
+            response = HF_REQUEST
+        else:
+            response = "OK!\r\n"
+        self._receive(response)
+
+    def _continue_inventory(self) -> None:
+        if self._continuous and self._connected:
+            self._receive(self._inventory)
+            asyncio.get_running_loop().call_later(self._delay, self._continue_inventory)
+
+    def _receive(self, response: str) -> None:
+        for message in response.split(self._separator)[:-1]:
+            self._cb_data_received(message.encode())  # type: ignore
+
+
+class PollingHfReader(HfReaderAscii):
+    """ HF reader with the former polling of the responses, kept for comparison """
+
+    # @override
+    async def _get_last_inventory(self, command: str, *parameters, timeout: float = 2.0) -> Dict[str, Any]:
+        async with self._communication_lock:
+            self._last_inventory['timestamp'] = None
+            self._last_inventory['request'] = self._prepare_command(command, *parameters)
+            self._send_command(command, *parameters)
+            await poll(self._last_inventory, timeout)
+            return self._last_inventory
+
+    # @override
+    async def _get_last_request(self, command: str, *parameters, timeout: float = 2.0) -> Any:
+        async with self._communication_lock:
+            self._last_request['timestamp'] = None
+            self._last_request['request'] = self._prepare_command(command, *parameters)
+            self._send_command(command, *parameters)
+            await poll(self._last_request, timeout)
+            return self._last_request['response']
+
+
+class PollingUhfReader(UhfReaderAscii):
+    """ UHF reader with the former polling of the responses, kept for comparison """
+
+    # @override
+    async def _get_last_inventory(self, command: str, *parameters, timeout: float = 2.0) -> Dict[str, Any]:
+        async with self._communication_lock:
+            self._last_inventory['timestamp'] = None
+            self._last_inventory['request'] = self._prepare_command(command, *parameters)
+            self._send_command(command, *parameters)
+            await poll(self._last_inventory, timeout)
+            return self._last_inventory
+
+
+async def poll(last_response: Dict[str, Any], timeout: float) -> None:
+    """ wait for the timestamp of the response, as the former implementation """
+    max_time = time() + timeout
+    while max_time > time():
+        await asyncio.sleep(0.01)
+        if last_response['timestamp']:
+            return
+    raise RfidReaderException("no reader response")
+
+
+async def measure(reader: Any, call: Callable[[Any], Awaitable[Any]], calls: int) -> float:
+    """ returns the mean latency of the call in milliseconds """
+    await reader.connect()
+    start = perf_counter()
+    for _ in range(calls):
+        await call(reader)
+    latency = (perf_counter() - start) / calls * 1e3
+    await reader.disconnect()
+    return latency
+
+
+async def check_continuous_inventory(reader: Any) -> int:
+    """ fetch the transponders of a continuous inventory without a callback """
+    await reader.connect()
+    await reader.start_inventory()
+    tags = await asyncio.wait_for(reader.fetch_inventory(wait_for_tags=True), 2.0)
+    await reader.stop_inventory()
+    await reader.disconnect()
+    if not tags:
+        raise RfidReaderException(f"no transponders of the continuous inventory of {reader.get_name()}")
+    return len(tags)
+
+
+def main() -> None:
+    """ run the benchmark """
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    print(f"{calls} sequential calls, {delay * 1e3:.1f} ms reader delay, mean latency in ms")
+    cases: List[tuple] = [
+        ("DeskID ISO inventory", HfReaderAscii, PollingHfReader, "DESKID_ISO", HF_INVENTORY,
+         lambda reader: reader.get_inventory()),
+        ("DeskID ISO read", HfReaderAscii, PollingHfReader, "DESKID_ISO", HF_INVENTORY,
+         lambda reader: reader.read_tag_data(0)),
+        ("Pulsar MX inventory", UhfReaderAscii, PollingUhfReader, "PULSAR_MX", UHF_INVENTORY,
+         lambda reader: reader.get_inventory()),
+    ]
+    print(f"{'':22} {'polling':>8} {'future':>8}")
+    for name, reader_class, polling_class, hardware, inventory, call in cases:
+        latencies: List[float] = []
+        for cls in (polling_class, reader_class):
+            reader = cls("benchmark", SimulatedAsciiConnection(hardware, inventory, delay))
+            latencies.append(asyncio.run(measure(reader, call, calls)))
+        print(f"{name:22} {latencies[0]:8.2f} {latencies[1]:8.2f}")
+    for name, reader_class, hardware, inventory in (("DeskID ISO", HfReaderAscii, "DESKID_ISO", HF_INVENTORY),
+                                                    ("Pulsar MX", UhfReaderAscii, "PULSAR_MX", UHF_INVENTORY)):
+        reader = reader_class(name, SimulatedAsciiConnection(hardware, inventory, delay))
+        print(f"{name} continuous inventory fetched, {asyncio.run(check_continuous_inventory(reader))} tags")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for the dispatch modes of the reader callbacks.
+
+Fires continuous inventory events into a UHF AT reader with a slow inventory callback (a
+blocking sleep, like a database write) and measures how long the event loop is blocked, as seen
+by a task that should run every 10 ms, e.g. the heartbeat check of the reader.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/callback_dispatch.py [callback_ms]
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+from metratec_rfid.connection.socket_connection import SocketConnection
+from metratec_rfid.uhf_reader_at import UhfReaderAT
+from metratec_rfid.uhf_tag import UhfTag
+
+EVENTS = 50
+
+
+async def run(mode: str, callback_time: float) -> None:
+    """ run a single measurement """
+    reader = UhfReaderAT("benchmark", SocketConnection("127.0.0.1", 10001))
+    reader.set_callback_dispatch(mode)
+    reader.set_cb_inventory(lambda tags: time.sleep(callback_time))
+    lags: List[float] = []
+
+    async def ticker() -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    for index in range(EVENTS):
+        # pylint: disable=protected-access
+        reader._fire_inventory_event([UhfTag(f"3034257BF468D480000003{index:02X}", time.time())])
+        await asyncio.sleep(callback_time / 2)
+    duration = time.perf_counter() - start
+    task.cancel()
+    metrics = reader.get_callback_metrics()
+    print(f"{mode:12} loop lag max {max(lags) * 1e3:7.1f} ms, events fired in {duration:5.2f} s, "
+          f"queue depth max {metrics['max_queue_depth']:3}, "
+          f"dispatch latency max {metrics['latency_max'] * 1e3:7.1f} ms")
+    reader.set_callback_dispatch()
+
+
+def main() -> None:
+    """ run the benchmark """
+    callback_time = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.05
+    print(f"{EVENTS} events, {callback_time * 1e3:.0f} ms per callback, one event every {callback_time * 500:.0f} ms")
+    for mode in ("inline", "thread_pool", "worker"):
+        asyncio.run(run(mode, callback_time))
+
+
+if __name__ == '__main__':
+    main()
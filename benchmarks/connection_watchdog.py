@@ -0,0 +1,149 @@
+"""
+Benchmark for the detection of a lost reader connection.
+
+Connects a UHF AT reader to a local socket stand-in that answers the configuration commands and
+sends a ``+HBT`` heartbeat. The stand-in then stops sending without closing the socket, like a
+reader behind a broken network link. Measures the time from the last received heartbeat until the
+reader reports the lost connection and the time until it is running again on a new connection.
+The connection check is compared with the former implementation, which polled every 5 seconds
+with a timeout of 2.5 heartbeat intervals.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/connection_watchdog.py [heartbeat] [grace] [runs]
+"""
+import asyncio
+import sys
+from time import time
+from typing import Dict, List, Optional
+
+from metratec_rfid.connection.socket_connection import SocketConnection
+from metratec_rfid.uhf_reader_at import UhfReaderAT
+
+RESPONSES: Dict[str, List[str]] = {
+    "ATI": ["+SW: PULSAR_LR 0110", "+HW: PULSAR_LR 0100", "+SERIAL: 2020090817420000"],
+    "AT+INVS?": ["+INVS: 0,1,0,0,0,ALL,A,-100"],
+    "AT+ANT?": ["+ANT: 1"],
+}
+
+
+class StandInReader():
+    """ socket stand-in for an AT reader, only the newest connection is served """
+
+    def __init__(self) -> None:
+        self.heartbeat: int = 0
+        self.last_heartbeat: float = 0.0
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._writers: List[asyncio.StreamWriter] = []
+
+    def stop_heartbeat(self) -> None:
+        """ stop sending on the current connection, the socket stays open """
+        self._writer = None
+
+    def close(self) -> None:
+        """ close all connections """
+        for writer in self._writers:
+            writer.close()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ answer the commands of a connection """
+        self._writer = writer
+        self._writers.append(writer)
+        heartbeat_task = asyncio.ensure_future(self._send_heartbeat(writer))
+        try:
+            while True:
+                command = (await reader.readuntil(b"\r"))[:-1].decode()
+                if self._writer is not writer:
+                    continue
+                if command.startswith("AT+HBT="):
+                    self.heartbeat = int(command[7:])
+                if command == "AT+BINV":
+                    lines, status = ["<Inventory is not running>"], "ERROR"
+                else:
+                    lines, status = RESPONSES.get(command, []), "OK"
+                writer.write("".join(line + "\r\n" for line in [command] + (["\r".join(lines)] if lines else [])
+                                     + [status]).encode())
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            heartbeat_task.cancel()
+            writer.close()
+
+    async def _send_heartbeat(self, writer: asyncio.StreamWriter) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat if self.heartbeat > 0 else 0.1)
+            if self._writer is writer and self.heartbeat > 0:
+                writer.write(b"+HBT\r\n")
+                self.last_heartbeat = time()
+
+
+class LegacyReader(UhfReaderAT):
+    """ reader with the former connection check, kept for comparison """
+
+    # @override
+    def _start_watchdog(self) -> None:
+        if self._task_connection_check and not self._task_connection_check.done():
+            self._task_connection_check.cancel()
+        self._task_connection_check = asyncio.ensure_future(self._poll_connection())
+
+    async def _poll_connection(self) -> None:
+        if self._heartbeat <= 0:
+            return
+        self._timeout = 2.5 * self._heartbeat
+        while self.get_status()['status'] >= 1:
+            await asyncio.sleep(5)
+            if self._last_message_time + self._timeout >= time():
+                continue
+            await self._check_connection()
+            break
+
+
+async def wait_for_status(events: asyncio.Queue, status: int) -> float:
+    """ wait for the status and return the time of the change """
+    while True:
+        new_status, timestamp = await asyncio.wait_for(events.get(), 30.0)
+        if new_status == status:
+            return timestamp
+
+
+async def run(reader_class: type, heartbeat: int, grace: float, runs: int) -> None:
+    """ measure the detection and reconnect times """
+    stand_in = StandInReader()
+    server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader = reader_class("benchmark", SocketConnection("127.0.0.1", port))
+    events: asyncio.Queue = asyncio.Queue()
+    reader.set_cb_status(lambda status: events.put_nowait((status['status'], time())))
+    reader.set_heartbeat_grace(grace)
+    await reader.connect()
+    await reader.set_heartbeat(heartbeat)
+    detections: List[float] = []
+    reconnects: List[float] = []
+    for _ in range(runs):
+        # the heartbeat of the stand-in is independent of the watchdog timer
+        await asyncio.sleep(heartbeat * 1.3)
+        stand_in.stop_heartbeat()
+        lost = await wait_for_status(events, reader.ERROR)
+        detections.append(lost - stand_in.last_heartbeat)
+        reconnects.append(await wait_for_status(events, reader.RUNNING) - lost)
+    await reader.disconnect()
+    stand_in.close()
+    server.close()
+    await server.wait_closed()
+    # let the connection handlers of the stand-in finish
+    await asyncio.sleep(0.1)
+    print(f"{reader_class.__name__:12} lost after {min(detections):5.2f} .. {max(detections):5.2f} s, "
+          f"running again after {min(reconnects) * 1e3:5.1f} .. {max(reconnects) * 1e3:5.1f} ms")
+
+
+def main() -> None:
+    """ run the benchmark """
+    heartbeat = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    grace = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    print(f"heartbeat {heartbeat} s, grace period {grace} s, {runs} runs")
+    for reader_class in (LegacyReader, UhfReaderAT):
+        asyncio.run(run(reader_class, heartbeat, grace, runs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark for the import time of the package.
+
+Starts a new interpreter for each scenario and measures the time of the imports, including the
+standard library and pyserial, and the number of loaded modules. The ``all names`` scenario
+imports every reader family, like the package did before the names were loaded on first use.
+The time is measured in the interpreter, the ``python -X importtime`` log does not contain the
+modules loaded with ``importlib.import_module``. Use ``python -X importtime -c "import metratec_rfid"``
+for the breakdown of the eager imports.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/import_time.py [runs]
+"""
+import subprocess
+import sys
+from typing import List, Tuple
+
+MEASURE = """
+import sys
+from time import perf_counter
+modules = len(sys.modules)
+start = perf_counter()
+{code}
+print(perf_counter() - start, len([name for name in sys.modules if name.startswith("metratec_rfid")]),
+      len(sys.modules) - modules)
+"""
+
+SCENARIOS: List[Tuple[str, str]] = [
+    ("import package", "import metratec_rfid"),
+    ("exception only", "from metratec_rfid import RfidReaderException"),
+    ("single reader", "from metratec_rfid import PulsarLR"),
+    ("detect_readers", "from metratec_rfid import detect_readers"),
+    ("all names", "import metratec_rfid\nfor name in metratec_rfid.__all__:\n    getattr(metratec_rfid, name)"),
+]
+
+
+def import_time(code: str) -> Tuple[float, int, int]:
+    """ run the code in a new interpreter, return the time in ms, the package and all new modules """
+    result = subprocess.run([sys.executable, "-c", MEASURE.format(code=code)],
+                            capture_output=True, text=True, check=True)
+    duration, package_modules, modules = result.stdout.split()
+    return float(duration) * 1e3, int(package_modules), int(modules)
+
+
+def main() -> None:
+    """ run the benchmark """
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"minimum of {runs} runs")
+    print(f"{'scenario':16} {'ms':>8} {'package':>8} {'modules':>8}")
+    for name, code in SCENARIOS:
+        measurements = [import_time(code) for _ in range(runs)]
+        _, package_modules, modules = measurements[0]
+        print(f"{name:16} {min(ms for ms, _, _ in measurements):8.1f} {package_modules:8} {modules:8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark for the parsing of UHF AT inventory events.
+
+Compares the former generic inventory parser, which worked on the decoded message and checked the
+inventory settings for every tag, with the event parser specialized for the inventory settings
+and the columnar ``TagBatch`` parser (``enable_tag_batch()``). Runs for every combination of TID,
+RSSI, phase and report mode.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/inventory_parsing.py [tags_per_round]
+"""
+import itertools
+import sys
+from timeit import repeat
+from typing import List, Optional
+
+from metratec_rfid.connection.socket_connection import SocketConnection
+from metratec_rfid.uhf_reader_at import UhfReaderAT
+from metratec_rfid.uhf_tag import UhfTag
+
+
+class LegacyReader(UhfReaderAT):
+    """ reader with the former generic inventory parser, kept for comparison """
+
+    # @override
+    def _parse_inventory(
+            self, responses: List[str],
+            timestamp: float, split_index: int = 6, is_report: bool = False) -> List[UhfTag]:
+        # disable 'Too many branches' warning - pylint: disable=R0912
+        # disable 'Too many local variables' warning - pylint: disable=R0914
+        inventory: List[UhfTag] = []
+        with_tid: bool = self._config['inventory']['with_tid']
+        with_rssi: bool = self._config['inventory']['with_rssi']
+        with_phase: bool = self._config['inventory'].get('phase', False)
+        antenna: Optional[int] = None
+        error: Optional[str] = None
+        for response in responses:
+            if response[0] != '+':
+                continue
+            if response[split_index] == '<':
+                antenna, error = self._parse_inventory_message(response, split_index, antenna, error)
+                continue
+            info: List[str] = response[split_index:].split(',')
+            try:
+                new_tag = UhfTag(info[0], timestamp, tid=info[1] if with_tid else None,
+                                 rssi=int(info[2]) if with_rssi and with_tid else int(info[1]) if with_rssi else None,
+                                 seen_count=int(info[-1]) if is_report else 1)
+                if with_phase:
+                    new_tag['phase'] = [info[-2], info[-1]]
+                inventory.append(new_tag)
+            except IndexError as err:
+                self.get_logger().debug("Error parsing inventory transponder -%s", err)
+        return self._finish_inventory(inventory, antenna, error)
+
+
+def create_message(tags: int, with_tid: bool, with_rssi: bool, with_phase: bool, is_report: bool) -> bytes:
+    """ create a continuous inventory event with the given number of tags """
+    prefix = b"+CINVR: " if is_report else b"+CINV: "
+    lines = []
+    for index in range(tags):
+        fields = [b"3034257BF468D48000000%03X" % index]
+        if with_tid:
+            fields.append(b"E200600311753E%02X" % (index % 256))
+        if with_rssi:
+            fields.append(b"-%d" % (40 + index % 30))
+        if with_phase:
+            fields += [b"12", b"34"]
+        if is_report:
+            fields.append(b"%d" % (1 + index % 5))
+        lines.append(prefix + b",".join(fields))
+    lines.append(prefix + b"<ROUND FINISHED, ANT=1>")
+    return b"\r".join(lines)
+
+
+def main() -> None:
+    """ run the benchmark """
+    # pylint: disable=protected-access,cell-var-from-loop
+    tags = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    legacy_reader = LegacyReader("legacy", SocketConnection("127.0.0.1", 10001))
+    reader = UhfReaderAT("benchmark", SocketConnection("127.0.0.1", 10001))
+    batch_reader = UhfReaderAT("batch", SocketConnection("127.0.0.1", 10001))
+    batch_reader.enable_tag_batch()
+    print(f"{tags} tags per round, ns per tag")
+    print("tid   rssi  phase report   generic  specialized     batch")
+    for with_tid, with_rssi, with_phase, is_report in itertools.product((False, True), repeat=4):
+        for parsing_reader in (legacy_reader, reader, batch_reader):
+            parsing_reader._config['inventory'] = {'with_tid': with_tid, 'with_rssi': with_rssi,
+                                                   'phase': with_phase}
+            parsing_reader._inventory_parsers.clear()
+        message = create_message(tags, with_tid, with_rssi, with_phase, is_report)
+        split_index = 8 if is_report else 7
+
+        def run_generic() -> None:
+            legacy_reader._parse_inventory(message.decode().split("\r"), 1.0, split_index, is_report)
+
+        def run_specialized() -> None:
+            reader._parse_inventory_bytes(message.split(b"\r"), 1.0, split_index, is_report)
+
+        def run_batch() -> None:
+            batch_reader._parse_inventory_bytes(message.split(b"\r"), 1.0, split_index, is_report)
+
+        expected = legacy_reader._parse_inventory(message.decode().split("\r"), 1.0, split_index, is_report)
+        if (reader._parse_inventory_bytes(message.split(b"\r"), 1.0, split_index, is_report) != expected or
+                batch_reader._parse_inventory_bytes(message.split(b"\r"), 1.0, split_index,
+                                                    is_report).to_list() != expected):
+            raise RuntimeError("different parsing results")
+        generic = min(repeat(run_generic, number=500, repeat=5)) / 500 / tags
+        specialized = min(repeat(run_specialized, number=500, repeat=5)) / 500 / tags
+        batch = min(repeat(run_batch, number=500, repeat=5)) / 500 / tags
+        print(f"{with_tid!s:5} {with_rssi!s:5} {with_phase!s:5} {is_report!s:5}  "
+              f"{generic * 1e9:8.0f}  {specialized * 1e9:8.0f}  {batch * 1e9:8.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark for the presence tracking of transponders.
+
+Fills a PresenceTracker with a population of present transponders and measures the time per
+inventory round, compared with a tracker that scans all present transponders for expired ones
+in every round.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/presence_tracking.py [population] [tags_per_round]
+"""
+import sys
+from time import perf_counter, time
+from typing import Dict, List
+
+from metratec_rfid.presence_tracker import PresenceTracker
+from metratec_rfid.uhf_tag import UhfTag
+
+ROUNDS = 200
+
+
+class ScanningTracker():
+    """ presence tracker that checks all present transponders in every round """
+
+    def __init__(self, absence_timeout: float) -> None:
+        self._absence_timeout = absence_timeout
+        self._tags: Dict[str, UhfTag] = {}
+
+    def update(self, inventory: List[UhfTag]) -> None:
+        """ add the inventory and remove the expired transponders """
+        now = time()
+        for tag in inventory:
+            self._tags[tag.get_id()] = tag
+        expired = [tag_id for tag_id, tag in self._tags.items()
+                   if tag.get_last_seen() + self._absence_timeout <= now]
+        for tag_id in expired:
+            del self._tags[tag_id]
+
+
+def main() -> None:
+    """ run the benchmark """
+    population = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    per_round = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    print(f"{population} present tags, {per_round} tags per round, us per round")
+    for name, tracker in (("heap", PresenceTracker(3600.0)), ("full scan", ScanningTracker(3600.0))):
+        now = time()
+        tracker.update([UhfTag(f"3034257BF468D48000{index:06X}", now) for index in range(population)])
+        rounds = [[UhfTag(f"3034257BF468D48000{(index * per_round + offset) % population:06X}", now)
+                   for offset in range(per_round)] for index in range(ROUNDS)]
+        start = perf_counter()
+        for inventory in rounds:
+            tracker.update(inventory)
+        duration = perf_counter() - start
+        print(f"{name:10} {duration / ROUNDS * 1e6:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Benchmark for the inventory throughput of a reader fleet.
+
+Runs UHF AT readers with a stand-in connection that answers the configuration commands and
+generates continuous inventory rounds as fast as the event loop allows. The readers parse the
+rounds into tag batches and the inventory callback exports the EPCs as JSON. Measures the
+aggregate number of transponders per second with all readers on one event loop and with the
+readers distributed over the worker processes of a `ReaderFleet`. The fleet only scales with
+the number of available CPU cores.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/reader_fleet.py [readers] [workers] [duration]
+"""
+import asyncio
+import json
+import os
+import sys
+from time import perf_counter
+from typing import Any, Dict, List
+
+from metratec_rfid.connection.connection import Connection
+from metratec_rfid.reader_fleet import ReaderFleet
+from metratec_rfid.uhf_reader_at import UhfReaderAT
+
+TAGS_PER_ROUND = 50
+
+RESPONSES: Dict[str, List[str]] = {
+    "ATI": ["+SW: PULSAR_LR 0110", "+HW: PULSAR_LR 0100", "+SERIAL: 2020090817420000"],
+    "AT+INVS?": ["+INVS: 0,1,0,0,0,ALL,A,-100"],
+    "AT+ANT?": ["+ANT: 1"],
+}
+
+
+class GeneratorConnection(Connection):
+    """ stand-in connection that generates continuous inventory rounds """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._connected: bool = False
+        self._running: bool = False
+        self._round: bytes = ("".join(f"+CINV: 3034257BF468D48000{index:06X},-{50 + index % 20}\r"
+                                      for index in range(TAGS_PER_ROUND))
+                              + "+CINV: <ROUND FINISHED, ANT=1>\r\n").encode()
+
+    def get_info(self) -> str:
+        return "generator"
+
+    def connect(self) -> None:
+        self._connected = True
+        asyncio.get_running_loop().call_soon(self._cb_connection_made)  # type: ignore
+
+    def disconnect(self) -> None:
+        self._connected = False
+        self._running = False
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def set_separator(self, separator: str) -> None:
+        self._separator_encoded = separator.encode()
+
+    def send(self, data: bytes) -> None:
+        for command in data.decode().split("\r"):
+            if command:
+                self._answer(command)
+
+    def _answer(self, command: str) -> None:
+        lines, status = RESPONSES.get(command, []), "OK"
+        if command == "AT+CINV":
+            self._running = True
+            asyncio.get_running_loop().call_soon(self._generate)
+        elif command == "AT+BINV":
+            if not self._running:
+                lines, status = ["<Inventory is not running>"], "ERROR"
+            self._running = False
+        response = "".join(line + "\r\n" for line in [command] + (["\r".join(lines)] if lines else []) + [status])
+        asyncio.get_running_loop().call_soon(self._receive, response.encode())
+
+    def _receive(self, data: bytes) -> None:
+        self._messages_received(self._parse_input_data(data))
+
+    def _generate(self) -> None:
+        if not self._running:
+            return
+        self._receive(self._round)
+        asyncio.get_running_loop().call_soon(self._generate)
+
+
+class GeneratorReader(UhfReaderAT):
+    """ UHF AT reader with a generator connection """
+
+    def __init__(self, instance: str) -> None:
+        super().__init__(instance, GeneratorConnection())
+
+
+class Counter():
+    """ inventory callback, exports the EPCs as JSON and counts the transponders """
+
+    def __init__(self) -> None:
+        self.tags: int = 0
+
+    def add(self, _name: str, inventory: Any) -> None:
+        """ count the transponders of an inventory """
+        json.dumps(inventory.get_epcs())
+        self.tags += len(inventory)
+
+
+async def run_single_loop(readers: int, duration: float) -> float:
+    """ all readers on one event loop, returns the transponders per second """
+    counter = Counter()
+    reader_list: List[GeneratorReader] = []
+    for index in range(readers):
+        reader = GeneratorReader(f"reader_{index}")
+        reader.enable_tag_batch()
+        reader.set_cb_inventory(lambda inventory, name=reader.get_name(): counter.add(name, inventory))
+        await reader.connect()
+        reader_list.append(reader)
+    for reader in reader_list:
+        await reader.start_inventory()
+    start_tags, start = counter.tags, perf_counter()
+    await asyncio.sleep(duration)
+    rate = (counter.tags - start_tags) / (perf_counter() - start)
+    for reader in reader_list:
+        await reader.disconnect()
+    return rate
+
+
+async def run_fleet(readers: int, workers: int, duration: float) -> float:
+    """ readers distributed over worker processes, returns the transponders per second """
+    counter = Counter()
+    fleet = ReaderFleet(workers=workers)
+    for index in range(readers):
+        fleet.add(GeneratorReader, f"reader_{index}")
+    fleet.set_cb_inventory(counter.add)
+    await fleet.start()
+    await fleet.connect()
+    await fleet.start_inventory()
+    # wait for the first inventories
+    await asyncio.sleep(0.5)
+    start_tags, start = counter.tags, perf_counter()
+    await asyncio.sleep(duration)
+    rate = (counter.tags - start_tags) / (perf_counter() - start)
+    await fleet.stop_inventory()
+    await fleet.stop()
+    return rate
+
+
+def main() -> None:
+    """ run the benchmark """
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 3.0
+    print(f"{readers} readers, {TAGS_PER_ROUND} tags per round, {os.cpu_count()} CPUs, tags per second")
+    print(f"{'single loop':16} {asyncio.run(run_single_loop(readers, duration)):12.0f}")
+    print(f"{f'fleet {workers} workers':16} {asyncio.run(run_fleet(readers, workers, duration)):12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark for the inventory parsers with a replayed reader session.
+
+Replays a recorded session at maximum speed and measures the transponders per second with the
+dict based tags, the compact tags and the tag batches. A session contains the connect, a
+continuous inventory for some seconds and its stop. It is recorded from a real reader with the
+``record`` command, or from a local stand-in reader without arguments.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/replay_inventory.py
+    python benchmarks/replay_inventory.py record <reader class> <address> <seconds> <file>
+    python benchmarks/replay_inventory.py replay <reader class> <file> [runs]
+
+    e.g. python benchmarks/replay_inventory.py record PulsarLR 192.168.2.101 10 pulsar.rec
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import metratec_rfid
+from metratec_rfid.connection.recording_connection import RecordingConnection, ReplayConnection
+from metratec_rfid.connection.socket_connection import SocketConnection
+from metratec_rfid.reader import RfidReader
+from metratec_rfid.uhf_reader_at import UhfReaderAT
+
+TAGS_PER_ROUND = 50
+
+RESPONSES: Dict[str, List[str]] = {
+    "ATI": ["+SW: PULSAR_LR 0110", "+HW: PULSAR_LR 0100", "+SERIAL: 2020090817420000"],
+    "AT+INVS?": ["+INVS: 0,1,0,0,0,ALL,A,-100"],
+    "AT+ANT?": ["+ANT: 1"],
+}
+
+
+class StandInReader():
+    """ socket stand-in for an AT reader with continuous inventories """
+
+    def __init__(self) -> None:
+        self._round: bytes = ("".join(f"+CINV: 3034257BF468D48000{index:06X},-{50 + index % 20}\r"
+                                      for index in range(TAGS_PER_ROUND))
+                              + "+CINV: <ROUND FINISHED, ANT=1>\r\n").encode()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ answer the commands of a connection """
+        inventory_task = None
+        try:
+            while True:
+                command = (await reader.readuntil(b"\r"))[:-1].decode()
+                lines, status = RESPONSES.get(command, []), "OK"
+                if command == "AT+CINV":
+                    inventory_task = asyncio.ensure_future(self._send_inventories(writer))
+                elif command == "AT+BINV":
+                    if inventory_task is None:
+                        lines, status = ["<Inventory is not running>"], "ERROR"
+                    else:
+                        inventory_task.cancel()
+                        inventory_task = None
+                writer.write("".join(line + "\r\n" for line in [command] + (["\r".join(lines)] if lines else [])
+                                     + [status]).encode())
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            if inventory_task is not None:
+                inventory_task.cancel()
+            writer.close()
+
+    async def _send_inventories(self, writer: asyncio.StreamWriter) -> None:
+        while True:
+            writer.write(self._round)
+            await asyncio.sleep(0.002)
+
+
+async def record(reader: RfidReader, seconds: float, path: str) -> None:
+    """ record a session with a continuous inventory """
+    connection = RecordingConnection(reader.get_connection(), path)
+    reader.set_connection(connection)
+    await reader.connect()
+    await reader.start_inventory()
+    await asyncio.sleep(seconds)
+    await reader.stop_inventory()
+    await reader.disconnect()
+    connection.close()
+
+
+async def record_stand_in(path: str) -> None:
+    """ record a session of the stand-in reader """
+    stand_in = StandInReader()
+    server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    await record(UhfReaderAT("benchmark", SocketConnection("127.0.0.1", port)), 2.0, path)
+    server.close()
+    await server.wait_closed()
+
+
+async def replay(reader: RfidReader, path: str) -> float:
+    """ replay the session at maximum speed, returns the transponders per second """
+    connection = ReplayConnection(path, speed=0)
+    reader.set_connection(connection)
+    counter: List[int] = [0]
+    reader.set_cb_inventory(lambda inventory: counter.__setitem__(0, counter[0] + len(inventory)))
+    await reader.connect()
+    start = perf_counter()
+    await reader.start_inventory()
+    await connection.wait_idle()
+    duration = perf_counter() - start
+    await reader.stop_inventory()
+    await reader.disconnect()
+    return counter[0] / duration
+
+
+def benchmark(create_reader: Callable[[], RfidReader], path: str, runs: int) -> None:
+    """ replay the session with the tag types """
+    for name in ("tags", "compact tags", "tag batch"):
+        rates: List[float] = []
+        for _ in range(runs):
+            reader = create_reader()
+            if name == "compact tags":
+                reader.enable_compact_tags()
+            elif name == "tag batch":
+                if not hasattr(reader, 'enable_tag_batch'):
+                    continue
+                reader.enable_tag_batch()
+            rates.append(asyncio.run(replay(reader, path)))
+        if rates:
+            print(f"{name:14} {max(rates):12.0f}")
+
+
+def main() -> None:
+    """ run the benchmark """
+    if len(sys.argv) > 1 and sys.argv[1] == "record":
+        reader = getattr(metratec_rfid, sys.argv[2])("benchmark", sys.argv[3])
+        asyncio.run(record(reader, float(sys.argv[4]), sys.argv[5]))
+        print(f"{os.path.getsize(sys.argv[5])} bytes recorded")
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "replay":
+        runs = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+        print(f"{sys.argv[3]}, maximum of {runs} runs, tags per second")
+        reader_class = getattr(metratec_rfid, sys.argv[2])
+        benchmark(lambda: reader_class("replay", ""), sys.argv[3], runs)
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stand_in.rec")
+        asyncio.run(record_stand_in(path))
+        print(f"stand-in session, {os.path.getsize(path)} bytes, maximum of 5 runs, tags per second")
+        benchmark(lambda: UhfReaderAT("replay", SocketConnection("replay", 0)), path, 5)
+
+
+if __name__ == '__main__':
+    main()
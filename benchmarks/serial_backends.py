@@ -0,0 +1,100 @@
+"""
+Benchmark for the receive backends of the serial connection.
+
+A child process writes ``+CINV`` lines into a pty loopback, paced to the given baud rates.
+The serial connection reads them from the other end and the CPU time used by the reading
+process is compared for:
+
+* the StreamReader backend with one callback per line (``readuntil()``)
+* the StreamReader backend with the batch callback
+* the protocol backend with the batch callback
+
+A pty does not limit the data rate itself, so the writer paces the data to the nominal rate of
+the baud rate (10 bits per byte). Linux and macOS only.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/serial_backends.py [seconds]
+"""
+import asyncio
+import os
+import pty
+import resource
+import sys
+import time
+import tty
+from multiprocessing import Process
+
+from metratec_rfid.connection.serial_connection import SerialConnection
+
+LINE = b"+CINV: 3034257BF468D480000003EC,-60\r\n"
+
+
+def write_lines(master: int, baud_rate: int, seconds: float) -> None:
+    """ write the lines, paced to the baud rate """
+    bytes_per_tick = baud_rate // 10 // 100
+    data = LINE * (baud_rate // 10 * int(seconds + 1) // len(LINE))
+    start = time.monotonic()
+    for tick, index in enumerate(range(0, len(data), bytes_per_tick)):
+        os.write(master, data[index:index + bytes_per_tick])
+        delay = start + (tick + 1) * 0.01 - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        if time.monotonic() - start > seconds:
+            break
+
+
+def cpu_time() -> float:
+    """ return the used cpu time of this process """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def run(backend: str, batch: bool, baud_rate: int, seconds: float) -> None:
+    """ run a single measurement """
+    master, slave = pty.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    connection = SerialConnection(os.ttyname(slave), baud_rate, backend=backend)
+    lines = [0]
+
+    def on_message(_message: bytes) -> None:
+        lines[0] += 1
+
+    def on_batch(messages, _timestamp) -> None:
+        lines[0] += len(messages)
+
+    if batch:
+        connection.set_cb_data_received_batch(on_batch)
+    else:
+        connection.set_cb_data_received(on_message)
+    connection.connect()
+    while not connection.is_connected():
+        await asyncio.sleep(0.01)
+    writer = Process(target=write_lines, args=(master, baud_rate, seconds))
+    start_cpu = cpu_time()
+    start = time.monotonic()
+    writer.start()
+    while writer.is_alive():
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.1)
+    used_cpu = cpu_time() - start_cpu
+    duration = time.monotonic() - start
+    connection.disconnect()
+    os.close(master)
+    name = f"{backend}{' + batch' if batch else ''}"
+    print(f"{baud_rate:>7} {name:>16}: {lines[0]:6} lines, {used_cpu / max(lines[0], 1) * 1e6:6.1f} us cpu "
+          f"per line, {used_cpu / duration * 100:5.1f} % cpu")
+
+
+def main() -> None:
+    """ run the benchmark """
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    for baud_rate in (115200, 921600):
+        for backend, batch in ((SerialConnection.BACKEND_STREAM, False),
+                               (SerialConnection.BACKEND_STREAM, True),
+                               (SerialConnection.BACKEND_PROTOCOL, True)):
+            asyncio.run(run(backend, batch, baud_rate, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark for the framing of received socket data.
+
+Feeds multi-kilobyte chunks with hundreds of ``+CINV`` lines into
+``SocketConnection._parse_input_data`` and compares it with the former
+implementation, which re-sliced an immutable ``bytes`` buffer after every line.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/socket_framing.py [lines_per_chunk] [chunks]
+"""
+import sys
+from timeit import repeat
+from typing import List
+
+from metratec_rfid.connection.socket_connection import SocketConnection
+
+
+class LegacyFramer():
+    """ former bytes based implementation, kept for comparison """
+
+    def __init__(self) -> None:
+        self._last_message: bytes = b""
+        self._separator_encoded: bytes = b"\n"
+
+    def parse_input_data(self, recv_data: bytes) -> List[bytes]:
+        """ split the received data """
+        self._last_message += recv_data
+        responses: List[bytes] = []
+        index: int = self._last_message.find(self._separator_encoded)
+        while index > -1:
+            responses.append(self._last_message[:index+1])
+            self._last_message = self._last_message[index+1:]
+            index = self._last_message.find(self._separator_encoded)
+        return responses
+
+
+def create_chunks(lines_per_chunk: int, chunks: int) -> List[bytes]:
+    """ create the received data, the chunk boundaries are not aligned with the lines """
+    lines = b"".join(b"+CINV: 3034257BF468D480000003EC%04X,ANT=1,RSSI=-60\r\n" % (i % 0xFFFF)
+                     for i in range(lines_per_chunk * chunks))
+    size = len(lines) // chunks + 7
+    return [lines[i:i+size] for i in range(0, len(lines), size)]
+
+
+def main() -> None:
+    """ run the benchmark """
+    lines_per_chunk = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    chunk_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    chunks = create_chunks(lines_per_chunk, chunk_count)
+    print(f"{len(chunks)} chunks, {lines_per_chunk} lines, {len(chunks[0])} bytes per chunk")
+
+    def run_legacy() -> int:
+        framer = LegacyFramer()
+        return sum(len(framer.parse_input_data(chunk)) for chunk in chunks)
+
+    def run_current() -> int:
+        # pylint: disable=protected-access
+        connection = SocketConnection("127.0.0.1", 10001)
+        return sum(len(connection._parse_input_data(chunk)) for chunk in chunks)
+
+    if run_legacy() != run_current():
+        raise RuntimeError("different framing results")
+    for name, function in (("bytes (legacy)", run_legacy), ("bytearray", run_current)):
+        best = min(repeat(function, number=5, repeat=5)) / 5
+        print(f"{name:>15}: {best * 1000:8.2f} ms per run, "
+              f"{best / (lines_per_chunk * chunk_count) * 1e9:6.0f} ns per line")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Memory benchmark for the transponder classes.
+
+Creates an inventory history of UHF transponders (EPC, TID, RSSI, antenna) and measures the
+retained memory per transponder with tracemalloc for:
+
+* the dict based ``UhfTag``
+* the slot based ``CompactUhfTag`` (``enable_compact_tags()``)
+* the columnar ``TagBatch`` (``enable_tag_batch()`` of the UHF AT readers)
+
+The EPC and TID strings are included in the numbers, they are the same for every class. The
+creation time of the history is measured separately, as tracemalloc slows down the allocations.
+
+Usage (with the package installed or on the PYTHONPATH):
+    python benchmarks/tag_memory.py [tags]
+"""
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, List, Tuple
+
+from metratec_rfid.compact_tag import CompactUhfTag
+from metratec_rfid.tag_batch import TagBatch
+from metratec_rfid.uhf_tag import UhfTag
+
+Values = List[Tuple[bytes, bytes, int]]
+
+
+def create_values(tags: int) -> Values:
+    """ create the encoded tag values, as received from a reader """
+    return [(b"3034257BF468D48000%06X" % index, b"E200600311753E%06X" % index, -40 - index % 30)
+            for index in range(tags)]
+
+
+def create_dict_tags(values: Values) -> Any:
+    """ create the history with UhfTag objects """
+    history = []
+    for epc, tid, rssi in values:
+        tag = UhfTag(epc.decode(), 1.0, tid.decode(), seen_count=1, rssi=rssi)
+        tag.set_antenna(1)
+        history.append(tag)
+    return history
+
+
+def create_compact_tags(values: Values) -> Any:
+    """ create the history with CompactUhfTag objects """
+    history = []
+    for epc, tid, rssi in values:
+        tag = CompactUhfTag(epc.decode(), 1.0, tid.decode(), seen_count=1, rssi=rssi)
+        tag.set_antenna(1)
+        history.append(tag)
+    return history
+
+
+def create_tag_batch(values: Values) -> Any:
+    """ create the history as TagBatch """
+    history = TagBatch.from_columns([value[0] for value in values], 1.0, [value[1] for value in values],
+                                    [value[2] for value in values])
+    history.set_antenna(1)
+    return history
+
+
+def measure(create: Callable[[Values], Any], values: Values) -> Tuple[float, float]:
+    """ return the retained bytes and the creation time per tag """
+    gc.collect()
+    tracemalloc.start()
+    history = create(values)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del history
+    gc.collect()
+    start = perf_counter()
+    history = create(values)
+    duration = perf_counter() - start
+    del history
+    return size / len(values), duration / len(values)
+
+
+def main() -> None:
+    """ run the benchmark """
+    tags = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    values = create_values(tags)
+    print(f"history with {tags} tags")
+    print("class            bytes per tag   ns per tag")
+    for name, create in (("UhfTag", create_dict_tags), ("CompactUhfTag", create_compact_tags),
+                         ("TagBatch", create_tag_batch)):
+        size, duration = measure(create, values)
+        print(f"{name:15} {size:14.0f} {duration * 1e9:12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,49 +14,122 @@ __version__ = "1.4.0-beta01"
 __maintainer__ = "Matthias Neumann"
 __email__ = "neumann@metratec.com"
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from .connection import Connection  # noqa: F401
 from .reader_exception import RfidReaderException  # noqa: F401
 from .reader_exception import RfidTransponderException  # noqa: F401
 
-from .uhf_reader_ascii import UhfReaderAscii  # noqa: F401
-try:
+# The reader classes, tags and utilities are imported with their first use (PEP 562), so a process
+# that needs a single reader does not import the other reader families, asyncio and pyserial
+# at startup. Attribute name to module lookup table:
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    # UHF ASCII reader (legacy)
+    "UhfReaderAscii": ".uhf_reader_ascii",
+    "DeskIdUhf": ".deskid_uhf",
+    "PulsarMX": ".pulsar_mx",
+    # HF ASCII reader (legacy)
+    "HfReaderAscii": ".hf_reader_ascii",
+    "DeskIdIso": ".deskid_iso",
+    "QuasarLR": ".quasar_lr",
+    "QuasarMX": ".quasar_mx",
+    # UHF AT reader
+    "UhfReaderAT": ".uhf_reader_at",
+    "PulsarLR": ".pulsar_lr",
+    "Plrm": ".plrm",
+    "DeskIdUhfv2": ".deskid_uhf",
+    "DeskIdUhfv2FCC": ".deskid_uhf",
+    "QRG2": ".qrg2",
+    "QRG2FCC": ".qrg2",
+    "DwarfG2v2": ".dwarfg2_v2",
+    "DwarfG2Miniv2": ".dwarfg2_v2",
+    "DwarfG2XRv2": ".dwarfg2_v2",
+    # NFC AT reader
+    "NfcReaderAT": ".nfc_reader_at",
+    "NfcMode": ".nfc_reader_at",
+    "NTagMirrorMode": ".nfc_reader_at",
+    "DeskIdNfc": ".deskid_nfc",
+    "QrNfc": ".qr_nfc",
+    # transponder
+    "HfTag": ".hf_tag",
+    "HfTagInfo": ".hf_tag",
+    "ISO15Tag": ".hf_tag",
+    "ISO14ATag": ".hf_tag",
+    "UhfTag": ".uhf_tag",
+    "TagBatch": ".tag_batch",
+    "CompactUhfTag": ".compact_tag",
+    "CompactHfTag": ".compact_tag",
+    "CompactISO15Tag": ".compact_tag",
+    "CompactISO14ATag": ".compact_tag",
+    "TagStore": ".tag_store",
+    # utilities
+    "InventoryStream": ".inventory_stream",
+    "CallbackDispatcher": ".callback_dispatcher",
+    "PresenceTracker": ".presence_tracker",
+    "ReaderProfileCache": ".reader_profile_cache",
+    "ReaderGroup": ".reader_group",
+    "ReaderTag": ".reader_group",
+    "ReaderFleet": ".reader_fleet",
+    "RecordingConnection": ".connection.recording_connection",
+    "ReplayConnection": ".connection.recording_connection",
+    "detect_readers": ".utils",
+    "discover_readers": ".utils",
+}
+
+__all__ = ["Connection", "RfidReaderException", "RfidTransponderException"] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ModuleNotFoundError as err:
+        if err.name != __name__ + module_name:
+            raise
+        # the module is not part of this installation
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from err
+    # later accesses do not call __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if TYPE_CHECKING:
+    from .uhf_reader_ascii import UhfReaderAscii  # noqa: F401
     from .deskid_uhf import DeskIdUhf  # noqa: F401
     from .pulsar_mx import PulsarMX  # noqa: F401
-except ModuleNotFoundError:
-    pass
-
-from .hf_reader_ascii import HfReaderAscii  # noqa: F401
-try:
+    from .hf_reader_ascii import HfReaderAscii  # noqa: F401
     from .deskid_iso import DeskIdIso  # noqa: F401
     from .quasar_lr import QuasarLR  # noqa: F401
     from .quasar_mx import QuasarMX  # noqa: F401
-except ModuleNotFoundError:
-    pass
-
-from .uhf_reader_at import UhfReaderAT  # noqa: F401
-try:
+    from .uhf_reader_at import UhfReaderAT  # noqa: F401
     from .pulsar_lr import PulsarLR  # noqa: F401
     from .plrm import Plrm  # noqa: F401
     from .deskid_uhf import DeskIdUhfv2, DeskIdUhfv2FCC  # noqa: F401
     from .qrg2 import QRG2, QRG2FCC  # noqa: F401
     from .dwarfg2_v2 import DwarfG2v2, DwarfG2Miniv2, DwarfG2XRv2  # noqa: F401
-except ModuleNotFoundError:
-    pass
-
-from .nfc_reader_at import NfcReaderAT, NfcMode, NTagMirrorMode  # noqa: F401
-try:
+    from .nfc_reader_at import NfcReaderAT, NfcMode, NTagMirrorMode  # noqa: F401
     from .deskid_nfc import DeskIdNfc  # noqa: F401
     from .qr_nfc import QrNfc  # noqa: F401
-except ModuleNotFoundError:
-    pass
-
-from .hf_tag import HfTag  # noqa: F401
-from .hf_tag import HfTagInfo  # noqa: F401
-from .hf_tag import ISO15Tag  # noqa: F401
-from .hf_tag import ISO14ATag  # noqa: F401
-from .uhf_tag import UhfTag  # noqa: F401
-
-from .utils import detect_readers  # noqa: F401
+    from .hf_tag import HfTag, HfTagInfo, ISO15Tag, ISO14ATag  # noqa: F401
+    from .uhf_tag import UhfTag  # noqa: F401
+    from .tag_batch import TagBatch  # noqa: F401
+    from .compact_tag import CompactUhfTag, CompactHfTag, CompactISO15Tag, CompactISO14ATag  # noqa: F401
+    from .tag_store import TagStore  # noqa: F401
+    from .inventory_stream import InventoryStream  # noqa: F401
+    from .callback_dispatcher import CallbackDispatcher  # noqa: F401
+    from .presence_tracker import PresenceTracker  # noqa: F401
+    from .reader_profile_cache import ReaderProfileCache  # noqa: F401
+    from .reader_group import ReaderGroup, ReaderTag  # noqa: F401
+    from .reader_fleet import ReaderFleet  # noqa: F401
+    from .connection.recording_connection import RecordingConnection, ReplayConnection  # noqa: F401
+    from .utils import detect_readers, discover_readers  # noqa: F401
 
 __version_info__ = (1, 3, 0)
 __version__ = ".".join(str(x) for x in __version_info__)
@@ -0,0 +1,168 @@
+"""Dispatching of the reader callbacks
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class CallbackDispatcher():
+    """Runs the reader callbacks, directly in the event loop or in other threads.
+
+    * ``inline`` - the callbacks are called directly in the event loop. A slow callback delays the
+      handling of the received data.
+    * ``thread_pool`` - the callbacks run in a thread pool. They can run concurrently and finish out
+      of order.
+    * ``worker`` - the callbacks run one after the other in a dedicated worker thread.
+
+    In the thread modes, at most `max_queue_size` callbacks wait for their execution, further
+    callbacks are dropped and counted. The callbacks must be thread-safe and must not use the reader
+    directly, use `asyncio.run_coroutine_threadsafe()` to call reader methods from a callback.
+    Exceptions raised by the callbacks are logged.
+    """
+    # disable 'too many instance attributes' warning - pylint: disable=R0902
+
+    MODE_INLINE = "inline"
+    MODE_THREAD_POOL = "thread_pool"
+    MODE_WORKER = "worker"
+
+    def __init__(self, mode: str = MODE_INLINE, max_workers: int = 4, max_queue_size: int = 1000,
+                 logger: Optional[logging.Logger] = None) -> None:
+        """Create a new callback dispatcher.
+
+        Args:
+            mode (str, optional): "inline", "thread_pool" or "worker". Defaults to "inline".
+
+            max_workers (int, optional): The number of threads of the thread pool. Defaults to 4.
+
+            max_queue_size (int, optional): The maximum number of waiting callbacks in the thread
+                modes. Defaults to 1000.
+
+            logger (logging.Logger, optional): The logger for callback errors. Defaults to None.
+
+        Raises:
+            ValueError: If a parameter is not valid.
+        """
+        if mode not in (self.MODE_INLINE, self.MODE_THREAD_POOL, self.MODE_WORKER):
+            raise ValueError(f"Unknown dispatch mode {mode}")
+        if max_workers < 1 or max_queue_size < 1:
+            raise ValueError("max_workers and max_queue_size must be positive")
+        self._mode: str = mode
+        self._max_workers: int = max_workers
+        self._max_queue_size: int = max_queue_size
+        self._logger: logging.Logger = logger if logger else logging.getLogger(self.__class__.__name__)
+        self._lock: threading.Lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._pending: int = 0
+        self._max_pending: int = 0
+        self._dispatched: int = 0
+        self._dropped: int = 0
+        self._errors: int = 0
+        self._latency_sum: float = 0.0
+        self._latency_max: float = 0.0
+
+    def get_mode(self) -> str:
+        """Return the dispatch mode.
+
+        Returns:
+            str: "inline", "thread_pool" or "worker"
+        """
+        return self._mode
+
+    def dispatch(self, callback: Callable, *args: Any) -> None:
+        """Run the callback with the given arguments according to the dispatch mode.
+
+        Args:
+            callback (Callable): The callback.
+            *args (Any): The callback arguments.
+        """
+        if self._mode == self.MODE_INLINE:
+            self._dispatched += 1
+            callback(*args)
+            return
+        with self._lock:
+            if self._pending >= self._max_queue_size:
+                self._dropped += 1
+                return
+            self._pending += 1
+            self._max_pending = max(self._max_pending, self._pending)
+        if self._mode == self.MODE_WORKER:
+            if self._queue is None:
+                self._queue = queue.SimpleQueue()
+                threading.Thread(target=self._work, args=(self._queue,), name="callback-worker",
+                                 daemon=True).start()
+            self._queue.put((perf_counter(), callback, args))
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="callback")
+            self._executor.submit(self._run, perf_counter(), callback, args)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return the dispatch metrics.
+
+        Returns:
+            Dict[str, Any]: Dictionary with the keys:
+
+            * 'mode' - the dispatch mode
+            * 'queue_depth' - the number of callbacks waiting or running
+            * 'max_queue_depth' - the maximum queue depth
+            * 'dispatched' - the number of callbacks that were started
+            * 'dropped' - the number of callbacks dropped because the queue was full
+            * 'errors' - the number of callbacks that raised an exception
+            * 'latency_avg', 'latency_max' - the time in seconds between the event and the start of
+              its callback
+        """
+        with self._lock:
+            return {'mode': self._mode, 'queue_depth': self._pending, 'max_queue_depth': self._max_pending,
+                    'dispatched': self._dispatched, 'dropped': self._dropped, 'errors': self._errors,
+                    'latency_avg': self._latency_sum / self._dispatched if self._dispatched else 0.0,
+                    'latency_max': self._latency_max}
+
+    def reset_metrics(self) -> None:
+        """Reset the counters of the dispatch metrics.
+        """
+        with self._lock:
+            self._max_pending = self._pending
+            self._dispatched = 0
+            self._dropped = 0
+            self._errors = 0
+            self._latency_sum = 0.0
+            self._latency_max = 0.0
+
+    def close(self) -> None:
+        """Stop the threads after the waiting callbacks have finished. Does not wait for them. The
+        threads are started again with the next callback.
+        """
+        if self._queue is not None:
+            self._queue.put(None)
+            self._queue = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _work(self, work_queue: queue.SimpleQueue) -> None:
+        while True:
+            item: Optional[Tuple[float, Callable, Tuple]] = work_queue.get()
+            if item is None:
+                return
+            self._run(*item)
+
+    def _run(self, queued: float, callback: Callable, args: Tuple) -> None:
+        # disable Catching too general exception Exception - pylint: disable=W0703
+        latency: float = perf_counter() - queued
+        with self._lock:
+            self._dispatched += 1
+            self._latency_sum += latency
+            self._latency_max = max(self._latency_max, latency)
+        try:
+            callback(*args)
+        except Exception as err:
+            with self._lock:
+                self._errors += 1
+            self._logger.warning("Error in callback %s - %s", callback, err, exc_info=True)
+        finally:
+            with self._lock:
+                self._pending -= 1
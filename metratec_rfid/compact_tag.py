@@ -0,0 +1,558 @@
+"""
+Compact transponder classes
+
+Alternatives to the dict based transponder classes that store the values in slots. They provide
+the same getter API but use less memory and are faster to create, which helps if many
+transponders are kept, e.g. in an inventory history.
+"""
+from abc import abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from .hf_tag import HfTag, ISO14ATag, ISO15Tag
+from .uhf_tag import UhfTag
+
+
+class CompactTag():
+    """Compact transponder class
+
+    The values are stored in slots and can only be read with the getter methods. Unlike the dict
+    based `Tag` the object has no item access and no `dict` methods besides `get()`. Use
+    `to_dict()` to get the values as a dictionary, e.g. for a JSON export.
+
+    The readers freeze the transponders before they are passed to the user code, e.g. to the
+    inventory callback, a stream or as result of a request. The set methods of a frozen object
+    raise an `AttributeError`, as the same object can be passed to several consumers. The merges of
+    the `TagStore` and the `InventoryWindow` use the internal setters. A transponder created by the
+    user code is not frozen until `freeze()` is called. The objects are compared by their values
+    and not hashable, like the dict based `Tag` - use `get_id()` as key instead.
+    """
+    # disable 'Too many public methods' warning - pylint: disable=R0904
+    # disable 'Too many instance attributes' warning - pylint: disable=R0902
+    __slots__ = ('_tid', '_first_seen', '_last_seen', '_antenna', '_seen_count', '_data',
+                 '_error_message', '_values', '_frozen')
+
+    # The dictionary keys of the slot values in the order of `to_dict()`
+    _KEYS: Tuple[str, ...] = ('tid', 'first_seen', 'last_seen', 'antenna', 'seen_count', 'data', 'error_message')
+
+    def __init__(self, tid: Optional[str], timestamp: Optional[float] = None) -> None:
+        self._tid: Optional[str] = tid if tid else None
+        self._first_seen: Optional[float] = timestamp if timestamp else None
+        self._last_seen: Optional[float] = self._first_seen
+        self._antenna: Optional[int] = None
+        self._seen_count: Optional[int] = None
+        self._data: Optional[str] = None
+        self._error_message: Optional[str] = None
+        # additional values set with `set_value()`
+        self._values: Optional[Dict[str, Any]] = None
+        # True if the set methods are disabled, see `freeze()`
+        self._frozen: bool = False
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactTag):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    # compared by value, the user code can change the values until the object is frozen
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+    def freeze(self) -> None:
+        """Disable the set methods of this transponder. The copies of a frozen transponder are
+        also frozen.
+        """
+        self._frozen = True
+
+    def is_frozen(self) -> bool:
+        """Return whether the set methods of this transponder are disabled.
+
+        Returns:
+            bool: True if the transponder is frozen.
+        """
+        return self._frozen
+
+    def _check_frozen(self) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} {self.get_id()} is frozen")
+
+    @abstractmethod
+    def get_id(self) -> str:
+        """ return the tag identifier"""
+
+    def get_tid(self) -> str:
+        """Return the tag ID (TID) of this transponder.
+
+        Returns:
+            str: The TID of the tag.
+        """
+        return self._tid if self._tid is not None else ''
+
+    def set_tid(self, tid: str) -> None:
+        """Set the tag ID (TID) value of this transponder.
+
+        Args:
+            tid (str): The TID value to set.
+        """
+        self._check_frozen()
+        self._tid = tid
+
+    def get_timestamp(self) -> float:
+        """Return the timestamp value of this tag.
+
+        DEPRECATED
+
+        Returns:
+            float: Unix timestamp in seconds.
+        """
+        return self.get_last_seen()
+
+    def set_timestamp(self, timestamp: float) -> None:
+        """Set the timestamp value of this tag.
+
+        DEPRECATED
+
+        Args:
+            timestamp (float): The (unix) timestamp value to set.
+        """
+        self.set_last_seen(timestamp)
+
+    def get_first_seen(self) -> float:
+        """Return the first seen timestamp of this tag.
+
+        Returns:
+            float: Unix timestamp in seconds.
+        """
+        return self._first_seen if self._first_seen is not None else 0
+
+    def set_first_seen(self, timestamp: float) -> None:
+        """Set the first seen timestamp value of this tag.
+
+        Args:
+            timestamp (float): The (unix) timestamp to set.
+        """
+        self._check_frozen()
+        self._first_seen = timestamp
+
+    def _set_first_seen(self, timestamp: float) -> None:
+        # internal setter without the frozen check
+        self._first_seen = timestamp
+
+    def get_last_seen(self) -> float:
+        """Return the last seen timestamp of this tag.
+
+        Returns:
+            float: Unix timestamp in seconds.
+        """
+        return self._last_seen if self._last_seen is not None else 0
+
+    def set_last_seen(self, timestamp: float) -> None:
+        """Set the last seen timestamp value of this tag.
+
+        Args:
+            timestamp (float): The (unix) timestamp to set.
+        """
+        self._check_frozen()
+        self._last_seen = timestamp
+
+    def _set_last_seen(self, timestamp: float) -> None:
+        # internal setter without the frozen check
+        self._last_seen = timestamp
+
+    def get_data(self) -> str:
+        """Return the user data of this tag.
+
+        Returns:
+            str: The user data.
+        """
+        return self._data if self._data is not None else ''
+
+    def set_data(self, data: str) -> None:
+        """Set the data value of this tag.
+
+        Args:
+            data (str): The data value to set.
+        """
+        self._check_frozen()
+        self._data = data
+
+    def get_antenna(self) -> int:
+        """Return the antenna that inventoried this tag.
+
+        Returns:
+            int: The antenna index or -1 if not available.
+        """
+        return self._antenna if self._antenna is not None else -1
+
+    def set_antenna(self, antenna: int) -> None:
+        """Set the antenna value of this tag.
+
+        Args:
+            antenna (int): The antenna value to set.
+        """
+        self._check_frozen()
+        self._antenna = antenna
+
+    def _set_antenna(self, antenna: int) -> None:
+        # internal setter without the frozen check
+        self._antenna = antenna
+
+    def get_seen_count(self) -> int:
+        """Return the seen count of this tag.
+
+        Returns:
+            int: The number of times this tag was found.
+        """
+        return self._seen_count if self._seen_count else 0
+
+    def set_seen_count(self, seen_count: int) -> None:
+        """Set the seen count value of this tag.
+
+        Args:
+            seen_count (int): The seen count value to set.
+        """
+        self._check_frozen()
+        self._seen_count = seen_count
+
+    def _set_seen_count(self, seen_count: int) -> None:
+        # internal setter without the frozen check
+        self._seen_count = seen_count
+
+    def has_error(self) -> bool:
+        """Return whether this tag encountered an error.
+
+        Returns:
+            bool: True if the tag has an error message.
+        """
+        return bool(self._error_message)
+
+    def get_error_message(self) -> str:
+        """Return the error message of this tag.
+
+        Returns:
+            str: The error message.
+        """
+        return self._error_message if self._error_message is not None else ''
+
+    def set_error_message(self, message: str) -> None:
+        """Set the error message value of this tag.
+
+        Args:
+            message (str): The error message to set.
+        """
+        self._check_frozen()
+        self._error_message = message
+
+    def _set_error_message(self, message: str) -> None:
+        # internal setter without the frozen check
+        self._error_message = message
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a value by its dictionary key, like `dict.get()` of the `Tag` class.
+
+        Args:
+            key (str): The dictionary key.
+            default (Any, optional): The value returned if the value is not set. Defaults to None.
+
+        Returns:
+            Any: The value or the default value.
+        """
+        if key in self._KEYS:
+            value = getattr(self, '_' + key)
+            return value if value is not None else default
+        if key == 'has_error':
+            return self.has_error() if self._error_message is not None else default
+        return self._values.get(key, default) if self._values else default
+
+    def set_value(self, key: str, value: Any) -> None:
+        """Set a value by its dictionary key.
+
+        Args:
+            key (str): The dictionary key.
+            value (Any): The value to set or None to delete the value.
+        """
+        self._check_frozen()
+        self._set_value(key, value)
+
+    def _set_value(self, key: str, value: Any) -> None:
+        # internal setter without the frozen check
+        if key in self._KEYS:
+            setattr(self, '_' + key, value)
+        elif value is not None:
+            if self._values is None:
+                self._values = {}
+            self._values[key] = value
+        elif self._values and key in self._values:
+            del self._values[key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the values of this tag as dictionary.
+
+        The dictionary has the same items as the corresponding dict based transponder class.
+
+        Returns:
+            Dict[str, Any]: The tag values.
+        """
+        values: Dict[str, Any] = {}
+        for key in self._KEYS:
+            value = getattr(self, '_' + key)
+            if value is not None:
+                values[key] = value
+        if self._error_message is not None:
+            values['has_error'] = bool(self._error_message)
+        if self._values:
+            values.update(self._values)
+        return values
+
+
+class CompactUhfTag(CompactTag):
+    """Compact UHF transponder class
+    """
+    # disable 'Too many public methods' warning - pylint: disable=R0904
+    # disable 'Too many instance attributes' warning - pylint: disable=R0902
+    __slots__ = ('_inventory_epc', '_epc', '_rssi', '_phase')
+
+    _KEYS: Tuple[str, ...] = ('tid', 'first_seen', 'last_seen', 'inventory_epc', 'epc', 'rssi', 'antenna',
+                              'seen_count', 'phase', 'data', 'error_message')
+
+    def __init__(
+            self, epc: str, timestamp: Optional[float] = None,
+            tid: Optional[str] = None, antenna: Optional[int] = None,
+            seen_count: int = 1, rssi: Optional[int] = None) -> None:
+
+        # disable 'Too many (positional) arguments' warning - pylint: disable=R0913,R0917
+
+        super().__init__(tid, timestamp)
+        self._inventory_epc: Optional[str] = epc
+        self._epc: Optional[str] = epc
+        self._rssi: Optional[int] = rssi if rssi else None
+        self._phase: Optional[List[int]] = None
+        if antenna:
+            self._antenna = antenna
+        if seen_count:
+            self._seen_count = seen_count
+
+    def get_id(self) -> str:
+        """Return the identifier of this tag.
+
+        Returns:
+            str: The EPC value or "unknown" if not available.
+        """
+        return self._epc if self._epc else "unknown"
+
+    def get_inventory_epc(self) -> Optional[str]:
+        """Return the EPC value of this tag,
+        reported by the inventory.
+
+        Returns:
+            str: The EPC value.
+        """
+        return self._inventory_epc
+
+    def set_inventory_epc(self, epc: str) -> None:
+        """Set the EPC value of this tag,
+        reported by the inventory.
+
+        Args:
+            epc (str): The EPC value to set.
+        """
+        self._check_frozen()
+        self._inventory_epc = epc
+
+    def get_epc(self) -> Optional[str]:
+        """Return the EPC value of this tag.
+
+        Returns:
+            str: The EPC value.
+        """
+        return self._epc
+
+    def set_epc(self, epc: str) -> None:
+        """Set the EPC value of this tag.
+
+        Args:
+            epc (str): The EPC value to set.
+        """
+        self._check_frozen()
+        self._epc = epc
+
+    def _set_epc(self, epc: str) -> None:
+        # internal setter without the frozen check
+        self._epc = epc
+
+    def get_rssi(self) -> int:
+        """Return the RSSI value of the transaction.
+
+        Returns:
+            int: The RSSI value in dBm or 0 if not available.
+        """
+        return self._rssi if self._rssi is not None else 0
+
+    def set_rssi(self, rssi: int) -> None:
+        """Set the RSSI value of this tag.
+
+        Args:
+            rssi (int): The RSSI value to set.
+        """
+        self._check_frozen()
+        self._rssi = rssi
+
+    def _set_rssi(self, rssi: int) -> None:
+        # internal setter without the frozen check
+        self._rssi = rssi
+
+    def get_phase(self) -> List[int]:
+        """Return the phase measurement of the singulation.
+
+        Returns:
+            List[int]: The phase values or [] if not available.
+        """
+        return self._phase if self._phase is not None else []
+
+    def set_phase(self, phase: List[int]) -> None:
+        """Set the phase value of this tag.
+
+        Args:
+            phase (List[int]): The phase value to set.
+        """
+        self._check_frozen()
+        self._phase = phase
+
+
+class CompactHfTag(CompactTag):
+    """Compact HF transponder class
+    """
+    # disable 'Too many public methods' warning - pylint: disable=R0904
+    # disable 'Too many instance attributes' warning - pylint: disable=R0902
+    __slots__ = ('_type',)
+
+    _KEYS: Tuple[str, ...] = ('tid', 'first_seen', 'last_seen', 'antenna', 'seen_count', 'type', 'data',
+                              'error_message')
+
+    def __init__(
+            self, tid: str, timestamp: Optional[float] = None,
+            antenna: Optional[int] = None, seen_count: int = 1) -> None:
+        super().__init__(tid, timestamp)
+        self._type: Optional[str] = None
+        if antenna:
+            self._antenna = antenna
+        self._seen_count = seen_count
+
+    def get_id(self) -> str:
+        """Return the identifier of this tag.
+
+        Returns:
+            str: The TID value or "unknown" if not available.
+        """
+        return self._tid if self._tid else "unknown"
+
+    def set_type(self, tag_type: str):
+        """Sets the transponder type
+
+        Args:
+            type (str): the transponder type
+        """
+        self._check_frozen()
+        self._type = tag_type
+
+    def get_type(self) -> str:
+        """The transponder type if set
+
+        Returns:
+            str: the transponder type
+        """
+        return self._type if self._type is not None else ''
+
+
+class CompactISO15Tag(CompactHfTag):
+    """Compact ISO15 transponder class
+    """
+    __slots__ = ('_dsfid',)
+
+    _KEYS: Tuple[str, ...] = CompactHfTag._KEYS + ('dsfid',)
+
+    def __init__(self, tid: str, timestamp: Optional[float] = None, antenna: Optional[int] = None,
+                 seen_count: int = 1, dsfid: Optional[str] = None) -> None:
+        # disable 'Too many (positional) arguments' warning - pylint: disable=R0913,R0917
+        super().__init__(tid, timestamp, antenna, seen_count)
+        self._type = "ISO15"
+        self._dsfid: Optional[str] = dsfid if dsfid else None
+
+    def get_dsfid(self) -> str:
+        """Return the DSFID byte of this transponder.
+
+        Returns:
+            str: The DSFID byte as hex number.
+        """
+        return self._dsfid if self._dsfid is not None else ''
+
+    def set_dsfid(self, dsfid: str) -> None:
+        """Set the DSFID byte value of this transponder.
+
+        Args:
+            dsfid (str): The DSFID byte as hex number.
+        """
+        self._check_frozen()
+        self._dsfid = dsfid
+
+
+class CompactISO14ATag(CompactHfTag):
+    """Compact ISO14A transponder class
+    """
+    __slots__ = ('_sak', '_atqa')
+
+    _KEYS: Tuple[str, ...] = CompactHfTag._KEYS + ('sak', 'atqa')
+
+    def __init__(self, tid: str, timestamp: Optional[float] = None, antenna: Optional[int] = None,
+                 seen_count: int = 1, sak: Optional[str] = None, atqa: Optional[str] = None,
+                 tag_type: Optional[str] = None) -> None:
+        # disable 'Too many (positional) arguments' warning - pylint: disable=R0913,R0917
+        super().__init__(tid, timestamp, antenna, seen_count)
+        self._type = tag_type if tag_type else "ISO14A"
+        self._sak: Optional[str] = sak if sak else None
+        self._atqa: Optional[str] = atqa if atqa else None
+
+    def get_sak(self) -> str:
+        """Return the SAK byte of this transponder.
+
+        Returns:
+            str: The SAK byte as hex number.
+        """
+        return self._sak if self._sak is not None else ''
+
+    def set_sak(self, sak: str) -> None:
+        """Set the SAK byte value of this transponder.
+
+        Args:
+            sak (str): The SAK byte value as hex number.
+        """
+        self._check_frozen()
+        self._sak = sak
+
+    def get_atqa(self) -> str:
+        """Return the ATQA bytes of this transponder.
+
+        Returns:
+            str: The ATQA bytes as hex number.
+        """
+        return self._atqa if self._atqa is not None else ''
+
+    def set_atqa(self, atqa: str) -> None:
+        """Set the ATQA bytes value of this transponder.
+
+        Args:
+            atqa (str): The ATQA bytes value as hex number.
+        """
+        self._check_frozen()
+        self._atqa = atqa
+
+
+# The compact class of each dict based transponder class
+COMPACT_TAG_CLASSES: Dict[type, type] = {
+    UhfTag: CompactUhfTag,
+    HfTag: CompactHfTag,
+    ISO15Tag: CompactISO15Tag,
+    ISO14ATag: CompactISO14ATag,
+}
@@ -1,17 +1,24 @@
 """ connection base class """
 
 from abc import abstractmethod
-from typing import Callable, Optional
+from time import time
+from typing import Callable, List, Optional
 
 
 class Connection():
     """Default connection
     """
+    # disable 'Too many instance attributes' warning - pylint: disable=R0902
 
     def __init__(self) -> None:
         self._cb_connection_made: Optional[Callable[[], None]] = None
         self._cb_connection_lost: Optional[Callable[[str], None]] = None
         self._cb_data_received: Optional[Callable[[bytes], None]] = None
+        self._cb_data_received_batch: Optional[Callable[[List[bytes], float], None]] = None
+        self._cb_raw_data_received: Optional[Callable[[bytes], None]] = None
+        self._receive_buffer: bytearray = bytearray()
+        self._separator_encoded: bytes = "\n".encode()
+        self._reading_paused: bool = False
 
     def set_cb_connection_made(self, callback: Optional[Callable]) -> Optional[Callable]:
         """
@@ -48,6 +55,51 @@ class Connection():
         self._cb_data_received = callback
         return old
 
+    def set_cb_data_received_batch(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """
+        Set the callback for all messages received with one read. If set, it is called instead of
+        the data received callback. The callback has the following arguments:
+        * messages (List[bytes]) - the received messages, without separator
+        * timestamp (float) - the arrival time of the messages
+
+        Returns:
+            Optional[Callable]: the old callback
+        """
+        old = self._cb_data_received_batch
+        self._cb_data_received_batch = callback
+        return old
+
+    def set_cb_raw_data_received(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """
+        Set the callback for the received raw data, e.g. to record the connection. It is called with
+        each received chunk before it is split into messages. The callback has the following arguments:
+        * data (bytes) - the received data
+
+        Returns:
+            Optional[Callable]: the old callback
+        """
+        old = self._cb_raw_data_received
+        self._cb_raw_data_received = callback
+        return old
+
+    def pause_reading(self) -> None:
+        """
+        Stop reading received data until `resume_reading()` is called. The data stays in the buffers
+        of the operating system, if they are full the flow control of the connection slows down the
+        sender. Connections that do not support this, e.g. UDP, continue reading.
+        """
+        self._reading_paused = True
+
+    def resume_reading(self) -> None:
+        """
+        Resume reading received data after `pause_reading()`
+        """
+        self._reading_paused = False
+
+    def is_reading_paused(self) -> bool:
+        """ return True if reading is paused with `pause_reading()` """
+        return self._reading_paused
+
     @abstractmethod
     def get_info(self) -> str:
         """Return the input information
@@ -78,3 +130,38 @@ class Connection():
         Args:
             data (bytes): data to send
         """
+
+    def _parse_input_data(self, recv_data: bytes) -> List[bytes]:
+        """
+        Adds the new data to the message buffer and checking for separators.
+
+        Return a list with separated messages, without separator
+        """
+        if self._cb_raw_data_received:
+            self._cb_raw_data_received(recv_data)
+        buffer: bytearray = self._receive_buffer
+        separator: bytes = self._separator_encoded
+        # the buffered rest contains no separator, so only the new data has to be searched
+        search_start: int = max(len(buffer) - len(separator) + 1, 0)
+        buffer += recv_data
+        index: int = buffer.rfind(separator, search_start)
+        if index < 0:
+            return []
+        end: int = index + len(separator)
+        with memoryview(buffer) as view:
+            block: bytes = bytes(view[:end])
+        # compact the buffer once per received chunk, the incomplete rest stays buffered
+        del buffer[:end]
+        messages: List[bytes] = block.split(separator)
+        messages.pop()
+        return messages
+
+    def _messages_received(self, messages: List[bytes]) -> None:
+        """
+        Hands the messages of one read to the data received callbacks
+        """
+        if self._cb_data_received_batch:
+            self._cb_data_received_batch(messages, time())
+        elif self._cb_data_received:
+            for message in messages:
+                self._cb_data_received(message)
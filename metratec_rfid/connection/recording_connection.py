@@ -0,0 +1,313 @@
+"""
+recording and replay of a connection
+"""
+
+import asyncio
+import struct
+from time import perf_counter_ns
+from typing import BinaryIO, List, Optional, Tuple
+from .connection import Connection
+
+# file header: magic and format version
+RECORDING_HEADER: bytes = b"MTRREC\x01"
+# record header: kind, nanoseconds since the start of the recording, data length
+RECORD_HEADER: struct.Struct = struct.Struct("<BQI")
+
+RECORD_RECEIVED: int = 0
+RECORD_SENT: int = 1
+RECORD_CONNECTION_MADE: int = 2
+RECORD_CONNECTION_LOST: int = 3
+
+
+def read_recording(path: str) -> List[Tuple[int, float, bytes]]:
+    """Read the records of a recording file
+
+    A truncated last record, e.g. of an interrupted recording, is ignored.
+
+    Args:
+        path (str): The recording file
+
+    Raises:
+        ValueError: If the file is not a recording
+
+    Returns:
+        List[Tuple[int, float, bytes]]: The kind, the time in seconds since the start of the recording
+        and the data of each record
+    """
+    with open(path, "rb") as file:
+        content: bytes = file.read()
+    if not content.startswith(RECORDING_HEADER):
+        raise ValueError(f"{path} is not a connection recording")
+    records: List[Tuple[int, float, bytes]] = []
+    offset: int = len(RECORDING_HEADER)
+    while offset + RECORD_HEADER.size <= len(content):
+        kind, timestamp, length = RECORD_HEADER.unpack_from(content, offset)
+        offset += RECORD_HEADER.size
+        if offset + length > len(content):
+            break
+        records.append((kind, timestamp / 1e9, content[offset:offset + length]))
+        offset += length
+    return records
+
+
+class RecordingConnection(Connection):
+    """
+    Records the data of another connection - wraps a serial or socket connection and writes all
+    sent and received data chunks and the connection events with their time to a file.
+
+    The file is written record by record while the connection is used, each record has a 13 byte
+    header. Use a `ReplayConnection` to replay the recording with any reader class::
+
+        reader = PulsarLR("reader", "192.168.2.101")
+        reader.set_connection(RecordingConnection(reader.get_connection(), "session.rec"))
+
+    The serial port of a wrapped serial connection must be set, it is not searched automatically.
+    """
+
+    def __init__(self, connection: Connection, path: str) -> None:
+        """Create a new recording connection
+
+        Args:
+            connection (Connection): The recorded connection
+
+            path (str): The recording file, an existing file is overwritten
+        """
+        super().__init__()
+        self._connection: Connection = connection
+        self._path: str = path
+        self._file: Optional[BinaryIO] = open(path, "wb")  # pylint: disable=R1732
+        self._file.write(RECORDING_HEADER)
+        self._start: int = perf_counter_ns()
+        connection.set_cb_connection_made(self._on_connection_made)
+        connection.set_cb_connection_lost(self._on_connection_lost)
+        connection.set_cb_data_received(self._on_data_received)
+        connection.set_cb_data_received_batch(self._on_data_received_batch)
+        connection.set_cb_raw_data_received(lambda data: self._record(RECORD_RECEIVED, data))
+
+    def get_connection(self) -> Connection:
+        """ return the recorded connection """
+        return self._connection
+
+    def get_path(self) -> str:
+        """ return the recording file """
+        return self._path
+
+    def get_info(self) -> str:
+        return self._connection.get_info()
+
+    def set_separator(self, separator: str) -> None:
+        self._connection.set_separator(separator)
+
+    def connect(self) -> None:
+        self._connection.connect()
+
+    def disconnect(self) -> None:
+        self._connection.disconnect()
+        if self._file:
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Disconnect and close the recording file
+        """
+        self.disconnect()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def is_connected(self) -> bool:
+        return self._connection.is_connected()
+
+    def send(self, data: bytes) -> None:
+        self._record(RECORD_SENT, data)
+        self._connection.send(data)
+
+    # @override
+    def pause_reading(self) -> None:
+        super().pause_reading()
+        self._connection.pause_reading()
+
+    # @override
+    def resume_reading(self) -> None:
+        super().resume_reading()
+        self._connection.resume_reading()
+
+    def _record(self, kind: int, data: bytes) -> None:
+        if self._file:
+            self._file.write(RECORD_HEADER.pack(kind, perf_counter_ns() - self._start, len(data)))
+            self._file.write(data)
+
+    def _on_connection_made(self) -> None:
+        self._record(RECORD_CONNECTION_MADE, b"")
+        if self._cb_connection_made:
+            self._cb_connection_made()
+
+    def _on_connection_lost(self, reason) -> None:
+        self._record(RECORD_CONNECTION_LOST, str(reason).encode())
+        if self._file:
+            self._file.flush()
+        if self._cb_connection_lost:
+            self._cb_connection_lost(reason)
+
+    def _on_data_received(self, message: bytes) -> None:
+        if self._cb_data_received:
+            self._cb_data_received(message)
+
+    def _on_data_received_batch(self, messages: List[bytes], timestamp: float) -> None:
+        if self._cb_data_received_batch:
+            self._cb_data_received_batch(messages, timestamp)
+        elif self._cb_data_received:
+            for message in messages:
+                self._cb_data_received(message)
+
+
+class ReplayConnection(Connection):
+    """
+    Replays a recording of a `RecordingConnection` - provides the recorded data to a reader without
+    hardware, e.g. to reproduce a problem or to benchmark the parsers with real reader traffic.
+
+    The received data and the connection events are replayed in the recorded order and with the
+    recorded time gaps, divided by the speed. Speed 0 replays without gaps, as fast as the reader
+    processes the data. Data that was received after the n-th sent chunk is only replayed after the
+    reader sent n chunks, so the reader must send the same commands as during the recording - the
+    sent data itself is not compared::
+
+        reader = PulsarLR("reader", "")
+        reader.set_connection(ReplayConnection("session.rec", speed=0))
+    """
+    # disable too many instance attributes warning - pylint: disable=R0902
+
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        """Create a new replay connection
+
+        Args:
+            path (str): The recording file
+
+            speed (float, optional): The replay speed, 1.0 for the recorded speed, 0 for the
+                maximum speed. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the speed is negative or the file is not a recording
+        """
+        super().__init__()
+        if speed < 0:
+            raise ValueError(f"Speed must not be negative - {speed}")
+        self._path: str = path
+        self._speed: float = speed
+        # kind, time, data, sent chunks before the record, time of the last sent chunk before the record
+        self._records: List[Tuple[int, float, bytes, int, float]] = []
+        sent: int = 0
+        sent_time: float = 0.0
+        for kind, timestamp, data in read_recording(path):
+            if kind == RECORD_SENT:
+                sent += 1
+                sent_time = timestamp
+            else:
+                self._records.append((kind, timestamp, data, sent, sent_time))
+        self._sent: int = 0
+        self._sent_event: asyncio.Event = asyncio.Event()
+        self._resumed: asyncio.Event = asyncio.Event()
+        self._resumed.set()
+        self._finished: asyncio.Event = asyncio.Event()
+        # set while the replay waits for data of the reader or is finished
+        self._idle: asyncio.Event = asyncio.Event()
+        self._is_connected: bool = False
+        self._task: Optional[asyncio.Task] = None
+        self._position: int = 0
+
+    def get_info(self) -> str:
+        return f"replay:{self._path}"
+
+    def set_separator(self, separator: str) -> None:
+        self._separator_encoded = separator.encode()
+
+    def connect(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.ensure_future(self._replay())
+
+    def disconnect(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._is_connected = False
+
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    def send(self, data: bytes) -> None:
+        self._sent += 1
+        self._sent_event.set()
+        if not self._finished.is_set():
+            self._idle.clear()
+
+    # @override
+    def pause_reading(self) -> None:
+        super().pause_reading()
+        self._resumed.clear()
+
+    # @override
+    def resume_reading(self) -> None:
+        super().resume_reading()
+        self._resumed.set()
+
+    def is_finished(self) -> bool:
+        """ return True if all records are replayed """
+        return self._finished.is_set()
+
+    async def wait_finished(self) -> None:
+        """
+        Wait until all records are replayed
+        """
+        await self._finished.wait()
+
+    async def wait_idle(self) -> None:
+        """
+        Wait until the replay waits for the next command of the reader or all records are replayed,
+        e.g. until the recorded inventories are replayed before the inventory is stopped::
+
+            await reader.start_inventory()
+            await connection.wait_idle()
+            await reader.stop_inventory()
+        """
+        await self._idle.wait()
+
+    async def _replay(self) -> None:
+        loop = asyncio.get_running_loop()
+        # replay time and the corresponding recording time
+        reference: Tuple[float, float] = (loop.time(), self._records[0][1] if self._records else 0.0)
+        while self._position < len(self._records):
+            kind, timestamp, data, sent, sent_time = self._records[self._position]
+            if self._sent < sent:
+                # wait for the command of the reader, the gaps are measured from its sending
+                while self._sent < sent:
+                    self._sent_event.clear()
+                    self._idle.set()
+                    await self._sent_event.wait()
+                self._idle.clear()
+                reference = (loop.time(), sent_time)
+            if self._speed:
+                delay: float = reference[0] + (timestamp - reference[1]) / self._speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            # let the reader process the previous data
+            await asyncio.sleep(0)
+            await self._resumed.wait()
+            self._position += 1
+            self._replay_record(kind, data)
+        self._finished.set()
+        self._idle.set()
+
+    def _replay_record(self, kind: int, data: bytes) -> None:
+        if kind == RECORD_RECEIVED:
+            messages: List[bytes] = self._parse_input_data(data)
+            if messages:
+                self._messages_received(messages)
+        elif kind == RECORD_CONNECTION_MADE:
+            self._is_connected = True
+            self._receive_buffer.clear()
+            if self._cb_connection_made:
+                self._cb_connection_made()
+        elif kind == RECORD_CONNECTION_LOST:
+            self._is_connected = False
+            if self._cb_connection_lost:
+                self._cb_connection_lost(data.decode(errors="replace"))
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 from time import time
 import serial
 import serial_asyncio
@@ -14,9 +14,13 @@ class SerialConnection(Connection):
     """
     # disable 'too many instance attributes' warning - pylint: disable=R0902
 
+    BACKEND_STREAM = "stream"
+    BACKEND_PROTOCOL = "protocol"
+
     def __init__(
             self, port: str, baud_rate: int = 115200, parity=serial.PARITY_NONE,
-            stop_bits: int = serial.STOPBITS_ONE, byte_size: int = serial.EIGHTBITS) -> None:
+            stop_bits: int = serial.STOPBITS_ONE, byte_size: int = serial.EIGHTBITS,
+            backend: str = BACKEND_STREAM) -> None:
         """Create a new serial connection
 
         Args:
@@ -29,6 +33,9 @@ class SerialConnection(Connection):
             stop_bits (int, optional): The stop bits to use. Defaults to serial.STOPBITS_ONE.
 
             byte_size (int, optional): The byte size to use. Defaults to serial.EIGHTBITS.
+
+            backend (str, optional): The receive implementation, see `set_backend()`.
+                Defaults to SerialConnection.BACKEND_STREAM.
         """
         # disable 'Too many (positional) arguments' warning - pylint: disable=R0913,R0917
         super().__init__()
@@ -42,9 +49,12 @@ class SerialConnection(Connection):
         self._max_reconnect_wait_time: float = 3600.0
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
-        self._separator_encoded: bytes = "\n".encode()
+        self._transport: Optional[asyncio.Transport] = None
+        self._transport_closed: Optional[asyncio.Future] = None
         self._is_started: bool = False
         self._internal_task: Optional[asyncio.Task] = None
+        self._backend: str = self.BACKEND_STREAM
+        self.set_backend(backend)
 
     def get_port(self) -> str:
         """Return the port of the connection."""
@@ -58,11 +68,34 @@ class SerialConnection(Connection):
         if not self.is_connected():
             self._port = port
 
+    def get_backend(self) -> str:
+        """Return the receive implementation of the connection."""
+        return self._backend
+
+    def set_backend(self, backend: str) -> None:
+        """Set the receive implementation of the connection.
+
+        * SerialConnection.BACKEND_STREAM - a stream reader task reads the incoming data
+        * SerialConnection.BACKEND_PROTOCOL - the serial transport hands the received chunks directly
+          to an asyncio protocol, which splits them. Recommended for high data rates.
+
+        New setting is applied with the next connect.
+
+        Args:
+            backend (str): the backend to use
+
+        Raises:
+            ValueError: if the backend is unknown
+        """
+        if backend not in (self.BACKEND_STREAM, self.BACKEND_PROTOCOL):
+            raise ValueError(f"Unknown serial backend {backend}")
+        self._backend = backend
+
     def get_info(self) -> str:
         return f"{self._port} ({self._baud_rate})"
 
     def set_separator(self, separator: str) -> None:
-        if self._internal_task:
+        if self._internal_task and not self._transport:
             self._internal_task.cancel()
             self._internal_task = asyncio.ensure_future(self._work())
         self._separator_encoded = separator.encode()
@@ -80,7 +113,7 @@ class SerialConnection(Connection):
         """
         # print("connection lost " + str(err))
         if err is None:
-            message: str = "connection lost" if self._writer else "disconnected"
+            message: str = "connection lost" if self.is_connected() else "disconnected"
         else:
             message = str(err)
         if self._cb_connection_lost:
@@ -88,6 +121,7 @@ class SerialConnection(Connection):
         self._logger.debug("connection to %s - %s", self._port, message)
         self._writer = None
         self._reader = None
+        self._transport = None
 
     def data_received(self, data: bytes) -> None:
         """
@@ -105,16 +139,49 @@ class SerialConnection(Connection):
                 self._logger.warning(
                     "Error in data received callback - %s", err, exc_info=True)
 
+    # @override
+    def _messages_received(self, messages: List[bytes]) -> None:
+        # disable Catching too general exception Exception - pylint: disable=W0703
+        try:
+            super()._messages_received(messages)
+        except Exception as err:
+            self._logger.warning(
+                "Error in data received callback - %s", err, exc_info=True)
+
     def send(self, data) -> None:
         """
         Sends the data to the connected socket
         """
         if self._writer:
             self._writer.write(data)
+        elif self._transport:
+            self._transport.write(data)
 
     def is_connected(self) -> bool:
         """ return True if the connection is established """
-        return self._writer is not None
+        return self._writer is not None or self._transport is not None
+
+    # @override
+    def pause_reading(self) -> None:
+        super().pause_reading()
+        transport: Optional[asyncio.BaseTransport] = self._get_serial_transport()
+        if isinstance(transport, asyncio.ReadTransport):
+            transport.pause_reading()
+
+    # @override
+    def resume_reading(self) -> None:
+        super().resume_reading()
+        transport: Optional[asyncio.BaseTransport] = self._get_serial_transport()
+        if isinstance(transport, asyncio.ReadTransport):
+            transport.resume_reading()
+
+    def _get_serial_transport(self) -> Optional[asyncio.BaseTransport]:
+        """
+        Return the serial transport of the protocol backend or the transport below the stream reader
+        """
+        if self._transport:
+            return self._transport
+        return self._writer.transport if self._writer else None
 
     def connect(self) -> None:
         if self._is_started:
@@ -132,14 +199,27 @@ class SerialConnection(Connection):
             self._writer.close()
             self._writer = None
             self._reader = None
+        if self._transport:
+            transport, self._transport = self._transport, None
+            transport.close()
 
     async def _connect(self) -> None:
         retry_count = 0
         while self._is_started:
+            self._receive_buffer.clear()
             try:
-                self._reader, self._writer = await serial_asyncio.open_serial_connection(
-                    url=self._port, baudrate=self._baud_rate, parity=self._parity,
-                    stopbits=self._stop_bits, bytesize=self._byte_size)
+                if self._backend == self.BACKEND_PROTOCOL:
+                    self._transport_closed = asyncio.get_running_loop().create_future()
+                    self._transport, _ = await serial_asyncio.create_serial_connection(
+                        asyncio.get_running_loop(), lambda: _SerialProtocol(self),
+                        url=self._port, baudrate=self._baud_rate, parity=self._parity,
+                        stopbits=self._stop_bits, bytesize=self._byte_size)
+                else:
+                    self._reader, self._writer = await serial_asyncio.open_serial_connection(
+                        url=self._port, baudrate=self._baud_rate, parity=self._parity,
+                        stopbits=self._stop_bits, bytesize=self._byte_size)
+                if self._reading_paused:
+                    self.pause_reading()
                 try:
                     self.connection_made()
                 except (AttributeError, TypeError):
@@ -160,18 +240,35 @@ class SerialConnection(Connection):
                 while self._is_started and wait_until > time():
                     await asyncio.sleep(0.5)
 
+    def _transport_data_received(self, data: bytes) -> None:
+        """
+        Called from the serial protocol with each received chunk
+        """
+        messages: List[bytes] = self._parse_input_data(data)
+        if messages:
+            self._messages_received(messages)
+
+    def _transport_connection_lost(self, err: Optional[Exception]) -> None:
+        """
+        Called from the serial protocol if the transport is closed
+        """
+        if self._transport_closed and not self._transport_closed.done():
+            self._transport_closed.set_result(None)
+        if self._transport:
+            self.connection_lost(err or serial.SerialException("connection closed"))
+
     async def _work(self) -> None:
         while self._is_started:
-            if not self._writer:
+            if not self.is_connected():
                 await self._connect()
+            if self._transport and self._transport_closed:
+                # the protocol handles the received data, wait until the transport is closed
+                await self._transport_closed
+                continue
             while self._writer:
                 # disable Catching too general exception Exception - pylint: disable=W0703
                 try:
-                    while self._reader:
-                        msg: bytes = await self._reader.readuntil(self._separator_encoded)
-                        # self._logger.debug("data received (config) %s",
-                        #         msg.decode().replace("\r", "<CR>").replace("\n", "<LF>"))
-                        self.data_received(msg[:-1])
+                    await self._read_stream()
                 except serial.SerialException as err:
                     # print("exception consumed")
                     try:
@@ -188,3 +285,39 @@ class SerialConnection(Connection):
                         self.connection_lost(err)
                     except (AttributeError, TypeError):
                         pass
+
+    async def _read_stream(self) -> None:
+        """
+        Reads the received data of the stream reader until it is closed
+        """
+        while self._reader:
+            if self._cb_data_received_batch:
+                # read everything available and split it at once
+                data: bytes = await self._reader.read(65536)
+                if not data:
+                    raise serial.SerialException("connection closed")
+                messages: List[bytes] = self._parse_input_data(data)
+                if messages:
+                    self._messages_received(messages)
+                continue
+            msg: bytes = await self._reader.readuntil(self._separator_encoded)
+            if self._cb_raw_data_received:
+                self._cb_raw_data_received(msg)
+            # self._logger.debug("data received (config) %s",
+            #         msg.decode().replace("\r", "<CR>").replace("\n", "<LF>"))
+            self.data_received(msg[:-1])
+
+
+class _SerialProtocol(asyncio.Protocol):
+    """ hands the events of the serial transport to the serial connection """
+
+    def __init__(self, connection: SerialConnection) -> None:
+        self._connection: SerialConnection = connection
+
+    def data_received(self, data: bytes) -> None:
+        # disable protected member access warning - pylint: disable=W0212
+        self._connection._transport_data_received(data)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        # disable protected member access warning - pylint: disable=W0212
+        self._connection._transport_connection_lost(exc)
@@ -37,8 +37,6 @@ class SocketConnection(Connection, asyncio.Protocol):
         self._reconnect_count: int = 0
         self._is_started: bool = False
         self._connect_task: Optional[asyncio.Task] = None
-        self._last_message: bytes = b""
-        self._separator_encoded: bytes = "\n".encode()
 
     def get_info(self) -> str:
         return f"{self._address}:{self._port}"
@@ -113,18 +111,32 @@ class SocketConnection(Connection, asyncio.Protocol):
         """ return True if the connection is established """
         return self._is_connected
 
+    # @override
+    def pause_reading(self) -> None:
+        super().pause_reading()
+        if isinstance(self._transport, asyncio.ReadTransport):
+            self._transport.pause_reading()
+
+    # @override
+    def resume_reading(self) -> None:
+        super().resume_reading()
+        if isinstance(self._transport, asyncio.ReadTransport):
+            self._transport.resume_reading()
+
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         self._is_connected = True
         self._reconnect_count = 0
         self._transport = transport
+        self._receive_buffer.clear()
+        if self._reading_paused and isinstance(transport, asyncio.ReadTransport):
+            transport.pause_reading()
         if self._cb_connection_made:
             self._cb_connection_made()
 
     def data_received(self, data) -> None:
         messages: List[bytes] = self._parse_input_data(data)
-        if self._cb_data_received:
-            for message in messages:
-                self._cb_data_received(message[:-1])
+        if messages:
+            self._messages_received(messages)
 
     def datagram_received(self, data: bytes, addr) -> None:
         """
@@ -134,24 +146,8 @@ class SocketConnection(Connection, asyncio.Protocol):
         """
         # disable unused argument warning - pylint: disable=W0613
         messages: List[bytes] = self._parse_input_data(data)
-        if self._cb_data_received:
-            for message in messages:
-                self._cb_data_received(message[:-1])
-
-    def _parse_input_data(self, recv_data: bytes) -> List[bytes]:
-        """
-        Adds the new data to the message buffer and checking for separators.
-
-        Return a list with separated messages
-        """
-        self._last_message += recv_data
-        responses: List[bytes] = []
-        index: int = self._last_message.find(self._separator_encoded)
-        while index > -1:
-            responses.append(self._last_message[:index+1])
-            self._last_message = self._last_message[index+1:]
-            index = self._last_message.find(self._separator_encoded)
-        return responses
+        if messages:
+            self._messages_received(messages)
 
     def error_received(self, exc) -> None:
         """
@@ -17,12 +17,14 @@ class HfReaderAscii(ReaderAscii):
         super().__init__(instance, connection)
         self._last_inventory: Dict[str, Any] = {'timestamp': None}
         self._last_request: Dict[str, Any] = {'timestamp': None}
+        self._inventory_response: Optional[asyncio.Future] = None
+        self._request_response: Optional[asyncio.Future] = None
         self._cb_request: Optional[Callable[[HfTag], None]] = None
         self._rfi_enabled: bool = False
 
     # @override
-    def set_cb_inventory(self, callback: Optional[Callable[[List[HfTag]], None]]
-                         ) -> Optional[Callable[[List[HfTag]], None]]:
+    def set_cb_inventory(self, callback: Optional[Callable[[List[HfTag]], None]], window: float = 0.0,
+                         window_rounds: int = 0) -> Optional[Callable[[List[HfTag]], None]]:
         """Set the callback for a new inventory.
 
         Define a callback which will be triggered whenever a new inventory
@@ -30,8 +32,18 @@ class HfReaderAscii(ReaderAscii):
 
         * tags (List[HfTag]) - List of transponders found in the inventory.
 
+        If a window is set, the continuous inventory rounds are coalesced and the callback is
+        called once per window, with the transponders merged by their identifier.
+
         Args:
             callback (Callable): Reference to the callback function to use.
+            window (float, optional): The window time in seconds, 0 for no time window.
+                Defaults to 0.0.
+            window_rounds (int, optional): The maximum number of rounds per window, 0 for no
+                limit. Defaults to 0.
+
+        Raises:
+            ValueError: If a window parameter is negative.
 
         Returns:
             Optional[Callable]: The old callback.
@@ -42,7 +54,7 @@ class HfReaderAscii(ReaderAscii):
             >>>         print(tag.get_epc())
             >>> set_cb_inventory(my_callback)
         """
-        return super().set_cb_inventory(callback)
+        return super().set_cb_inventory(callback, window, window_rounds)
 
     def set_cb_request(self, callback: Optional[Callable[[HfTag], None]]
                        ) -> Optional[Callable[[HfTag], None]]:
@@ -480,19 +492,16 @@ class HfReaderAscii(ReaderAscii):
             self._last_inventory['timestamp'] = None
             self._last_inventory['request'] = self._prepare_command(
                 command, *parameters)
+            self._inventory_response = self._create_response_event()
             self._send_command(command, *parameters)
-            max_time = time() + timeout
-            while max_time > time():
-                await asyncio.sleep(0.01)
-                if self._last_inventory['timestamp']:
-                    break
-            else:
+            if not await self._wait_for_response_event(self._inventory_response, timeout):
                 if self._rfi_enabled:
                     raise TimeoutError(
                         "no reader response for inventory command")
                 raise RfidReaderException("RF interface not enabled")
             return self._last_inventory
         finally:
+            self._inventory_response = None
             self._communication_lock.release()
 
     # @override
@@ -502,17 +511,19 @@ class HfReaderAscii(ReaderAscii):
         split = data.split('\r')
         inventory: List[HfTag] = []
         inventory_error: List[HfTag] = []
+        tag_class: type = self._get_tag_class(HfTag)
         for line in split[0:-1]:
             if line[1] == "R" and line[2] == "P":  # ARP  Antenna report
                 antenna = int(line[-2:])
                 for tag in inventory:
                     tag.set_antenna(antenna)
                 continue
-            new_tag = HfTag(line, timestamp)
+            new_tag = tag_class(line, timestamp)
             inventory.append(new_tag)
-        self._last_inventory['transponders'] = inventory
-        self._last_inventory['errors'] = inventory_error
+        self._last_inventory['transponders'] = self._freeze_tags(inventory)  # type: ignore
+        self._last_inventory['errors'] = self._freeze_tags(inventory_error)  # type: ignore
         self._last_inventory['timestamp'] = timestamp
+        self._set_response_event(self._inventory_response, timestamp)
         self._fire_inventory_event(inventory)  # type: ignore
 
     async def _send_request(self, command: str, tag_command: str, data: Optional[str],
@@ -579,13 +590,15 @@ class HfReaderAscii(ReaderAscii):
             # TNR - Tag not responding - no tag
             # RDL - read data too long
             error = split[last_element]
-        tag = HfTag(self._last_request.get('tid', ""), timestamp, antenna)
+        tag = self._get_tag_class(HfTag)(self._last_request.get('tid', ""), timestamp, antenna)
         tag.set_error_message(error)
         tag.set_data(tag_data)
+        self._freeze_tags([tag])
         self._last_request['response'] = tag
         self._last_request['timestamp'] = timestamp
+        self._set_response_event(self._request_response, timestamp)
         if self._cb_request and tag_data:
-            self._cb_request(tag)
+            self._callback_dispatcher.dispatch(self._cb_request, tag)
 
     async def _get_last_request(self, command: str, *parameters, timeout: float = 2.0) -> HfTag:
         """
@@ -605,17 +618,14 @@ class HfReaderAscii(ReaderAscii):
             self._last_request['timestamp'] = None
             self._last_request['request'] = self._prepare_command(
                 command, *parameters)
+            self._request_response = self._create_response_event()
             self._send_command(command, *parameters)
-            max_time = time() + timeout
-            while max_time > time():
-                await asyncio.sleep(0.01)
-                if self._last_request['timestamp']:
-                    break
-            else:
+            if not await self._wait_for_response_event(self._request_response, timeout):
                 if self._rfi_enabled:
                     raise TimeoutError(
                         "no reader response for inventory command")
                 raise RfidReaderException("RF interface not enabled")
             return self._last_request['response']
         finally:
+            self._request_response = None
             self._communication_lock.release()
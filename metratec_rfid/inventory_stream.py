@@ -0,0 +1,207 @@
+"""Async iterator for the transponders of continuous inventories
+"""
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Iterable, List, Optional
+
+from .tag import Tag
+from .tag_store import TagStore
+
+
+class InventoryStream():
+    """Bounded queue for the transponders of continuous inventories, consumed with ``async for``.
+
+    The reader adds the transponders of each inventory event without waiting. The consumer gets
+    them in batches at its own pace::
+
+        async for tags in reader.stream_inventory(max_batch=100, max_latency=0.5):
+            print(len(tags))
+
+    A batch is returned as soon as `max_batch` transponders are queued or `max_latency` seconds
+    after the oldest queued transponder arrived. The queue holds up to `max_size` transponders, the
+    overflow mode decides what happens if it is full:
+
+    * ``drop_oldest`` - the oldest transponders are removed and counted as dropped
+    * ``block`` - reading from the reader connection is paused until the consumer caught up.
+      Command responses are not received while the connection is paused, so consume the stream
+      before sending commands.
+    * ``coalesce`` - transponders with the same identifier are merged while queued (summed seen
+      count, last seen timestamp), if the queue is still full the least recently seen are dropped.
+
+    The stream ends when it is closed, e.g. when the reader is disconnected, or when the consumer
+    leaves the ``async for`` loop.
+    """
+    # disable 'too many instance attributes' warning - pylint: disable=R0902
+
+    OVERFLOW_DROP_OLDEST = "drop_oldest"
+    OVERFLOW_BLOCK = "block"
+    OVERFLOW_COALESCE = "coalesce"
+
+    def __init__(self, max_batch: int = 0, max_latency: float = 0.0, max_size: int = 10000,
+                 overflow: str = OVERFLOW_DROP_OLDEST,
+                 cb_paused: Optional[Callable[['InventoryStream', bool], None]] = None,
+                 cb_closed: Optional[Callable[['InventoryStream'], None]] = None) -> None:
+        """Create a new inventory stream.
+
+        Args:
+            max_batch (int, optional): The maximum number of transponders per batch, 0 for no limit.
+                Defaults to 0.
+
+            max_latency (float, optional): The time in seconds to wait for more transponders, before
+                a batch with less than `max_batch` transponders is returned. Defaults to 0.0.
+
+            max_size (int, optional): The maximum number of queued transponders. Defaults to 10000.
+
+            overflow (str, optional): The overflow mode. Defaults to "drop_oldest".
+
+            cb_paused (Callable, optional): Called in the block mode with the stream and True if the
+                queue is full, and with False if the consumer caught up. Defaults to None.
+
+            cb_closed (Callable, optional): Called with the stream when it is closed. Defaults to None.
+
+        Raises:
+            ValueError: If a parameter is not valid.
+        """
+        # disable 'Too many (positional) arguments' warning - pylint: disable=R0913,R0917
+        if overflow not in (self.OVERFLOW_DROP_OLDEST, self.OVERFLOW_BLOCK, self.OVERFLOW_COALESCE):
+            raise ValueError(f"Unknown overflow mode {overflow}")
+        if max_batch < 0 or max_latency < 0 or max_size < 1:
+            raise ValueError("max_batch and max_latency must not be negative, max_size must be positive")
+        self._max_batch: int = max_batch
+        self._max_latency: float = max_latency
+        self._max_size: int = max_size
+        self._overflow: str = overflow
+        self._cb_paused: Optional[Callable[['InventoryStream', bool], None]] = cb_paused
+        self._cb_closed: Optional[Callable[['InventoryStream'], None]] = cb_closed
+        self._tags: Deque[Tag] = deque()
+        # queue of the coalesce mode
+        # the transponders are copied, the reader passes the same objects to all consumers
+        self._store: Optional[TagStore] = TagStore(max_size, copy_tags=True) \
+            if overflow == self.OVERFLOW_COALESCE else None
+        self._event: asyncio.Event = asyncio.Event()
+        # loop time when the oldest queued transponder arrived
+        self._oldest_time: float = 0.0
+        self._dropped: int = 0
+        self._paused: bool = False
+        self._closed: bool = False
+
+    def __len__(self) -> int:
+        return len(self._store) if self._store is not None else len(self._tags)
+
+    async def __aiter__(self) -> AsyncIterator[List[Tag]]:
+        try:
+            while True:
+                batch: Optional[List[Tag]] = await self._next_batch()
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            self.close()
+
+    def get_dropped_count(self) -> int:
+        """Return the number of transponders that were dropped because the queue was full.
+
+        Returns:
+            int: The number of dropped transponders.
+        """
+        if self._store is not None:
+            return self._store.get_evicted_count()
+        return self._dropped
+
+    def is_paused(self) -> bool:
+        """Return whether the stream paused the connection because the queue is full (block mode).
+
+        Returns:
+            bool: True if the connection is paused by this stream.
+        """
+        return self._paused
+
+    def is_closed(self) -> bool:
+        """Return whether the stream is closed.
+
+        Returns:
+            bool: True if the stream is closed.
+        """
+        return self._closed
+
+    def put(self, inventory: Iterable[Tag]) -> None:
+        """Add the transponders of an inventory event. Never waits.
+
+        Args:
+            inventory (Iterable[Tag]): The transponders to add.
+        """
+        if self._closed:
+            return
+        was_empty: bool = len(self) == 0
+        if self._store is not None:
+            self._store.merge(inventory)
+        else:
+            tags: Deque[Tag] = self._tags
+            tags.extend(inventory)
+            if self._overflow == self.OVERFLOW_BLOCK:
+                if len(tags) >= self._max_size and not self._paused:
+                    self._set_paused(True)
+            else:
+                overflow: int = len(tags) - self._max_size
+                if overflow > 0:
+                    for _ in range(overflow):
+                        tags.popleft()
+                    self._dropped += overflow
+        if was_empty and len(self):
+            self._oldest_time = asyncio.get_running_loop().time()
+        self._event.set()
+
+    def close(self) -> None:
+        """Close the stream. The queued transponders are still returned, then the iteration ends.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._event.set()
+        if self._paused:
+            self._set_paused(False)
+        if self._cb_closed:
+            self._cb_closed(self)
+
+    async def _next_batch(self) -> Optional[List[Tag]]:
+        """ wait for the next batch, returns None if the stream is closed and empty """
+        while len(self) == 0:
+            if self._closed:
+                return None
+            self._event.clear()
+            await self._event.wait()
+        if self._max_latency:
+            loop = asyncio.get_running_loop()
+            deadline: float = self._oldest_time + self._max_latency
+            while not self._closed and (not self._max_batch or len(self) < self._max_batch):
+                timeout: float = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                self._event.clear()
+                try:
+                    await asyncio.wait_for(self._event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    break
+        return self._take()
+
+    def _take(self) -> List[Tag]:
+        """ remove and return the next batch """
+        if self._store is not None:
+            batch: List[Tag] = self._store.pop_all(self._max_batch)
+        elif not self._max_batch or self._max_batch >= len(self._tags):
+            batch = list(self._tags)
+            self._tags.clear()
+        else:
+            popleft = self._tags.popleft
+            batch = [popleft() for _ in range(self._max_batch)]
+        if len(self):
+            # the remaining transponders start a new latency period
+            self._oldest_time = asyncio.get_running_loop().time()
+        if self._paused and len(self) < self._max_size:
+            self._set_paused(False)
+        return batch
+
+    def _set_paused(self, paused: bool) -> None:
+        self._paused = paused
+        if self._cb_paused:
+            self._cb_paused(self, paused)
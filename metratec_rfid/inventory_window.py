@@ -0,0 +1,72 @@
+"""Coalescing of continuous inventory events
+"""
+import copy
+from typing import Dict, Iterable, List
+
+from .tag import Tag
+
+
+class InventoryWindow():
+    """Collects the transponders of several inventory rounds.
+
+    Transponders with the same identifier are merged: the seen counts are summed up, the first seen
+    and last seen timestamps span all rounds and the highest RSSI value is kept. The merged values
+    are written to copies, the added transponder objects are not changed.
+    """
+
+    def __init__(self) -> None:
+        self._tags: Dict[str, Tag] = {}
+        self._rounds: int = 0
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def get_rounds(self) -> int:
+        """Return the number of inventory rounds added since the last `pop()`.
+
+        Returns:
+            int: The number of rounds.
+        """
+        return self._rounds
+
+    def add(self, inventory: Iterable[Tag]) -> None:
+        """Add the transponders of an inventory round.
+
+        Args:
+            inventory (Iterable[Tag]): The transponders of the round.
+        """
+        # disable protected member access warning - pylint: disable=W0212
+        # the merges use the internal setters, the compact transponders are frozen
+        self._rounds += 1
+        tags = self._tags
+        for tag in inventory:
+            tag_id: str = tag.get_id()
+            current_tag = tags.get(tag_id)
+            if current_tag is None:
+                # the same objects are passed to the inventory streams
+                tags[tag_id] = copy.copy(tag)
+                continue
+            current_tag._set_seen_count(current_tag.get_seen_count() + tag.get_seen_count())
+            if tag.get_first_seen() < current_tag.get_first_seen():
+                current_tag._set_first_seen(tag.get_first_seen())
+            if tag.get_last_seen() > current_tag.get_last_seen():
+                current_tag._set_last_seen(tag.get_last_seen())
+            get_rssi = getattr(tag, 'get_rssi', None)
+            if get_rssi is None:
+                # HF transponders have no RSSI value
+                continue
+            rssi: int = get_rssi()
+            # the RSSI is negative, 0 means not available
+            if rssi and (not current_tag.get_rssi() or rssi > current_tag.get_rssi()):  # type: ignore
+                current_tag._set_rssi(rssi)  # type: ignore
+
+    def pop(self) -> List[Tag]:
+        """Return the merged transponders and start a new window.
+
+        Returns:
+            List[Tag]: The merged transponders, in the order they were first seen.
+        """
+        inventory: List[Tag] = list(self._tags.values())
+        self._tags = {}
+        self._rounds = 0
+        return inventory
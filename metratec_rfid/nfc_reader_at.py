@@ -2,7 +2,7 @@
 """
 
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from time import time
 from .connection.connection import Connection
 from .hf_tag import HfTag, ISO14ATag, ISO15Tag
@@ -199,11 +199,13 @@ class NfcReaderAT(ReaderAT):
                 f"Not expected response for command AT+INVS? - {responses}") from exc
 
     async def get_inventory(self) -> List[HfTag]:
+        # disable protected member access warning - pylint: disable=W0212
         responses = await self._send_command("AT+INV")
         inventory = self._parse_inventory(responses, time())
         current_antenna = self._config.get('antenna', 1)
+        # the parsed compact transponders are frozen
         for tag in inventory:
-            tag.set_antenna(current_antenna)
+            tag._set_antenna(current_antenna)
         self._fire_inventory_event(inventory, False)  # type: ignore
         return inventory
 
@@ -247,11 +249,11 @@ class NfcReaderAT(ReaderAT):
                     continue
             info = response[6:].split(',')
             if info[1] == "ISO15":
-                tag: HfTag = ISO15Tag(info[0], timestamp, current_antenna)
+                tag: HfTag = self._get_tag_class(ISO15Tag)(info[0], timestamp, current_antenna)
             else:
-                tag = ISO14ATag(info[0], timestamp, current_antenna, tag_type=info[1])
+                tag = self._get_tag_class(ISO14ATag)(info[0], timestamp, current_antenna, tag_type=info[1])
             tags.append(tag)
-        return tags
+        return self._freeze_tags(tags)  # type: ignore
 
     async def select_transponder(self, tid: str) -> None:
         """Select a transponder by its tag ID.
@@ -1055,8 +1057,8 @@ class NfcReaderAT(ReaderAT):
     ###################################################################################################################
 
     # @override
-    def set_cb_inventory(self, callback: Optional[Callable[[List[HfTag]], None]]
-                         ) -> Optional[Callable[[List[HfTag]], None]]:
+    def set_cb_inventory(self, callback: Optional[Callable[[List[HfTag]], None]], window: float = 0.0,
+                         window_rounds: int = 0) -> Optional[Callable[[List[HfTag]], None]]:
         """Set the callback for a new inventory.
 
         Define a callback which will be triggered whenever a new inventory
@@ -1064,8 +1066,18 @@ class NfcReaderAT(ReaderAT):
 
         * tags (List[HfTag]) - List of transponders found in the inventory.
 
+        If a window is set, the continuous inventory rounds are coalesced and the callback is
+        called once per window, with the transponders merged by their identifier.
+
         Args:
             callback (Callable): Reference to the callback function to use.
+            window (float, optional): The window time in seconds, 0 for no time window.
+                Defaults to 0.0.
+            window_rounds (int, optional): The maximum number of rounds per window, 0 for no
+                limit. Defaults to 0.
+
+        Raises:
+            ValueError: If a window parameter is negative.
 
         Returns:
             Optional[Callable]: The old callback.
@@ -1076,7 +1088,7 @@ class NfcReaderAT(ReaderAT):
             >>>         print(tag.get_epc())
             >>> set_cb_inventory(my_callback)
         """
-        return super().set_cb_inventory(callback)
+        return super().set_cb_inventory(callback, window, window_rounds)
 
     # @override
     async def stop_inventory(self) -> None:
@@ -1235,19 +1247,19 @@ class NfcReaderAT(ReaderAT):
                 if not tag_details_enabled:
                     tag_type = self._mode
                     if tag_type == NfcMode.AUTO:
-                        new_tag = HfTag(info[0], timestamp)
+                        new_tag = self._get_tag_class(HfTag)(info[0], timestamp)
                     elif tag_type == NfcMode.ISO15:
-                        new_tag = ISO15Tag(info[0], timestamp)
+                        new_tag = self._get_tag_class(ISO15Tag)(info[0], timestamp)
                     elif tag_type == NfcMode.ISO14A:
-                        new_tag = ISO14ATag(info[0], timestamp)
+                        new_tag = self._get_tag_class(ISO14ATag)(info[0], timestamp)
                 else:
                     tag_type = self._mode
                     if tag_type == NfcMode.AUTO:
                         tag_type = NfcMode[info.pop(1)]
                     if tag_type == NfcMode.ISO15:
-                        new_tag = ISO15Tag(info[0], timestamp, dsfid=info[1])
+                        new_tag = self._get_tag_class(ISO15Tag)(info[0], timestamp, dsfid=info[1])
                     elif tag_type == NfcMode.ISO14A:
-                        new_tag = ISO14ATag(info[0], timestamp, sak=info[1], atqa=info[2])
+                        new_tag = self._get_tag_class(ISO14ATag)(info[0], timestamp, sak=info[1], atqa=info[2])
                 if new_tag is not None:  # null check
                     inventory.append(new_tag)
             except IndexError as err:
@@ -1264,7 +1276,7 @@ class NfcReaderAT(ReaderAT):
         if antenna:
             for tag in inventory:
                 tag.set_antenna(antenna)
-        return inventory
+        return self._freeze_tags(inventory)  # type: ignore
 
     def _parse_error_response(self, response: str) -> RfidReaderException:
         """analyse the reader error and return the resulting exception
@@ -1350,13 +1362,19 @@ class NfcReaderAT(ReaderAT):
 
     # @override
     async def _prepare_reader_communication(self) -> None:
-        """The method of the ReaderAT superclass uses a `stop_inventory`
-        function which is not available when HID mode is active.
+        """The inventory is stopped after the setup commands of the ReaderAT superclass,
+        with the `stop_inventory` function, which is not available when HID mode is active.
         This raises an error which will cause any `connect` to fail.
         Therefore we catch and ignore the error here.
         """
+        await super()._prepare_reader_communication()
         try:
-            await super()._prepare_reader_communication()
+            await self.stop_inventory()
         except RfidReaderException as err:
             if "HID mode active" not in str(err):
                 raise err
+
+    # @override
+    def _get_stop_commands(self) -> Tuple[str, ...]:
+        # stopped by `stop_inventory()`, which also skips the unexpected responses
+        return ()
@@ -0,0 +1,196 @@
+"""Presence tracking of transponders
+"""
+import asyncio
+import heapq
+from time import time
+from typing import AsyncIterable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .tag import Tag
+
+
+class PresenceTracker():
+    """Turns inventories into appeared and disappeared events.
+
+    A transponder appears with the first inventory that contains it and disappears if it was not
+    seen for `absence_timeout` seconds. The present transponders keep the `first_seen` timestamp of
+    their appearance, the `last_seen` timestamp and the other values of their latest inventory.
+
+    Feed the tracker with the inventories of a reader, either from the inventory callback (inline
+    callback dispatch) or from an inventory stream::
+
+        tracker = PresenceTracker(absence_timeout=2.0)
+        tracker.set_cb_tag_appeared(lambda tag: print("appeared", tag.get_id()))
+        tracker.set_cb_tag_disappeared(lambda tag: print("disappeared", tag.get_id()))
+        await tracker.run(reader.stream_inventory())
+
+    The expiry times are kept in a heap with one entry per transponder, so an inventory round only
+    costs time for its own transponders and the expired ones, not for all present transponders.
+    """
+
+    def __init__(self, absence_timeout: float = 5.0) -> None:
+        """Create a new presence tracker.
+
+        Args:
+            absence_timeout (float, optional): The time in seconds after which a transponder that
+                was not seen disappears. Defaults to 5.0.
+
+        Raises:
+            ValueError: If the absence timeout is not positive.
+        """
+        if absence_timeout <= 0:
+            raise ValueError(f"Absence timeout must be positive - {absence_timeout}")
+        self._absence_timeout: float = absence_timeout
+        self._tags: Dict[str, Tag] = {}
+        # (expiry time, tag id), an entry is only valid if the tag was not seen again in the meantime
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_time: float = 0.0
+        self._cb_tag_appeared: Optional[Callable[[Tag], None]] = None
+        self._cb_tag_disappeared: Optional[Callable[[Tag], None]] = None
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __contains__(self, tag_id: object) -> bool:
+        return tag_id in self._tags
+
+    def set_cb_tag_appeared(self, callback: Optional[Callable[[Tag], None]]) -> Optional[Callable[[Tag], None]]:
+        """Set the callback for appeared transponders. The callback has the following arguments:
+        * tag (Tag) - the transponder
+
+        Returns:
+            Optional[Callable]: The old callback.
+        """
+        old = self._cb_tag_appeared
+        self._cb_tag_appeared = callback
+        return old
+
+    def set_cb_tag_disappeared(self, callback: Optional[Callable[[Tag], None]]) -> Optional[Callable[[Tag], None]]:
+        """Set the callback for disappeared transponders. The callback has the following arguments:
+        * tag (Tag) - the transponder, with the values of its last inventory
+
+        Returns:
+            Optional[Callable]: The old callback.
+        """
+        old = self._cb_tag_disappeared
+        self._cb_tag_disappeared = callback
+        return old
+
+    def get_absence_timeout(self) -> float:
+        """Return the absence timeout.
+
+        Returns:
+            float: The time in seconds after which a transponder that was not seen disappears.
+        """
+        return self._absence_timeout
+
+    def get_present_tags(self) -> List[Tag]:
+        """Return the present transponders.
+
+        Returns:
+            List[Tag]: The present transponders.
+        """
+        return list(self._tags.values())
+
+    def update(self, inventory: Iterable[Tag]) -> None:
+        """Add the transponders of an inventory and remove the expired transponders.
+
+        Must be called from the event loop thread if an event loop is running, the expiry is then
+        also checked with a timer when no inventories arrive.
+
+        Args:
+            inventory (Iterable[Tag]): The transponders of the inventory.
+        """
+        # disable protected member access warning - pylint: disable=W0212
+        # the internal setters, the compact transponders of the readers are frozen
+        now: float = time()
+        tags = self._tags
+        timeout: float = self._absence_timeout
+        for tag in inventory:
+            tag_id: str = tag.get_id()
+            if not tag.get_last_seen():
+                tag._set_last_seen(now)
+            current_tag: Optional[Tag] = tags.get(tag_id)
+            tags[tag_id] = tag
+            if current_tag is not None:
+                # the expiry entry of the transponder is updated when it is due
+                tag._set_first_seen(current_tag.get_first_seen())
+                continue
+            if not tag.get_first_seen():
+                tag._set_first_seen(tag.get_last_seen())
+            heapq.heappush(self._expiry_heap, (tag.get_last_seen() + timeout, tag_id))
+            if self._cb_tag_appeared:
+                self._cb_tag_appeared(tag)
+        self.expire(now)
+
+    def expire(self, now: Optional[float] = None) -> None:
+        """Remove the transponders that were not seen within the absence timeout.
+
+        Args:
+            now (float, optional): The current (unix) timestamp. Defaults to the current time.
+        """
+        if now is None:
+            now = time()
+        heap = self._expiry_heap
+        tags = self._tags
+        timeout: float = self._absence_timeout
+        while heap and heap[0][0] <= now:
+            tag_id: str = heap[0][1]
+            tag: Tag = tags[tag_id]
+            expiry: float = tag.get_last_seen() + timeout
+            if expiry > now:
+                # seen again, move the entry to the new expiry time
+                heapq.heapreplace(heap, (expiry, tag_id))
+                continue
+            heapq.heappop(heap)
+            del tags[tag_id]
+            if self._cb_tag_disappeared:
+                self._cb_tag_disappeared(tag)
+        self._schedule_expiry()
+
+    async def run(self, inventories: AsyncIterable[List[Tag]]) -> None:
+        """Update the tracker with the inventories of an async iterable, e.g. `reader.stream_inventory()`,
+        until it ends.
+
+        Args:
+            inventories (AsyncIterable[List[Tag]]): The inventories.
+        """
+        try:
+            async for inventory in inventories:
+                self.update(inventory)
+        finally:
+            self.close()
+
+    def clear(self) -> None:
+        """Remove all transponders without disappeared events.
+        """
+        self._tags.clear()
+        self._expiry_heap.clear()
+        self.close()
+
+    def close(self) -> None:
+        """Stop the expiry timer. The expiry is checked again with the next update.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule_expiry(self) -> None:
+        """ Starts the timer for the next expiry, if an event loop is running """
+        if not self._expiry_heap:
+            self.close()
+            return
+        next_expiry: float = self._expiry_heap[0][0]
+        if self._timer is not None and self._timer_time <= next_expiry:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.close()
+        self._timer_time = next_expiry
+        self._timer = loop.call_later(max(next_expiry - time(), 0.0), self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self.expire()
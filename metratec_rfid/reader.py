@@ -4,11 +4,17 @@ metratec rfid reader base class
 
 from abc import abstractmethod
 import asyncio
+import random
 from time import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 from serial.tools import list_ports
 
 from .tag import Tag
+from .tag_store import TagStore
+from .inventory_stream import InventoryStream
+from .callback_dispatcher import CallbackDispatcher
+from .inventory_window import InventoryWindow
+from .compact_tag import COMPACT_TAG_CLASSES, CompactTag
 from .status_class import BaseClass
 from .reader_exception import RfidReaderException
 from .connection.connection import Connection
@@ -67,9 +73,7 @@ class RfidReader(BaseClass):
     def __init__(self, connection: Connection, instance: str = "") -> None:
         super().__init__(instance)
         self._connection: Connection = connection
-        self._connection.set_cb_connection_made(self._connection_made)
-        self._connection.set_cb_connection_lost(self._connection_lost)
-        self._connection.set_cb_data_received(self._connection_data_received)
+        self.set_connection(connection)
         self._cb_input_changed: Optional[Callable[[int, bool], None]] = None
         self._cb_inventory: Optional[Callable[[List[Tag]], None]] = None
         self._task_config: Optional[asyncio.Task] = None
@@ -78,12 +82,26 @@ class RfidReader(BaseClass):
         self._send: Callable = self._send_not_connected
         self._config: dict = {}
         self._receiver_buffer: asyncio.Queue = asyncio.Queue()
-        self._inventory: Dict[str, Tag] = {}
-        self._inventory_condition = asyncio.Condition()
+        self._inventory: TagStore = TagStore()
+        self._inventory_event: asyncio.Event = asyncio.Event()
+        self._inventory_streams: List[InventoryStream] = []
+        # streams in the block mode with a full queue, the connection is paused while not empty
+        self._paused_streams: Set[InventoryStream] = set()
+        self._callback_dispatcher: CallbackDispatcher = CallbackDispatcher(logger=self.get_logger())
+        # coalescing of the continuous inventory events for the callback
+        self._inventory_window: Optional[InventoryWindow] = None
+        self._inventory_window_time: float = 0.0
+        self._inventory_window_rounds: int = 0
+        self._inventory_window_timer: Optional[asyncio.TimerHandle] = None
         self._fire_empty_inventories = False
+        self._compact_tags: bool = False
         self._heartbeat: int = 10
-        self._timeout: float = 25.0
+        self._heartbeat_grace: float = 2.0
+        self._timeout: float = 12.0
         self._last_message_time: float = 0
+        self._watchdog: Optional[asyncio.TimerHandle] = None
+        self._reconnect_semaphore: Optional[asyncio.Semaphore] = None
+        self._reconnect_max_delay: float = 0.0
 
     async def connect(self, timeout: float = 5.0, port_re: str = "USB") -> None:
         """Connect the reader.
@@ -133,8 +151,8 @@ class RfidReader(BaseClass):
             # assuming socket connection is the only alternative
             address = self._connection.get_info().split(":")[0]
             if not address:
-                # FIXME find reader via avahi/zeroconf
-                raise NotImplementedError("Auto-IP not available")
+                # the address of a network reader is found with utils.discover_readers()
+                raise NotImplementedError("No reader address set - use discover_readers() to find the reader")
             await self._connect(timeout=timeout)
 
     async def _connect(self, timeout: float = 5.0) -> None:
@@ -165,7 +183,11 @@ class RfidReader(BaseClass):
                 pass
         self._stop_internal_tasks()
         self._connection.disconnect()
+        self._flush_inventory_window()
         self._inventory.clear()
+        for stream in list(self._inventory_streams):
+            stream.close()
+        self._callback_dispatcher.close()
         self._send = self._send_not_connected
 
     def is_connected(self) -> bool:
@@ -184,16 +206,78 @@ class RfidReader(BaseClass):
         """
         return self._status['status'] == self.RUNNING
 
-    def set_cb_inventory(self, callback: Optional[Callable]) -> Optional[Callable]:
+    def get_connection(self) -> Connection:
+        """Return the connection of the reader.
+
+        Can be used to adjust connection settings before connecting, e.g. the serial backend::
+
+            reader.get_connection().set_backend(SerialConnection.BACKEND_PROTOCOL)
+
+        Returns:
+            Connection: the reader connection
+        """
+        return self._connection
+
+    def set_connection(self, connection: Connection) -> None:
+        """Replace the connection of the reader, e.g. to record or replay the reader communication::
+
+            reader = PulsarLR("reader", "192.168.2.101")
+            reader.set_connection(RecordingConnection(reader.get_connection(), "session.rec"))
+
+        The reader must be disconnected.
+
+        Args:
+            connection (Connection): the new connection
+        """
+        self._connection = connection
+        connection.set_cb_connection_made(self._connection_made)
+        connection.set_cb_connection_lost(self._connection_lost)
+        connection.set_cb_data_received(self._connection_data_received)
+        connection.set_cb_data_received_batch(self._connection_data_received_batch)
+
+    def get_tag_store(self) -> TagStore:
+        """Return the store for the transponders of continuous inventories without a callback.
+
+        The transponders are returned by `fetch_inventory()`. Use the store to change the maximum
+        number of transponders or to get the number of evicted transponders.
+
+        Returns:
+            TagStore: the transponder store
+        """
+        return self._inventory
+
+    def set_cb_inventory(self, callback: Optional[Callable], window: float = 0.0,
+                         window_rounds: int = 0) -> Optional[Callable]:
         """
         Set the callback for a new inventory. The callback has the following arguments:
         * tags (List[Tag]) - the tags
 
+        The continuous inventory rounds can be coalesced into windows, by time and/or by number of
+        rounds. The callback is then called once per window, with the transponders of all rounds
+        merged by their identifier (summed seen count, first and last seen over all rounds, highest
+        RSSI).
+
+        Args:
+            callback (Callable): the callback
+            window (float, optional): the window time in seconds, 0 for no time window. Defaults to 0.0.
+            window_rounds (int, optional): the maximum number of rounds per window, 0 for no limit.
+                Defaults to 0.
+
+        Raises:
+            ValueError: If a window parameter is negative.
+
         Returns:
             Optional[Callable]: the old callback
         """
+        if window < 0 or window_rounds < 0:
+            raise ValueError("The window parameters must not be negative")
+        # the transponders of the current window belong to the old callback
+        self._flush_inventory_window()
         old = self._cb_inventory
         self._cb_inventory = callback
+        self._inventory_window_time = window
+        self._inventory_window_rounds = window_rounds
+        self._inventory_window = InventoryWindow() if window or window_rounds else None
         return old
 
     # FIXME move to IO?
@@ -240,6 +324,21 @@ class RfidReader(BaseClass):
         """
         self._fire_empty_inventories = enable
 
+    def enable_compact_tags(self, enable: bool = True) -> None:
+        """En-/disable compact transponder objects.
+
+        If enabled, the reader returns the slot based transponder classes of the `compact_tag`
+        module (e.g. `CompactUhfTag` instead of `UhfTag`). They have the same getter methods, but
+        are no dictionaries - use `to_dict()` to get the values as dictionary, e.g. for a JSON
+        export. They need less memory and are faster to create, which helps if many transponders
+        are kept. The returned objects are frozen, their set methods raise an `AttributeError`.
+
+        Args:
+            enable (bool, optional): Set to True, to enable compact transponder objects.
+                Defaults to True.
+        """
+        self._compact_tags = enable
+
     async def fetch_inventory(self, wait_for_tags: bool = False) -> List[Tag]:
         """
         Can be called when an inventory has been started. Waits until at least one tag is found
@@ -251,27 +350,139 @@ class RfidReader(BaseClass):
         Returns:
             List[Tag]: A list with the transponders found.
         """
-        async with self._inventory_condition:
-            if wait_for_tags:
-                if not self._inventory:
-                    await self._inventory_condition.wait()
-            inventory = list(self._inventory.values())
-            self._inventory.clear()
-            return inventory
+        if wait_for_tags:
+            while not self._inventory:
+                self._inventory_event.clear()
+                await self._inventory_event.wait()
+        return self._inventory.pop_all()
+
+    def set_callback_dispatch(self, mode: str = CallbackDispatcher.MODE_INLINE, max_workers: int = 4,
+                              max_queue_size: int = 1000) -> None:
+        """Set how the inventory and input callbacks are executed.
+
+        By default the callbacks are called directly in the event loop, so a slow callback (e.g. a
+        database write) delays the handling of the reader data and can cause connection timeouts.
+
+        * "inline" - the callbacks are called directly in the event loop
+        * "thread_pool" - the callbacks run in a thread pool, concurrently and possibly out of order
+        * "worker" - the callbacks run one after the other in a dedicated worker thread
+
+        In the thread modes the callbacks must be thread-safe. If `max_queue_size` callbacks are
+        waiting, further callbacks are dropped. See `get_callback_metrics()`.
+
+        Args:
+            mode (str, optional): The dispatch mode. Defaults to "inline".
+            max_workers (int, optional): The number of threads of the thread pool. Defaults to 4.
+            max_queue_size (int, optional): The maximum number of waiting callbacks. Defaults to 1000.
+
+        Raises:
+            ValueError: If a parameter is not valid.
+        """
+        dispatcher = CallbackDispatcher(mode, max_workers, max_queue_size, self.get_logger())
+        self._callback_dispatcher.close()
+        self._callback_dispatcher = dispatcher
+
+    def get_callback_metrics(self) -> Dict[str, Any]:
+        """Return the metrics of the callback dispatching.
+
+        Returns:
+            Dict[str, Any]: Dictionary with the 'mode', the current and maximum 'queue_depth' and
+            'max_queue_depth', the number of 'dispatched', 'dropped' and failed ('errors')
+            callbacks and the average and maximum dispatch latency 'latency_avg' and
+            'latency_max' in seconds.
+        """
+        return self._callback_dispatcher.get_metrics()
+
+    def stream_inventory(self, max_batch: int = 0, max_latency: float = 0.0, max_size: int = 10000,
+                         overflow: str = InventoryStream.OVERFLOW_DROP_OLDEST) -> InventoryStream:
+        """Return an async iterator for the transponders of continuous inventories.
+
+        The transponders of each inventory event are queued without blocking the reader and can be
+        consumed in batches at the own pace. The stream ends if the reader is disconnected or the
+        ``async for`` loop is left.
+
+            >>> async for tags in reader.stream_inventory(max_batch=100, max_latency=0.5):
+            >>>     print(len(tags))
+
+        Args:
+            max_batch (int, optional): The maximum number of transponders per batch, 0 for no limit.
+                Defaults to 0.
+            max_latency (float, optional): The time in seconds to wait for more transponders, before
+                a batch with less than `max_batch` transponders is returned. Defaults to 0.0.
+            max_size (int, optional): The maximum number of queued transponders. Defaults to 10000.
+            overflow (str, optional): What happens if the queue is full: "drop_oldest" drops the
+                oldest transponders, "block" pauses the reader connection and "coalesce" merges the
+                transponders with the same identifier. See `InventoryStream`.
+                Defaults to "drop_oldest".
+
+        Raises:
+            ValueError: If a parameter is not valid.
+
+        Returns:
+            InventoryStream: the stream, also provides the number of dropped transponders
+        """
+        return self._create_inventory_stream(self._inventory_streams, max_batch, max_latency, max_size, overflow)
 
     async def set_heartbeat(self, interval: int) -> None:
         """Set the heartbeat interval of the reader.
 
-        If the interval is larger than 0, the SDK will regularly check
-        whether the reader is still connected and automatically
-        attempt to re-connect and raise and error on failure.
+        If the interval is larger than 0, the SDK will check whether the
+        reader is still connected and automatically attempt to re-connect
+        and raise and error on failure. The connection is considered lost
+        if no message was received within the interval plus the grace
+        period, see `set_heartbeat_grace()`.
 
         Args:
             interval (float): Interval in seconds [0, 60].
         """
         self._heartbeat = interval
-        if self.is_connected():
-            self._timeout = 2.5 * self._heartbeat
+        if self.is_running():
+            self._start_watchdog()
+
+    def set_heartbeat_grace(self, grace: float) -> None:
+        """Set the grace period of the connection check.
+
+        The connection is considered lost if no message was received within
+        the heartbeat interval plus the grace period.
+
+        Args:
+            grace (float): The grace period in seconds. Defaults to 2.0.
+
+        Raises:
+            ValueError: If the grace period is negative.
+        """
+        if grace < 0:
+            raise ValueError(f"Grace period must not be negative - {grace}")
+        self._heartbeat_grace = grace
+        if self.is_running():
+            self._start_watchdog()
+
+    def get_heartbeat_grace(self) -> float:
+        """Return the grace period of the connection check.
+
+        Returns:
+            float: The grace period in seconds.
+        """
+        return self._heartbeat_grace
+
+    def set_reconnect_limit(self, semaphore: Optional[asyncio.Semaphore], max_delay: float = 0.0) -> None:
+        """Limit the automatic reconnects of the connection check.
+
+        Readers sharing the semaphore reconnect at the same time only up to the semaphore value and
+        each reconnect starts after a random delay, so that many readers do not reconnect at once
+        after a network outage. Used by `ReaderGroup`.
+
+        Args:
+            semaphore (asyncio.Semaphore, optional): The semaphore for the reconnects, None for no limit.
+            max_delay (float, optional): The maximum random delay in seconds. Defaults to 0.0.
+
+        Raises:
+            ValueError: If the delay is negative.
+        """
+        if max_delay < 0:
+            raise ValueError(f"Delay must not be negative - {max_delay}")
+        self._reconnect_semaphore = semaphore
+        self._reconnect_max_delay = max_delay
 
     def get_status(self) -> Dict[str, Any]:
         """Return status information about the reader.
@@ -430,6 +641,17 @@ class RfidReader(BaseClass):
             timestamp (float): the timestamp
         """
 
+    def _data_received_batch(self, data: List[str], timestamp: float):
+        """Called from the connection instance, to handle all messages received with one read.
+        Override for handling a burst of messages at once.
+
+        Args:
+            data (List[str]): the received messages
+            timestamp (float): the timestamp
+        """
+        for message in data:
+            self._data_received(message, timestamp)
+
     ###############################################################################################
     # Internal methods
     ###############################################################################################
@@ -445,26 +667,53 @@ class RfidReader(BaseClass):
         if self._status['status'] != self.ERROR:
             self._update_status(self.ERROR, reason)
 
-    async def _check_connection(self) -> None:
-        """Check the connection - reconnect the device if no messages have been received for a while
+    def _start_watchdog(self) -> None:
+        """Start the connection check - it fires if no message was received within the heartbeat
+        interval plus the grace period
         """
+        self._stop_watchdog()
         if self._heartbeat <= 0:
             return
-        self._timeout = 2.5 * self._heartbeat
-        while self.get_status()['status'] >= 1:
-            await asyncio.sleep(5)
-            if self._last_message_time + self._timeout >= time():
-                continue
-            # connection lost
-            self._update_status(self.ERROR, 'connection lost')
-            try:
-                # await self.disconnect()
-                self._connection.disconnect()
-                self._send = self._send_not_connected
+        self._timeout = self._heartbeat + self._heartbeat_grace
+        self._arm_watchdog()
+
+    def _arm_watchdog(self) -> None:
+        # the received messages only update the timestamp, the timer is moved to the new deadline when it fires
+        delay: float = self._last_message_time + self._timeout - time()
+        self._watchdog = asyncio.get_running_loop().call_later(max(delay, 0.0), self._on_watchdog)
+
+    def _stop_watchdog(self) -> None:
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
+
+    def _on_watchdog(self) -> None:
+        self._watchdog = None
+        if self.get_status()['status'] < 1:
+            return
+        if self._last_message_time + self._timeout > time():
+            self._arm_watchdog()
+            return
+        self._task_connection_check = asyncio.ensure_future(self._check_connection())
+
+    async def _check_connection(self) -> None:
+        """Reconnect the device, no messages have been received within the heartbeat interval plus the grace period
+        """
+        self.get_logger().warning("no message received for %.1f seconds", time() - self._last_message_time)
+        self._update_status(self.ERROR, 'connection lost')
+        try:
+            # await self.disconnect()
+            self._connection.disconnect()
+            self._send = self._send_not_connected
+            if self._reconnect_max_delay:
+                await asyncio.sleep(random.uniform(0.0, self._reconnect_max_delay))
+            if self._reconnect_semaphore is None:
                 await self.connect()
-            except TimeoutError:
-                pass
-            break
+            else:
+                async with self._reconnect_semaphore:
+                    await self.connect()
+        except (TimeoutError, RfidReaderException) as err:
+            self.get_logger().warning("Reconnect failed - %s", err)
 
     def _add_data_to_receive_buffer(self, data: str) -> None:
         """ add the received data to the internal response buffer """
@@ -507,20 +756,10 @@ class RfidReader(BaseClass):
         try:
             await self._prepare_reader_communication()
             await self._config_reader()
-            try:
-                self._heartbeat = self._config.get('heartbeat', self._heartbeat)
-                await self.set_heartbeat(self._heartbeat)
-            except RfidReaderException:
-                self.get_logger().debug("no heartbeat available - connection check is disabled")
-                self._heartbeat = 0
-            try:
-                await self.enable_input_events(self._cb_input_changed is not None)
-            except RfidReaderException as err:
-                if "not available" not in str(err):
-                    raise err
+            await self._config_events()
             self._update_status(self.RUNNING, "running")
-            self._task_connection_check = asyncio.ensure_future(self._check_connection())
             self._handle_data = self._data_received
+            self._start_watchdog()
         except (TimeoutError, RfidReaderException) as err:
             msg: str = f"Configuration Error - {err}" if isinstance(err, RfidReader) else str(err)
             self.get_logger().warning(msg)
@@ -529,6 +768,20 @@ class RfidReader(BaseClass):
             await asyncio.sleep(5)
             self._task_config = asyncio.ensure_future(self._config_device())
 
+    async def _config_events(self) -> None:
+        """Configure the heartbeat and the input events of the reader"""
+        try:
+            self._heartbeat = self._config.get('heartbeat', self._heartbeat)
+            await self.set_heartbeat(self._heartbeat)
+        except RfidReaderException:
+            self.get_logger().debug("no heartbeat available - connection check is disabled")
+            self._heartbeat = 0
+        try:
+            await self.enable_input_events(self._cb_input_changed is not None)
+        except RfidReaderException as err:
+            if "not available" not in str(err):
+                raise err
+
     def _send_not_connected(self, data: str) -> None:
         raise RfidReaderException("Not connected")
 
@@ -537,7 +790,16 @@ class RfidReader(BaseClass):
         self._last_message_time = timestamp
         self._handle_data(data.decode(), timestamp)
 
+    def _connection_data_received_batch(self, data: List[bytes], timestamp: float) -> None:
+        self._last_message_time = timestamp
+        if self._handle_data == self._data_received:
+            self._data_received_batch([message.decode() for message in data], timestamp)
+            return
+        for message in data:
+            self._handle_data(message.decode(), timestamp)
+
     def _stop_internal_tasks(self) -> None:
+        self._stop_watchdog()
         if self._task_connection_check and not self._task_connection_check.done():
             self._task_connection_check.cancel()
         if self._task_config and not self._task_config.done():
@@ -551,26 +813,83 @@ class RfidReader(BaseClass):
 
     def _fire_inventory_event(self, inventory: List[Tag], continuous: bool = True) -> None:
         """ Checks the inventory and calls the inventory callback """
+        self._freeze_tags(inventory)
+        if inventory and continuous:
+            for stream in self._inventory_streams:
+                stream.put(inventory)
         if not self._cb_inventory:
-            if inventory and continuous:
-                asyncio.create_task(self._update_inventory(inventory))
+            if inventory and continuous and not self._inventory_streams:
+                self._update_inventory(inventory)
             return
         if not self._fire_empty_inventories and not inventory:
             return
-        self._cb_inventory(inventory)
+        if continuous and self._inventory_window is not None:
+            self._add_to_inventory_window(inventory)
+            return
+        self._callback_dispatcher.dispatch(self._cb_inventory, inventory)
+
+    def _add_to_inventory_window(self, inventory: List[Tag]) -> None:
+        """ Adds an inventory round to the current window and fires the window if it is complete """
+        window: InventoryWindow = self._inventory_window  # type: ignore
+        window.add(inventory)
+        if self._inventory_window_rounds and window.get_rounds() >= self._inventory_window_rounds:
+            self._flush_inventory_window()
+        elif self._inventory_window_time and self._inventory_window_timer is None:
+            self._inventory_window_timer = asyncio.get_running_loop().call_later(
+                self._inventory_window_time, self._flush_inventory_window)
+
+    def _flush_inventory_window(self) -> None:
+        """ Calls the inventory callback with the transponders of the current window """
+        if self._inventory_window_timer is not None:
+            self._inventory_window_timer.cancel()
+            self._inventory_window_timer = None
+        window: Optional[InventoryWindow] = self._inventory_window
+        if window is None or not window.get_rounds():
+            return
+        inventory: List[Tag] = window.pop()
+        if self._cb_inventory and (inventory or self._fire_empty_inventories):
+            self._callback_dispatcher.dispatch(self._cb_inventory, inventory)
+
+    def _create_inventory_stream(self, streams: List[InventoryStream], max_batch: int, max_latency: float,
+                                 max_size: int, overflow: str) -> InventoryStream:
+        """ Create a stream, which is registered in the given list while it is open """
+        # disable 'Too many (positional) arguments' warning - pylint: disable=R0913,R0917
+        stream = InventoryStream(max_batch, max_latency, max_size, overflow, self._set_stream_paused,
+                                 streams.remove)
+        streams.append(stream)
+        return stream
+
+    def _set_stream_paused(self, stream: InventoryStream, paused: bool) -> None:
+        """ Pauses the connection while a stream in the block mode is full """
+        if paused:
+            self._paused_streams.add(stream)
+        else:
+            self._paused_streams.discard(stream)
+        if self._paused_streams:
+            if not self._connection.is_reading_paused():
+                self._connection.pause_reading()
+        elif self._connection.is_reading_paused():
+            self._connection.resume_reading()
+
+    def _get_tag_class(self, tag_class: type) -> type:
+        """ Return the transponder class to use instead of the given dict based class """
+        return COMPACT_TAG_CLASSES[tag_class] if self._compact_tags else tag_class
+
+    def _freeze_tags(self, inventory: List[Tag]) -> List[Tag]:
+        """ Freeze the compact transponders before they are passed to the user code """
+        if self._compact_tags and isinstance(inventory, list):
+            for tag in inventory:
+                if isinstance(tag, CompactTag):
+                    tag.freeze()
+        return inventory
 
     def _fire_input_changed_event(self, pin: int, new_value: bool) -> None:
         if not self._cb_input_changed:
             return
-        self._cb_input_changed(pin, new_value)
+        self._callback_dispatcher.dispatch(self._cb_input_changed, pin, new_value)
 
-    async def _update_inventory(self, inventory: List[Tag]):
-        async with self._inventory_condition:
-            for tag in inventory:
-                if tag.get_id() in self._inventory:
-                    current_tag: Tag = self._inventory[tag.get_id()]
-                    current_tag.set_seen_count(current_tag.get_seen_count()+tag.get_seen_count())
-                    current_tag.set_last_seen(tag.get_last_seen())
-                else:
-                    self._inventory[tag.get_id()] = tag
-            self._inventory_condition.notify()
+    def _update_inventory(self, inventory: List[Tag]) -> None:
+        """ Adds the transponders to the tag store and wakes up a waiting `fetch_inventory()` """
+        self._inventory.merge(inventory)
+        if self._inventory:
+            self._inventory_event.set()
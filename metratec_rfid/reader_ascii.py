@@ -3,7 +3,7 @@
 from abc import abstractmethod
 import asyncio
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .reader_exception import RfidReaderException
 from .reader import RfidReader
@@ -471,6 +471,43 @@ class ReaderAscii(RfidReader):
             if "OK" in receive:
                 return
 
+    def _create_response_event(self) -> asyncio.Future:
+        """Create a future, which is completed by the parser of an asynchronous reader response
+        (e.g. an inventory) with `_set_response_event()`
+
+        Returns:
+            asyncio.Future: the response event
+        """
+        return asyncio.get_running_loop().create_future()
+
+    def _set_response_event(self, event: Optional[asyncio.Future], timestamp: float) -> None:
+        """Complete a response event, if one is waiting
+
+        Args:
+            event (asyncio.Future): the response event or None
+
+            timestamp (float): the response timestamp
+        """
+        if event is not None and not event.done():
+            event.set_result(timestamp)
+
+    async def _wait_for_response_event(self, event: asyncio.Future, timeout: float) -> bool:
+        """Wait until the response event is completed
+
+        Args:
+            event (asyncio.Future): the response event
+
+            timeout (float): the response timeout
+
+        Returns:
+            bool: False if the timeout has been reached
+        """
+        try:
+            await asyncio.wait_for(event, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def _send_recv_command(self, command: str, *parameters) -> str:
         await self._communication_lock.acquire()
         try:
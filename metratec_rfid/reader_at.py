@@ -2,14 +2,43 @@
 """
 from abc import abstractmethod
 import asyncio
+from collections import deque
 import logging
-from time import time
-from typing import Optional, Any,  Dict, List
+from typing import Deque, Optional, Any,  Dict, List, Sequence, Tuple, Union
 
 from .reader_exception import RfidReaderException
 from .reader import RfidReader
+from .reader_profile_cache import ReaderProfileCache
 from .connection.connection import Connection
 
+# disable 'Too many lines in module' warning - pylint: disable=C0302
+
+
+class PendingCommand():
+    """A command which was sent to the reader and is waiting for its response
+    """
+    # disable Too few public methods warning - pylint: disable=R0903
+
+    __slots__ = ('command', 'send_command', 'expect_echo', 'response', 'future')
+
+    def __init__(self, command: str, send_command: str, expect_echo: bool, future: asyncio.Future) -> None:
+        """Create a new pending command
+
+        Args:
+            command (str): the command without parameters
+
+            send_command (str): the command as sent to the reader
+
+            expect_echo (bool): True, if the reader echoes the command
+
+            future (asyncio.Future): completed with the response lines or the reader error
+        """
+        self.command: str = command
+        self.send_command: str = send_command
+        self.expect_echo: bool = expect_echo
+        self.response: str = ""
+        self.future: asyncio.Future = future
+
 
 class ReaderAT(RfidReader):
     """The implementation of the AT reader protocol
@@ -21,14 +50,34 @@ class ReaderAT(RfidReader):
         super().__init__(connection, instance)
         self._connection.set_separator("\n")
         self._communication_lock = asyncio.Lock()
+        self._pending_commands: Deque[PendingCommand] = deque()
         self._config: dict = {}
         self._ignore_errors = False
         self._echo_enabled = False
+        self._profile_cache: Optional[ReaderProfileCache] = None
+        # responses of the setting queries by query command, None if the cache is disabled
+        self._settings_cache: Optional[Dict[str, List[str]]] = None
+        # True if the configuration matches the connected reader and can be stored as its profile
+        self._profile_valid: bool = False
+        # responses of the setup commands of the connect by command, see `_prepare_reader_communication()`
+        self._setup_responses: Dict[str, Any] = {}
 
     # @override
     async def get_reader_info(self) -> Dict[str, str]:
-        command: str = "ATI"
-        response: List[str] = await self._send_command(command)
+        return self._parse_reader_info(await self._send_command("ATI"))
+
+    def _parse_reader_info(self, response: List[str]) -> Dict[str, str]:
+        """Parse the response of the reader info command `ATI`
+
+        Args:
+            response (List[str]): the response lines
+
+        Raises:
+            RfidReaderException: If the response is not the info of an AT reader
+
+        Returns:
+            Dict[str, str]: the reader info
+        """
         # +SW: PULSAR_LR 0100
         # +HW: PULSAR_LR 0100
         # +SERIAL: 2020090817420000
@@ -50,6 +99,8 @@ class ReaderAT(RfidReader):
     # @override
     async def reset(self, wait: float = 1.0) -> None:
         await self._send_command("AT+RST")
+        # the reader starts with its default configuration
+        self._remove_profile()
         await self.disconnect()
         await asyncio.sleep(wait)
         await self.connect()
@@ -58,15 +109,30 @@ class ReaderAT(RfidReader):
     async def set_antenna(self, antenna: int) -> None:
         await self._send_command("AT+ANT", antenna)
         self._config['antenna'] = antenna
+        self._update_setting("AT+ANT?", [f"+ANT: {antenna}"])
 
     # @override
     async def get_antenna(self) -> int:
         try:
-            response: List[str] = await self._send_command("AT+ANT?")
+            response: List[str] = await self._query_setting("AT+ANT?")
         except RfidReaderException as error:
             if "ERROR" in str(error):
                 raise RfidReaderException("Multiple antennas not supported") from error
             raise error
+        return self._parse_antenna(response)
+
+    def _parse_antenna(self, response: List[str]) -> int:
+        """Parse the response of the antenna query `AT+ANT?`
+
+        Args:
+            response (List[str]): the response lines
+
+        Raises:
+            RfidReaderException: If the response is not expected
+
+        Returns:
+            int: the antenna
+        """
         # +ANT: 2
         try:
             return int(response[0][6:])
@@ -150,6 +216,77 @@ class ReaderAT(RfidReader):
         """
         return await self._send_command(command=command, timeout=timeout)
 
+    async def send_batch(self, commands: List[Union[str, Sequence[Any]]], timeout: float = 2.0) -> List[List[str]]:
+        """Send several AT commands at once and return their responses.
+
+        All commands are written to the reader in a single transfer and the
+        responses are assigned in order. This saves a round trip per command,
+        which makes a noticeable difference when configuring readers over
+        a network connection.
+
+        Args:
+            commands (list): The commands to send. Either a complete command
+                (e.g. "AT+PWR=20") or a sequence with the command and its
+                parameters (e.g. ("AT+PWR", 20)).
+
+            timeout (float, optional): The response timeout per command.
+                Defaults to 2.0 seconds.
+
+        Raises:
+            RfidReaderException: If a reader error occurs. All commands are
+                processed before the first error is raised.
+
+        Returns:
+            List[list[str]]: The line-by-line responses for each command.
+
+        Example:
+            >>> await send_batch([("AT+PWR", 20), ("AT+Q", 4), "AT+INVS?"])
+            [[], [], ['+INVS: 0,1,0']]
+        """
+        return await self._send_commands([(command,) if isinstance(command, str) else tuple(command)
+                                          for command in commands], timeout)
+
+    def enable_settings_cache(self, enable: bool = True) -> None:
+        """En-/disable the cache for the reader settings.
+
+        If enabled, the getters of the reader settings (e.g. `get_antenna()`, `get_power()` or
+        `get_inventory_settings()`) query the reader only once and then return the cached value.
+        Every command that changes a setting - including `send_custom_command()` and `send_batch()`
+        - removes the cached value or updates it with the new value. The cache is cleared when the
+        reader connects, loses the connection or is reset.
+
+        Only enable the cache if no other application changes the reader settings.
+
+        Args:
+            enable (bool, optional): Set to True, to enable the cache. Defaults to True.
+        """
+        if not enable:
+            self._settings_cache = None
+        elif self._settings_cache is None:
+            self._settings_cache = {}
+
+    async def refresh_settings(self, timeout: float = 2.0) -> None:
+        """Query all cached reader settings again.
+
+        The queries are sent in a single batch (see `send_batch()`). Settings that are not
+        supported by the reader are not cached, their getters raise the reader error.
+
+        Args:
+            timeout (float, optional): The response timeout per query. Defaults to 2.0 seconds.
+
+        Raises:
+            RfidReaderException: If the settings cache is not enabled or the reader is not connected.
+        """
+        if self._settings_cache is None:
+            raise RfidReaderException("Settings cache not enabled")
+        queries: Tuple[str, ...] = self._get_setting_queries()
+        responses: List[Any] = await self._send_commands([(query,) for query in queries], timeout,
+                                                         raise_error=False)
+        self._settings_cache.clear()
+        for query, response in zip(queries, responses):
+            if not isinstance(response, RfidReaderException):
+                self._settings_cache[query] = response
+
     # TODO
     async def check_antennas(self) -> None:
         """Check the antennas
@@ -201,6 +338,57 @@ class ReaderAT(RfidReader):
     # Internal methods
     ###############################################################################################
 
+    def _handle_inventory_events_bytes(self, msg: bytes, timestamp: float) -> None:
+        """handle inventory event message, as received. Override for parsing without decoding
+
+        Args:
+            msg (bytes): message
+            timestamp (float): timestamp
+        """
+        self._handle_inventory_events(msg.decode(), timestamp)
+
+    # @override
+    async def disconnect(self) -> None:
+        self._store_profile()
+        await super().disconnect()
+
+    def set_profile_cache(self, cache: Optional[ReaderProfileCache]) -> Optional[ReaderProfileCache]:
+        """Set the cache for the reader profile.
+
+        If the cache contains a profile for the connected reader and the firmware and hardware match,
+        the configuration is restored from the profile. The profiled settings, e.g. the antenna, are
+        still queried in the same transfer as the reader identity (`ATI`), so a setting that was
+        changed by another client or by a custom command replaces the profile value.
+
+        The profile is removed by `reset()`.
+
+        Args:
+            cache (ReaderProfileCache, optional): The profile cache, None to disable it.
+
+        Returns:
+            Optional[ReaderProfileCache]: The previous cache.
+        """
+        old = self._profile_cache
+        self._profile_cache = cache
+        self._store_profile()
+        return old
+
+    def get_profile_cache(self) -> Optional[ReaderProfileCache]:
+        """Return the cache for the reader profile.
+
+        Returns:
+            Optional[ReaderProfileCache]: The profile cache or None.
+        """
+        return self._profile_cache
+
+    # @override
+    def _connection_lost(self, reason) -> None:
+        self._store_profile()
+        if self._settings_cache:
+            self._settings_cache.clear()
+        super()._connection_lost(reason)
+        self._fail_pending_commands("Reader not connected")
+
     def _parse_error_response(self, response: str) -> RfidReaderException:
         """analyse the reader error and return the resulting exception
 
@@ -225,7 +413,7 @@ class ReaderAT(RfidReader):
                 return
             if msg[1] == 'H' and len(msg) == 4:  # +HBT
                 return
-        self._add_data_to_receive_buffer(msg)
+        self._add_response(msg)
 
     # @override
     def _data_received(self, data: str, timestamp: float) -> None:
@@ -251,7 +439,21 @@ class ReaderAT(RfidReader):
                 # +IEV: 2,LOW
                 self._fire_input_changed_event(int(msg[6]), "HIGH" in msg[8:])
                 return
-        self._add_data_to_receive_buffer(msg)
+        self._add_response(msg)
+
+    # @override
+    def _connection_data_received_batch(self, data: List[bytes], timestamp: float) -> None:
+        if self._handle_data != self._data_received or self.get_logger().isEnabledFor(logging.DEBUG):
+            super()._connection_data_received_batch(data, timestamp)
+            return
+        self._last_message_time = timestamp
+        handle_inventory_events = self._handle_inventory_events_bytes
+        for message in data:
+            # continuous inventory events are the bulk of a burst, they are handled without decoding
+            if message[:2] == b'+C' and 0x49 in message[2:4]:  # +CINV +CINVR +CMINV
+                handle_inventory_events(message[:-1], timestamp)
+            else:
+                self._data_received(message.decode(), timestamp)
 
     async def _send_command(self, command: str, *parameters: Any, timeout: float = 2.0) -> List[str]:
         """Send a command to the reader and return the response
@@ -269,74 +471,246 @@ class ReaderAT(RfidReader):
         Returns:
             list[str]: The reader responses. In case of an set command the list is empty
         """
-        # disable 'Too many branches' warning - pylint: disable=R0912
-        # disable 'Too many nested blocks' warning - pylint: disable=R1702
+        return (await self._send_commands([(command, *parameters)], timeout))[0]
+
+    async def _send_commands(self, commands: List[Tuple[Any, ...]], timeout: float = 2.0,
+                             raise_error: bool = True) -> List[Any]:
+        """Send several commands with one transfer and return the responses in order
+
+        Args:
+            commands (List[Tuple]): the commands, each a tuple with the command and its parameters
+
+            timeout (float, optional): The response timeout per command. Defaults to 2.0.
+
+            raise_error (bool, optional): False to return the reader error of a failed command in
+                place of its response, instead of raising the first error. Defaults to True.
+
+        Raises:
+            RfidReaderException: The first reader error, raised after all commands are answered
+
+        Returns:
+            List[list[str]]: The reader responses for each command, or the `RfidReaderException` of
+            a failed command if `raise_error` is False
+        """
         await self._communication_lock.acquire()
+        batch: List[PendingCommand] = []
         try:
             self._clear_response_buffer()
-            send_command = self._prepare_command(command, *parameters)
-            self.get_logger().debug("send %s", send_command)
-            self._send(send_command+"\r")
-            if self._echo_enabled:
+            for command, *parameters in commands:
+                send_command = self._prepare_command(command, *parameters)
+                batch.append(self._add_pending_command(command, send_command))
+                if send_command == "ATE1":
+                    # the reader echoes the following commands of the batch
+                    self._echo_enabled = True
+                self.get_logger().debug("send %s", send_command)
+                if self._settings_cache and not send_command.endswith('?'):
+                    self._invalidate_settings(send_command.split('=', 1)[0])
+            self._send("".join(pending.send_command + "\r" for pending in batch))
+            responses: List[Any] = []
+            error: Optional[RfidReaderException] = None
+            for pending in batch:
                 try:
-                    resp: str = await self._recv(timeout)
-                except TimeoutError as err:
-                    msg: str = "Reader not " + ("responding" if self.get_status()["status"] >= 1 else "connected")
-                    raise RfidReaderException(msg) from err
-                if send_command not in resp:
-                    raise RfidReaderException(
-                        f"Not expected response for {send_command} - {resp}")
-            max_time: float = time() + timeout
-            response: str = ""
-            try:
-                while True:
-                    resp = await self._recv(timeout)
-                    if resp is None:
-                        break
-                    if resp == 'OK':
-                        return response.split("\r") if response else []
-                    if resp == 'ERROR':
-                        try:
-                            msg = response[response.rindex(
-                                "<")+1:response.rindex(">")]
-                            raise self._parse_error_response(msg)
-                        except ValueError:
-                            msg = f"{command} ERROR"
-                        raise RfidReaderException(str(msg))
-                    response = resp
-                    if max_time <= time():
-                        break
-            except TimeoutError:
-                pass
-            if not response:
-                raise RfidReaderException(
-                    f"No reader response for command {send_command}")
-            raise RfidReaderException(
-                f"Wrong response for command {send_command} - {str(response)}")
+                    responses.append(await self._wait_for_response(pending, timeout))
+                except RfidReaderException as err:
+                    error = error if error else err
+                    responses.append(err)
+            if error and raise_error:
+                raise error
+            return responses
         except AttributeError as err:
             self.get_logger().debug("send command error - %s", err)
             raise RfidReaderException("Reader not connected") from err
         finally:
+            for pending in batch:
+                if pending in self._pending_commands:
+                    self._pending_commands.remove(pending)
+                elif pending.future.done() and not pending.future.cancelled():
+                    # the error of a command that was not awaited, e.g. if the batch is cancelled
+                    pending.future.exception()
             self._communication_lock.release()
 
+    def _add_pending_command(self, command: str, send_command: str) -> PendingCommand:
+        """Register a command whose response is expected next
+
+        Args:
+            command (str): the command without parameters
+
+            send_command (str): the command as sent to the reader
+
+        Returns:
+            PendingCommand: the registered command
+        """
+        pending = PendingCommand(command, send_command, self._echo_enabled,
+                                 asyncio.get_running_loop().create_future())
+        self._pending_commands.append(pending)
+        return pending
+
+    async def _wait_for_response(self, pending: PendingCommand, timeout: float) -> List[str]:
+        """Wait until the pending command is completed or the timeout is reached
+
+        Args:
+            pending (PendingCommand): the pending command
+
+            timeout (float): the command deadline in seconds
+
+        Raises:
+            RfidReaderException: The reader response with an error or if the timeout is reached
+
+        Returns:
+            list[str]: The reader responses.
+        """
+        deadline = asyncio.get_running_loop().call_later(timeout, self._expire_command, pending)
+        try:
+            return await pending.future
+        finally:
+            deadline.cancel()
+            try:
+                self._pending_commands.remove(pending)
+            except ValueError:
+                # already completed
+                pass
+
+    def _expire_command(self, pending: PendingCommand) -> None:
+        """Called if the command deadline is reached.
+
+        As the reader answers in order, the commands sent after this one are failed as well.
+        """
+        if pending.future.done():
+            return
+        if pending.expect_echo:
+            msg: str = "Reader not " + ("responding" if self.get_status()["status"] >= 1 else "connected")
+        elif not pending.response:
+            msg = f"No reader response for command {pending.send_command}"
+        else:
+            msg = f"Wrong response for command {pending.send_command} - {pending.response}"
+        self._fail_pending_commands(msg)
+
+    def _add_response(self, msg: str) -> None:
+        """Route a received response line to the oldest pending command
+
+        Args:
+            msg (str): the response line
+        """
+        if not self._pending_commands:
+            self._add_data_to_receive_buffer(msg)
+            return
+        pending: PendingCommand = self._pending_commands[0]
+        if pending.expect_echo:
+            pending.expect_echo = False
+            if pending.send_command not in msg:
+                self._complete_command(RfidReaderException(
+                    f"Not expected response for {pending.send_command} - {msg}"))
+            return
+        if msg == 'OK':
+            self._complete_command(pending.response.split("\r") if pending.response else [])
+        elif msg == 'ERROR':
+            response: str = pending.response
+            try:
+                error: str = response[response.rindex("<")+1:response.rindex(">")]
+            except ValueError:
+                self._complete_command(RfidReaderException(f"{pending.command} ERROR"))
+                return
+            self._complete_command(self._parse_error_response(error))
+        else:
+            pending.response = msg
+
+    def _complete_command(self, result: Any) -> None:
+        """Complete the oldest pending command
+
+        Args:
+            result (Any): the response lines or the resulting exception
+        """
+        pending: PendingCommand = self._pending_commands.popleft()
+        if pending.future.done():
+            return
+        if isinstance(result, BaseException):
+            pending.future.set_exception(result)
+        else:
+            pending.future.set_result(result)
+
+    def _fail_pending_commands(self, reason: str) -> None:
+        """Fail all pending commands, e.g. if the connection is lost"""
+        while self._pending_commands:
+            self._complete_command(RfidReaderException(reason))
+
     def _prepare_command(self, command: str, *parameters: Any) -> str:
         # prepare the command with the AT protocol style
         if not parameters:
             return command
         return command + "=" + ",".join(str(x) for x in parameters if x is not None)
 
-    async def _enable_command_echo(self):
+    async def _prepare_reader_communication(self) -> None:
+        """Prepare the reader for the communication.
+
+        The command echo is enabled and the running inventories are stopped with one transfer, which
+        also contains the reader info, the profile queries, the heartbeat and the input events. The
+        responses are evaluated by `_config_reader()` and `_config_events()`.
+        """
+        self._heartbeat = self._config.get('heartbeat', self._heartbeat)
+        commands: List[Tuple[Any, ...]] = [("ATE1",)]
+        commands.extend((command,) for command in self._get_stop_commands())
+        commands.append(("ATI",))
+        commands.extend((query,) for query in self._get_profile_queries())
+        commands.append(("AT+HBT", self._heartbeat))
+        commands.append(("AT+IEV", 1 if self._cb_input_changed is not None else 0))
         self._echo_enabled = False
-        await self._send_command("ATE1")
-        self._echo_enabled = True
+        responses: List[Any] = await self._send_commands(commands, raise_error=False)
+        self._setup_responses = {command[0]: response for command, response in zip(commands, responses)}
+        self._take_setup_response("ATE1")
+        for command in self._get_stop_commands():
+            try:
+                self._take_setup_response(command)
+            except RfidReaderException as err:
+                msg = str(err)
+                if msg and "is not running" not in msg:
+                    raise err
 
-    async def _prepare_reader_communication(self) -> None:
-        """Override for prepare the reader for the communication"""
-        await self._enable_command_echo()
-        await self.stop_inventory()
+    def _take_setup_response(self, command: str) -> List[str]:
+        """Return the response of a setup command, see `_prepare_reader_communication()`
+
+        Args:
+            command (str): the command without parameters
+
+        Raises:
+            RfidReaderException: The reader error of the command
+
+        Returns:
+            List[str]: the response lines
+        """
+        response: Any = self._setup_responses.pop(command, None)
+        if response is None:
+            raise RfidReaderException(f"No response for {command}")
+        if isinstance(response, RfidReaderException):
+            raise response
+        return response
+
+    def _get_stop_commands(self) -> Tuple[str, ...]:
+        """Return the commands that stop the running inventories when connecting"""
+        return ("AT+BINV",)
+
+    def _get_profile_queries(self) -> Tuple[str, ...]:
+        """Return the queries of the profiled settings, which are sent when connecting"""
+        return ("AT+ANT?",)
+
+    # @override
+    async def _config_events(self) -> None:
+        # the heartbeat and the input events are set by `_prepare_reader_communication()`
+        try:
+            self._take_setup_response("AT+HBT")
+            await RfidReader.set_heartbeat(self, self._heartbeat)
+        except RfidReaderException:
+            self.get_logger().debug("no heartbeat available - connection check is disabled")
+            self._heartbeat = 0
+        try:
+            self._take_setup_response("AT+IEV")
+        except RfidReaderException:
+            self.get_logger().debug("no input events available")
 
     async def _config_reader(self) -> None:
-        info = await self.get_reader_info()
+        self._profile_valid = False
+        if self._settings_cache:
+            self._settings_cache.clear()
+        info = self._parse_reader_info(self._take_setup_response("ATI"))
         # only check reader if decorator is present
         expected = getattr(self, "_expected_reader", None)
         if expected:
@@ -350,9 +724,33 @@ class ReaderAT(RfidReader):
             if firmware_version < expected.get('min_firmware', 1.0):
                 raise RfidReaderException("Reader firmware version too low, please update! " +
                                           f"Minimum {expected.get('min_firmware')} expected, {firmware_version} found")
-        self._config.update(info)
+        if not self._restore_profile(info):
+            self._config.update(info)
+        # the current settings replace the profile values, they may be changed by other clients
+        await self._query_config()
+        self._profile_valid = True
+        self._store_profile()
+
+    def _take_profile_response(self, query: str) -> List[str]:
+        """Return the response of a profile query and store it in the settings cache
+
+        Args:
+            query (str): the query command, e.g. "AT+ANT?"
+
+        Raises:
+            RfidReaderException: The reader error of the query
+
+        Returns:
+            List[str]: the response lines
+        """
+        response: List[str] = self._take_setup_response(query)
+        self._update_setting(query, response)
+        return response
+
+    async def _query_config(self) -> None:
+        """Evaluate the profile queries of the connect, see `_get_profile_queries()`"""
         try:
-            self._config['antenna'] = await self.get_antenna()
+            self._config['antenna'] = self._parse_antenna(self._take_profile_response("AT+ANT?"))
         except RfidReaderException:
             self._config['antenna'] = 1
         # try:
@@ -360,9 +758,92 @@ class ReaderAT(RfidReader):
         # except RfidReaderException as err:
         #     self.get_logger().info("Antenna check: %s", err)
 
+    async def _query_setting(self, query: str) -> List[str]:
+        """Return the response of a setting query, from the settings cache if enabled
+
+        Args:
+            query (str): the query command, e.g. "AT+PWR?"
+
+        Returns:
+            List[str]: the response lines
+        """
+        if self._settings_cache is None:
+            return await self._send_command(query)
+        response: Optional[List[str]] = self._settings_cache.get(query)
+        if response is None:
+            # no await between the response and the caching, a following set command can not be missed
+            response = await self._send_command(query)
+            self._update_setting(query, response)
+        return list(response)
+
+    def _update_setting(self, query: str, response: List[str]) -> None:
+        """Store the response of a setting query in the settings cache, if enabled
+
+        Args:
+            query (str): the query command, e.g. "AT+PWR?"
+
+            response (List[str]): the response lines
+        """
+        if self._settings_cache is not None:
+            self._settings_cache[query] = list(response)
+
+    def _invalidate_settings(self, command: str) -> None:
+        """Remove the cached settings that are changed by a command
+
+        Args:
+            command (str): the command without parameters, e.g. "AT+PWR"
+        """
+        if self._settings_cache is not None:
+            self._settings_cache.pop(command + "?", None)
+
+    def _get_setting_queries(self) -> Tuple[str, ...]:
+        """Return the queries of the settings, which are sent by `refresh_settings()`"""
+        return ("AT+ANT?",)
+
+    def _get_profile_keys(self) -> Tuple[str, ...]:
+        """Return the configuration keys of the reader profile"""
+        return ('firmware', 'firmware_version', 'hardware', 'hardware_version', 'serial_number', 'antenna')
+
+    def _restore_profile(self, info: Dict[str, str]) -> bool:
+        """Restore the configuration from the cached reader profile
+
+        Args:
+            info (Dict[str, str]): the reader info of the connected reader
+
+        Returns:
+            bool: True if the configuration was restored, False if it must be queried
+        """
+        if self._profile_cache is None:
+            return False
+        profile: Optional[Dict[str, Any]] = self._profile_cache.get(info['serial_number'])
+        if profile is None or any(key not in profile for key in self._get_profile_keys()) or \
+                any(profile[key] != value for key, value in info.items()):
+            return False
+        self._config.update(profile)
+        self.get_logger().debug("configuration restored from the profile of %s", info['serial_number'])
+        return True
+
+    def _store_profile(self) -> None:
+        """Store the current configuration as reader profile"""
+        if self._profile_cache is None or not self._profile_valid:
+            return
+        try:
+            self._profile_cache.put(self._config['serial_number'],
+                                    {key: self._config[key] for key in self._get_profile_keys()})
+        except (KeyError, OSError, TypeError) as err:
+            self.get_logger().warning("Reader profile not stored - %s", err)
+
+    def _remove_profile(self) -> None:
+        """Remove the reader profile from the cache"""
+        self._profile_valid = False
+        if self._profile_cache is not None and 'serial_number' in self._config:
+            self._profile_cache.remove(self._config['serial_number'])
+
     async def _reconnect(self, delay_s):
         """Disconnect the reader and re-connect after specified delay.
         """
+        # the reader restarts, e.g. after changing the HID mode
+        self._remove_profile()
         # disconnect
         try:
             await self.disconnect()
@@ -0,0 +1,451 @@
+"""Readers distributed over several worker processes
+"""
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .reader import RfidReader
+from .reader_exception import RfidReaderException
+from .tag_batch import TagBatch
+
+
+class ReaderFleet():
+    """Distributes readers over worker processes, so that the inventories of many readers are parsed
+    on several CPU cores.
+
+    Each worker process runs its own event loop with the reader objects. The readers are created in
+    the workers, so they are added with their class and constructor arguments and addressed by
+    their name::
+
+        fleet = ReaderFleet(workers=4)
+        fleet.add(PulsarLR, "gate_1", "192.168.2.101")
+        fleet.add(DeskIdUhfv2, "desk_1", "/dev/ttyACM0")
+        fleet.set_cb_inventory(lambda name, inventory: print(name, len(inventory)))
+        await fleet.start()
+        failures = await fleet.connect()
+        await fleet.start_inventory()
+        await fleet.call("gate_1", "set_power", 20)
+        ...
+        await fleet.stop()
+
+    The readers are distributed evenly over the workers in the order they are added. The continuous
+    inventories of a reader are collected in its worker for `max_latency` seconds and sent to the
+    parent process in one message, UHF AT readers send `TagBatch` objects. The inventory and status
+    callbacks are called in the event loop of the parent process.
+
+    The worker processes are started with the default start method of `multiprocessing`. With the
+    "spawn" method the code that creates the fleet must be guarded by ``if __name__ == "__main__":``.
+    """
+    # disable 'too many instance attributes' warning - pylint: disable=R0902
+
+    def __init__(self, workers: int = 0, max_latency: float = 0.1, start_method: Optional[str] = None,
+                 tag_batch: bool = True) -> None:
+        """Create a new reader fleet.
+
+        Args:
+            workers (int, optional): The number of worker processes. Defaults to 0 (number of CPUs).
+
+            max_latency (float, optional): The time in seconds the inventories of a reader are
+                collected in the worker before they are sent. Defaults to 0.1.
+
+            start_method (str, optional): The `multiprocessing` start method, e.g. "spawn".
+                Defaults to None (the default start method).
+
+            tag_batch (bool, optional): Whether the UHF AT readers provide their inventories as
+                `TagBatch`, see `UhfReaderAT.enable_tag_batch()`. Defaults to True.
+
+        Raises:
+            ValueError: If a parameter is not valid.
+        """
+        if workers < 0 or max_latency < 0:
+            raise ValueError("workers and max_latency must not be negative")
+        self._workers: int = workers or os.cpu_count() or 1
+        self._max_latency: float = max_latency
+        self._tag_batch: bool = tag_batch
+        self._context = multiprocessing.get_context(start_method)
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        # reader name -> (worker index, reader class, arguments, keyword arguments)
+        self._readers: Dict[str, Tuple[int, type, tuple, dict]] = {}
+        self._reader_status: Dict[str, Dict[str, Any]] = {}
+        self._processes: List[Any] = []
+        self._connections: List[Any] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_ids = itertools.count()
+        # request id -> (worker index, future)
+        self._requests: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._cb_inventory: Optional[Callable[[str, Any], None]] = None
+        self._cb_status: Optional[Callable[[Dict[str, Any]], None]] = None
+
+    def __len__(self) -> int:
+        return len(self._readers)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._readers
+
+    def add(self, reader_class: type, name: str, *args: Any, **kwargs: Any) -> None:
+        """Add a reader, it is created in its worker with ``reader_class(name, *args, **kwargs)``.
+
+        Args:
+            reader_class (type): The reader class, e.g. `PulsarLR`.
+
+            name (str): The reader name, must be unique within the fleet.
+
+            *args: The other constructor arguments, e.g. the address or the serial port.
+
+            **kwargs: The keyword constructor arguments.
+
+        Raises:
+            ValueError: If the fleet already contains a reader with the same name.
+            RfidReaderException: If the fleet is already started.
+        """
+        if name in self._readers:
+            raise ValueError(f"Reader name already used - {name}")
+        if self._processes:
+            raise RfidReaderException("Readers must be added before the fleet is started")
+        self._readers[name] = (len(self._readers) % self._workers, reader_class, args, kwargs)
+        self._reader_status[name] = {'type': 'status', 'instance': name, 'status': RfidReader.BUSY,
+                                     'message': 'initialised', 'timestamp': 0.0}
+
+    def get_worker(self, name: str) -> int:
+        """Return the worker of a reader.
+
+        Args:
+            name (str): The reader name.
+
+        Raises:
+            KeyError: If the fleet contains no reader with the name.
+
+        Returns:
+            int: The index of the worker process.
+        """
+        return self._readers[name][0]
+
+    def get_reader_names(self) -> List[str]:
+        """Return the names of the readers.
+
+        Returns:
+            List[str]: The reader names.
+        """
+        return list(self._readers)
+
+    def get_reader_status(self) -> Dict[str, Dict[str, Any]]:
+        """Return the last reported status of the readers.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The status dictionary of each reader by the reader name.
+        """
+        return {name: status.copy() for name, status in self._reader_status.items()}
+
+    def set_cb_inventory(self, callback: Optional[Callable[[str, Any], None]]) -> Optional[Callable]:
+        """Set the callback for the continuous inventories. The callback has the following arguments:
+        * name (str) - the reader name
+        * inventory (TagBatch or List[Tag]) - the transponders of the reader since the last call
+
+        Returns:
+            Optional[Callable]: The old callback.
+        """
+        old = self._cb_inventory
+        self._cb_inventory = callback
+        return old
+
+    def set_cb_status(self, callback: Optional[Callable[[Dict[str, Any]], None]]) -> Optional[Callable]:
+        """Set the callback for status changes of the readers. The callback has the following arguments:
+        * status (Dict[str, Any]) - the reader status, the 'instance' key contains the reader name
+
+        Returns:
+            Optional[Callable]: The old callback.
+        """
+        old = self._cb_status
+        self._cb_status = callback
+        return old
+
+    async def start(self) -> None:
+        """Start the worker processes and create the readers.
+
+        Raises:
+            RfidReaderException: If the fleet is already started or a reader could not be created.
+        """
+        if self._processes:
+            raise RfidReaderException("Fleet already started")
+        self._loop = asyncio.get_running_loop()
+        for index in range(min(self._workers, max(len(self._readers), 1))):
+            parent_connection, worker_connection = self._context.Pipe()
+            process = self._context.Process(target=_run_worker, name=f"ReaderFleet-{index}",
+                                            args=(worker_connection, self._max_latency, self._tag_batch),
+                                            daemon=True)
+            process.start()
+            worker_connection.close()
+            self._processes.append(process)
+            self._connections.append(parent_connection)
+            threading.Thread(target=self._receive, args=(index, parent_connection), daemon=True).start()
+        results = await asyncio.gather(
+            *(self._request(worker, "add", name, reader_class, args, kwargs)
+              for name, (worker, reader_class, args, kwargs) in self._readers.items()),
+            return_exceptions=True)
+        for name, result in zip(self._readers, results):
+            if isinstance(result, Exception):
+                await self.stop()
+                raise RfidReaderException(f"Reader {name} not created - {result}")
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Disconnect the readers and stop the worker processes.
+
+        Args:
+            timeout (float, optional): The time in seconds to wait for a worker, before it is
+                terminated. Defaults to 5.0.
+        """
+        for connection in self._connections:
+            try:
+                connection.send(("stop",))
+            except OSError:
+                pass
+        loop = asyncio.get_running_loop()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                self._logger.warning("Worker %s did not stop, terminate it", process.name)
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._processes = []
+        self._connections = []
+
+    async def call(self, name: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a method of a reader in its worker process, e.g. ``await fleet.call("gate_1", "set_power", 20)``.
+
+        Coroutines are awaited in the worker. The arguments and the result must be picklable.
+
+        Args:
+            name (str): The reader name.
+
+            method (str): The name of the reader method.
+
+            *args: The arguments of the method.
+
+            **kwargs: The keyword arguments of the method.
+
+        Raises:
+            KeyError: If the fleet contains no reader with the name.
+            RfidReaderException: If the fleet is not started or the worker process stopped. The
+                exceptions of the method are raised as well.
+
+        Returns:
+            Any: The result of the method.
+        """
+        return await self._request(self._readers[name][0], "call", name, method, args, kwargs)
+
+    async def call_all(self, method: str, *args: Any, **kwargs: Any) -> Dict[str, Exception]:
+        """Call a method of all readers concurrently.
+
+        Args:
+            method (str): The name of the reader method.
+
+            *args: The arguments of the method.
+
+            **kwargs: The keyword arguments of the method.
+
+        Returns:
+            Dict[str, Exception]: The errors by the reader name.
+        """
+        results = await asyncio.gather(*(self.call(name, method, *args, **kwargs) for name in self._readers),
+                                       return_exceptions=True)
+        errors: Dict[str, Exception] = {}
+        for name, result in zip(self._readers, results):
+            if isinstance(result, Exception):
+                self._logger.warning("%s of reader %s failed - %s", method, name, result)
+                errors[name] = result
+        return errors
+
+    async def connect(self, timeout: float = 5.0) -> Dict[str, Exception]:
+        """Connect all readers.
+
+        Args:
+            timeout (float, optional): Maximum waiting time for the connection of a reader.
+                Defaults to 5.0 seconds.
+
+        Returns:
+            Dict[str, Exception]: The errors of the readers that could not be connected, by the
+            reader name. Empty if all readers are connected.
+        """
+        return await self.call_all("connect", timeout)
+
+    async def disconnect(self) -> Dict[str, Exception]:
+        """Disconnect all readers.
+
+        Returns:
+            Dict[str, Exception]: The errors by the reader name.
+        """
+        return await self.call_all("disconnect")
+
+    async def start_inventory(self) -> Dict[str, Exception]:
+        """Start the continuous inventory of all readers.
+
+        Returns:
+            Dict[str, Exception]: The errors of the readers that did not start, by the reader name.
+        """
+        return await self.call_all("start_inventory")
+
+    async def stop_inventory(self) -> Dict[str, Exception]:
+        """Stop the continuous inventory of all readers.
+
+        Returns:
+            Dict[str, Exception]: The errors of the readers that did not stop, by the reader name.
+        """
+        return await self.call_all("stop_inventory")
+
+    ###############################################################################################
+    # Internal methods
+    ###############################################################################################
+
+    async def _request(self, worker: int, *message: Any) -> Any:
+        """ Sends a request to a worker and waits for the result """
+        if not self._processes:
+            raise RfidReaderException("Fleet not started")
+        request_id: int = next(self._request_ids)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._requests[request_id] = (worker, future)
+        try:
+            self._connections[worker].send((message[0], request_id) + message[1:])
+        except OSError as err:
+            del self._requests[request_id]
+            raise RfidReaderException(f"Worker {worker} not available - {err}") from err
+        return await future
+
+    def _receive(self, worker: int, connection: Any) -> None:
+        """ Receives the messages of a worker, runs in a thread per worker """
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                break
+            self._loop.call_soon_threadsafe(self._handle_message, message)  # type: ignore
+        try:
+            self._loop.call_soon_threadsafe(self._worker_stopped, worker)  # type: ignore
+        except RuntimeError:
+            # event loop already closed
+            pass
+
+    def _handle_message(self, message: Tuple) -> None:
+        if message[0] == "inventory":
+            if self._cb_inventory:
+                self._cb_inventory(message[1], message[2])
+        elif message[0] == "status":
+            self._reader_status[message[1]] = message[2]
+            if self._cb_status:
+                self._cb_status(message[2])
+        elif message[0] == "result":
+            _, future = self._requests.pop(message[1], (0, None))
+            if future is None or future.done():
+                return
+            if message[3] is not None:
+                future.set_exception(message[3])
+            else:
+                future.set_result(message[2])
+
+    def _worker_stopped(self, worker: int) -> None:
+        """ Fails the open requests of a stopped worker """
+        for request_id, (request_worker, future) in list(self._requests.items()):
+            if request_worker == worker:
+                del self._requests[request_id]
+                if not future.done():
+                    future.set_exception(RfidReaderException(f"Worker {worker} stopped"))
+
+
+def _run_worker(connection: Any, max_latency: float, tag_batch: bool) -> None:
+    """ Entry point of a worker process """
+    asyncio.run(_FleetWorker(connection, max_latency, tag_batch).run())
+
+
+class _FleetWorker():
+    """ The readers of a worker process """
+    # disable Too few public methods warning - pylint: disable=R0903
+
+    def __init__(self, connection: Any, max_latency: float, tag_batch: bool) -> None:
+        self._connection = connection
+        self._max_latency: float = max_latency
+        self._tag_batch: bool = tag_batch
+        self._readers: Dict[str, RfidReader] = {}
+        # collected inventories by the reader name
+        self._inventories: Dict[str, Any] = {}
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
+    async def run(self) -> None:
+        """ Executes the requests of the parent process until it sends stop """
+        loop = asyncio.get_running_loop()
+        tasks = set()
+        while True:
+            try:
+                message = await loop.run_in_executor(None, self._connection.recv)
+            except (EOFError, OSError):
+                break
+            if message[0] == "stop":
+                break
+            task = asyncio.ensure_future(self._execute(*message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        for reader in self._readers.values():
+            try:
+                await reader.disconnect()
+            except RfidReaderException:
+                pass
+        self._flush_inventories()
+        self._connection.close()
+
+    async def _execute(self, command: str, request_id: int, name: str, *args: Any) -> None:
+        # disable 'broad exception' warning, the errors are raised in the parent - pylint: disable=W0718
+        try:
+            if command == "add":
+                self._add_reader(name, *args)
+                result = None
+            else:
+                method, method_args, method_kwargs = args
+                result = getattr(self._readers[name], method)(*method_args, **method_kwargs)
+                if asyncio.iscoroutine(result):
+                    result = await result
+        except Exception as err:
+            self._send(("result", request_id, None, err))
+            return
+        self._send(("result", request_id, result, None))
+
+    def _add_reader(self, name: str, reader_class: type, args: tuple, kwargs: dict) -> None:
+        reader: RfidReader = reader_class(name, *args, **kwargs)
+        if self._tag_batch and hasattr(reader, 'enable_tag_batch'):
+            reader.enable_tag_batch()  # type: ignore
+        reader.set_cb_inventory(lambda inventory: self._add_inventory(name, inventory))
+        reader.set_cb_status(lambda status: self._send(("status", name, status)))
+        self._readers[name] = reader
+
+    def _add_inventory(self, name: str, inventory: Any) -> None:
+        if not inventory:
+            return
+        collected = self._inventories.get(name)
+        if collected is None:
+            self._inventories[name] = inventory if isinstance(inventory, TagBatch) else list(inventory)
+        else:
+            collected.extend(inventory)
+        if not self._max_latency:
+            self._flush_inventories()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(self._max_latency, self._flush_inventories)
+
+    def _flush_inventories(self) -> None:
+        self._flush_timer = None
+        inventories, self._inventories = self._inventories, {}
+        for name, inventory in inventories.items():
+            self._send(("inventory", name, inventory))
+
+    def _send(self, message: Tuple) -> None:
+        try:
+            self._connection.send(message)
+        except (pickle.PicklingError, TypeError, AttributeError, ValueError) as err:
+            # not picklable
+            if message[0] == "result":
+                self._connection.send(("result", message[1], None, RfidReaderException(f"{err}")))
+        except OSError:
+            # parent process stopped
+            pass
@@ -0,0 +1,334 @@
+"""Management of several readers on one event loop
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .inventory_stream import InventoryStream
+from .reader import RfidReader
+from .status_class import BaseClass
+from .tag import Tag
+
+
+class ReaderTag(NamedTuple):
+    """A transponder of a merged inventory stream, with the reader and the antenna that found it
+    """
+    reader: str
+    antenna: int
+    tag: Tag
+
+
+class ReaderGroup(BaseClass):
+    """Connects, starts and stops the inventories of several readers and merges their inventories.
+
+    The readers are identified by their names, which must be unique within the group::
+
+        group = ReaderGroup([PulsarLR("gate_1", "192.168.2.101"), PulsarLR("gate_2", "192.168.2.102")])
+        failures = await group.connect()
+        await group.start_inventory()
+        async for tags in group.stream_inventory(max_latency=0.5):
+            for reader_tag in tags:
+                print(reader_tag.reader, reader_tag.antenna, reader_tag.tag.get_id())
+
+    The group operations run concurrently for all readers, at most `max_concurrency` at a time, and
+    the connects are started `stagger` seconds apart. The automatic reconnects of the readers after a
+    lost connection are limited in the same way: at most `max_concurrency` readers reconnect at the
+    same time, each after a random delay of up to `stagger` seconds per reader in the group.
+
+    The group status is RUNNING if all readers are running, WARNING if a reader has an error or
+    warning, ERROR if all readers have an error and BUSY otherwise. Its status callback is called if
+    the group status changes, the callbacks set on the readers are still called.
+    """
+    # disable 'too many instance attributes' warning - pylint: disable=R0902
+
+    RUNNING = RfidReader.RUNNING
+    BUSY = RfidReader.BUSY
+    ERROR = RfidReader.ERROR
+    WARNING = RfidReader.WARNING
+
+    def __init__(self, readers: Iterable[RfidReader] = (), name: str = "", max_concurrency: int = 8,
+                 stagger: float = 0.1) -> None:
+        """Create a new reader group.
+
+        Args:
+            readers (Iterable[RfidReader], optional): The readers of the group. Defaults to ().
+
+            name (str, optional): The name of the group. Defaults to "ReaderGroup".
+
+            max_concurrency (int, optional): The maximum number of readers that connect, reconnect
+                or execute a command at the same time. Defaults to 8.
+
+            stagger (float, optional): The time in seconds between the starts of the connects.
+                Defaults to 0.1.
+
+        Raises:
+            ValueError: If a parameter is not valid or a reader name is used twice.
+        """
+        if max_concurrency < 1 or stagger < 0:
+            raise ValueError("max_concurrency must be positive, stagger must not be negative")
+        super().__init__(name)
+        self._max_concurrency: int = max_concurrency
+        self._stagger: float = stagger
+        self._readers: Dict[str, RfidReader] = {}
+        # status callbacks of the readers before they were added
+        self._reader_callbacks: Dict[str, Optional[Callable]] = {}
+        self._reconnect_semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        for reader in readers:
+            self.add(reader)
+        self._update_group_status()
+
+    def __len__(self) -> int:
+        return len(self._readers)
+
+    def __iter__(self) -> Iterator[RfidReader]:
+        return iter(list(self._readers.values()))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._readers
+
+    def add(self, reader: RfidReader) -> None:
+        """Add a reader to the group.
+
+        Args:
+            reader (RfidReader): The reader.
+
+        Raises:
+            ValueError: If the group already contains a reader with the same name.
+        """
+        name: str = reader.get_name()
+        if name in self._readers:
+            raise ValueError(f"Reader name already used - {name}")
+        self._readers[name] = reader
+        self._reader_callbacks[name] = reader.set_cb_status(
+            lambda status: self._reader_status_changed(name, status))
+        self._update_reconnect_limits()
+        self._update_group_status()
+
+    def remove(self, name: str) -> RfidReader:
+        """Remove a reader from the group, the reader is not disconnected.
+
+        Args:
+            name (str): The name of the reader.
+
+        Raises:
+            KeyError: If the group contains no reader with the name.
+
+        Returns:
+            RfidReader: The removed reader.
+        """
+        reader: RfidReader = self._readers.pop(name)
+        reader.set_cb_status(self._reader_callbacks.pop(name))
+        reader.set_reconnect_limit(None)
+        self._update_reconnect_limits()
+        self._update_group_status()
+        return reader
+
+    def get_reader(self, name: str) -> RfidReader:
+        """Return a reader of the group.
+
+        Args:
+            name (str): The name of the reader.
+
+        Raises:
+            KeyError: If the group contains no reader with the name.
+
+        Returns:
+            RfidReader: The reader.
+        """
+        return self._readers[name]
+
+    def get_readers(self) -> List[RfidReader]:
+        """Return the readers of the group.
+
+        Returns:
+            List[RfidReader]: The readers.
+        """
+        return list(self._readers.values())
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return the status of the group.
+
+        The status information dictionary contains the following keys:
+
+        * instance (str): Name of the group.
+        * status (int): Group status enum (RUNNING = 1, BUSY = 0,
+          ERROR = -1, WARNING = -2).
+        * message (str): Status message, the number of running readers.
+        * timestamp (float): Timestamp of the last status change.
+
+        Returns:
+            Dict[str, Any]: Dictionary with status information.
+        """
+        return self._status
+
+    def get_reader_status(self) -> Dict[str, Dict[str, Any]]:
+        """Return the status of the readers.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The status dictionary of each reader by the reader name.
+        """
+        return {name: reader.get_status().copy() for name, reader in self._readers.items()}
+
+    async def connect(self, timeout: float = 5.0) -> Dict[str, Exception]:
+        """Connect all readers. The connects are started `stagger` seconds apart.
+
+        Args:
+            timeout (float, optional): Maximum waiting time for the connection of a reader.
+                Defaults to 5.0 seconds.
+
+        Returns:
+            Dict[str, Exception]: The errors of the readers that could not be connected, by the
+            reader name. Empty if all readers are connected.
+        """
+        return await self._run_all("connect", lambda reader: reader.connect(timeout), self._stagger)
+
+    async def disconnect(self) -> Dict[str, Exception]:
+        """Disconnect all readers.
+
+        Returns:
+            Dict[str, Exception]: The errors by the reader name.
+        """
+        return await self._run_all("disconnect", lambda reader: reader.disconnect())
+
+    async def start_inventory(self) -> Dict[str, Exception]:
+        """Start the continuous inventory of all readers.
+
+        Returns:
+            Dict[str, Exception]: The errors of the readers that did not start, by the reader name.
+        """
+        return await self._run_all("start inventory", lambda reader: reader.start_inventory())
+
+    async def stop_inventory(self) -> Dict[str, Exception]:
+        """Stop the continuous inventory of all readers.
+
+        Returns:
+            Dict[str, Exception]: The errors of the readers that did not stop, by the reader name.
+        """
+        return await self._run_all("stop inventory", lambda reader: reader.stop_inventory())
+
+    def stream_inventory(self, max_batch: int = 0, max_latency: float = 0.0, max_size: int = 10000,
+                         overflow: str = InventoryStream.OVERFLOW_DROP_OLDEST) -> InventoryStream:
+        """Return an async iterator for the transponders of the continuous inventories of all readers.
+
+        The batches contain `ReaderTag` tuples with the reader name, the antenna and the transponder.
+        Each reader has its own stream with the overflow mode, "coalesce" merges the transponders of
+        a reader. In the "block" mode a reader connection is paused if the merged stream is full and
+        its own stream is full. The stream ends if all readers are disconnected or the ``async for``
+        loop is left. Readers added to the group later are not part of the stream.
+
+        Must be called while the event loop is running.
+
+        Args:
+            max_batch (int, optional): The maximum number of transponders per batch, 0 for no limit.
+                Defaults to 0.
+            max_latency (float, optional): The time in seconds to wait for more transponders, before
+                a batch with less than `max_batch` transponders is returned. Defaults to 0.0.
+            max_size (int, optional): The maximum number of queued transponders, of the merged stream
+                and of each reader stream. Defaults to 10000.
+            overflow (str, optional): What happens if a queue is full, see `RfidReader.stream_inventory`.
+                Defaults to "drop_oldest".
+
+        Raises:
+            ValueError: If a parameter is not valid.
+
+        Returns:
+            InventoryStream: the merged stream
+        """
+        # disable 'Too many (positional) arguments/local variables' warning - pylint: disable=R0913,R0914,R0917
+        # the reader is not known in the queue of the merged stream, the transponders are merged per reader
+        merged_overflow: str = InventoryStream.OVERFLOW_DROP_OLDEST \
+            if overflow == InventoryStream.OVERFLOW_COALESCE else overflow
+        resume: asyncio.Event = asyncio.Event()
+        resume.set()
+        streams: List[InventoryStream] = []
+        pumps: List[asyncio.Task] = []
+
+        def set_paused(_stream: InventoryStream, paused: bool) -> None:
+            if paused:
+                resume.clear()
+            else:
+                resume.set()
+
+        def closed(_stream: InventoryStream) -> None:
+            for stream in streams:
+                stream.close()
+            for pump in pumps:
+                pump.cancel()
+
+        def pump_done(_task: asyncio.Task) -> None:
+            if all(pump.done() for pump in pumps):
+                merged.close()
+
+        merged = InventoryStream(max_batch, max_latency, max_size, merged_overflow, set_paused, closed)
+        for name, reader in self._readers.items():
+            stream: InventoryStream = reader.stream_inventory(max_size=max_size, overflow=overflow)
+            streams.append(stream)
+            pumps.append(asyncio.ensure_future(self._forward_inventory(name, stream, merged, resume)))
+        for pump in pumps:
+            pump.add_done_callback(pump_done)
+        if not pumps:
+            merged.close()
+        return merged
+
+    ###############################################################################################
+    # Internal methods
+    ###############################################################################################
+
+    @staticmethod
+    async def _forward_inventory(name: str, stream: InventoryStream, merged: InventoryStream,
+                                 resume: asyncio.Event) -> None:
+        """ Adds the transponders of a reader stream to the merged stream """
+        async for tags in stream:
+            # wait while the merged stream is full (block mode), the reader stream fills up
+            await resume.wait()
+            merged.put([ReaderTag(name, tag.get_antenna(), tag) for tag in tags])  # type: ignore
+
+    async def _run_all(self, action: str, function: Callable[[RfidReader], Awaitable[None]],
+                       stagger: float = 0.0) -> Dict[str, Exception]:
+        """ Runs the function for all readers concurrently, returns the errors by the reader name """
+        readers: List[RfidReader] = list(self._readers.values())
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self._max_concurrency)
+        loop = asyncio.get_running_loop()
+        start: float = loop.time()
+
+        async def run(index: int, reader: RfidReader) -> None:
+            if stagger:
+                await asyncio.sleep(max(start + index * stagger - loop.time(), 0.0))
+            async with semaphore:
+                await function(reader)
+
+        results = await asyncio.gather(*(run(index, reader) for index, reader in enumerate(readers)),
+                                       return_exceptions=True)
+        errors: Dict[str, Exception] = {}
+        for reader, result in zip(readers, results):
+            if isinstance(result, Exception):
+                self.get_logger().warning("%s of reader %s failed - %s", action, reader.get_name(), result)
+                errors[reader.get_name()] = result
+        return errors
+
+    def _update_reconnect_limits(self) -> None:
+        """ Spreads the automatic reconnects of the readers over the stagger time of the group """
+        max_delay: float = self._stagger * len(self._readers)
+        for reader in self._readers.values():
+            reader.set_reconnect_limit(self._reconnect_semaphore, max_delay)
+
+    def _reader_status_changed(self, name: str, status: Dict[str, Any]) -> None:
+        callback: Optional[Callable] = self._reader_callbacks.get(name)
+        if callback:
+            callback(status)
+        self._update_group_status()
+
+    def _update_group_status(self) -> None:
+        """ Updates the group status from the reader status """
+        states: List[int] = [reader.get_status()['status'] for reader in self._readers.values()]
+        running: int = states.count(self.RUNNING)
+        message: str = f"{running} of {len(states)} readers running"
+        if not states:
+            self._update_status(self.BUSY, "no readers")
+        elif running == len(states):
+            self._update_status(self.RUNNING, message)
+        elif states.count(self.ERROR) == len(states):
+            self._update_status(self.ERROR, message)
+        elif self.ERROR in states or self.WARNING in states:
+            self._update_status(self.WARNING, message)
+        else:
+            self._update_status(self.BUSY, message)
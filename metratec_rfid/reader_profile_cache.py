@@ -0,0 +1,102 @@
+"""Cache for the identity and configuration of known readers
+"""
+import copy
+import json
+import os
+from typing import Any, Dict, Optional
+
+
+class ReaderProfileCache():
+    """Stores the profiles of known readers by their serial number.
+
+    A profile contains the reader identity (firmware, hardware, serial number) and the configuration
+    the SDK reads from the reader while connecting, e.g. the antenna and the inventory settings.
+    A reader with a cached profile only verifies its identity while connecting and skips the other
+    configuration queries, so a reconnect after a network interruption is faster.
+
+    The profiles are kept in memory and optionally persisted to a JSON file, so that they are also
+    available after a restart of the application. Several readers can share one cache.
+
+    The profiles are updated by the readers when they are configured, disconnected or lose the
+    connection. Remove the profile of a reader if its configuration was changed by another
+    application.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Create a new profile cache.
+
+        Args:
+            path (str, optional): The JSON file for the profiles. The profiles are loaded from the
+                file if it exists and saved on every change. Defaults to None (memory only).
+        """
+        self._path: Optional[str] = path
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                self._profiles = json.load(file)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, serial_number: object) -> bool:
+        return serial_number in self._profiles
+
+    def get_path(self) -> Optional[str]:
+        """Return the file of the profiles.
+
+        Returns:
+            Optional[str]: The path of the JSON file or None if the profiles are only kept in memory.
+        """
+        return self._path
+
+    def get(self, serial_number: str) -> Optional[Dict[str, Any]]:
+        """Return the profile of a reader.
+
+        Args:
+            serial_number (str): The serial number of the reader.
+
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the profile or None if the reader is not known.
+        """
+        profile: Optional[Dict[str, Any]] = self._profiles.get(serial_number)
+        return copy.deepcopy(profile) if profile is not None else None
+
+    def put(self, serial_number: str, profile: Dict[str, Any]) -> None:
+        """Store the profile of a reader.
+
+        Args:
+            serial_number (str): The serial number of the reader.
+
+            profile (Dict[str, Any]): The profile, must be serializable as JSON.
+        """
+        profile = copy.deepcopy(profile)
+        if self._profiles.get(serial_number) == profile:
+            return
+        self._profiles[serial_number] = profile
+        self.save()
+
+    def remove(self, serial_number: str) -> None:
+        """Remove the profile of a reader, the reader is configured completely with the next connect.
+
+        Args:
+            serial_number (str): The serial number of the reader.
+        """
+        if self._profiles.pop(serial_number, None) is not None:
+            self.save()
+
+    def clear(self) -> None:
+        """Remove all profiles.
+        """
+        self._profiles.clear()
+        self.save()
+
+    def save(self) -> None:
+        """Write the profiles to the file, if a file is set.
+        """
+        if not self._path:
+            return
+        temp_path: str = self._path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(self._profiles, file, indent=2, sort_keys=True)
+        # replace the file at once, a crash does not leave a partially written file
+        os.replace(temp_path, self._path)
@@ -186,3 +186,12 @@ class Tag(dict):
             self[key] = value
         elif key in self:
             del self[key]
+
+    # the internal setters of the readers and the merges, the compact transponders skip the frozen
+    # check in them (see `CompactTag.freeze()`)
+    _set_first_seen = set_first_seen
+    _set_last_seen = set_last_seen
+    _set_antenna = set_antenna
+    _set_seen_count = set_seen_count
+    _set_error_message = set_error_message
+    _set_value = set_value
@@ -0,0 +1,249 @@
+"""Columnar UHF inventory result
+"""
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from .uhf_tag import UhfTag
+
+
+class TagBatch():
+    """Columnar container for the transponders of an inventory.
+
+    Stores the tag values in parallel arrays instead of one `UhfTag` per transponder, which
+    saves memory and construction time for large inventories. `UhfTag` objects are only
+    created when the batch is iterated or indexed.
+
+    Like the values of a `UhfTag`, a RSSI, antenna or seen count of 0 and an empty TID mean
+    that the value is not available.
+    """
+    # disable 'too many instance attributes' warning - pylint: disable=R0902
+
+    def __init__(self) -> None:
+        # the EPC and TID hex values are stored back to back, with the end offset of each value
+        self._epc_data: bytearray = bytearray()
+        self._epc_ends: array = array('I')
+        self._tid_data: bytearray = bytearray()
+        self._tid_ends: array = array('I')
+        self._rssi: array = array('h')
+        self._antennas: array = array('H')
+        self._seen_counts: array = array('I')
+        self._timestamps: array = array('d')
+        self._phases: Optional[List[Optional[List[str]]]] = None
+
+    @classmethod
+    def from_columns(cls, epcs: Sequence[bytes], timestamp: float, tids: Optional[Sequence[bytes]] = None,
+                     rssi: Optional[Sequence[int]] = None,
+                     seen_counts: Optional[Sequence[int]] = None) -> 'TagBatch':
+        """Create a batch from column values of one inventory.
+
+        Args:
+            epcs (Sequence[bytes]): The EPC values.
+
+            timestamp (float): The timestamp of the inventory.
+
+            tids (Sequence[bytes], optional): The TID values. Defaults to None.
+
+            rssi (Sequence[int], optional): The RSSI values. Defaults to None.
+
+            seen_counts (Sequence[int], optional): The seen counts. Defaults to 1 for each transponder.
+
+        Returns:
+            TagBatch: the new batch
+        """
+        # disable protected member access warning - pylint: disable=W0212
+        batch: TagBatch = cls()
+        count: int = len(epcs)
+        batch._epc_data += b"".join(epcs)
+        batch._epc_ends.extend(accumulate(map(len, epcs)))
+        if tids is not None:
+            batch._tid_data += b"".join(tids)
+            batch._tid_ends.extend(accumulate(map(len, tids)))
+        else:
+            batch._tid_ends = array('I', [0]) * count
+        batch._rssi = array('h', rssi) if rssi is not None else array('h', [0]) * count
+        batch._antennas = array('H', [0]) * count
+        batch._seen_counts = array('I', seen_counts) if seen_counts is not None else array('I', [1]) * count
+        batch._timestamps = array('d', [timestamp]) * count
+        return batch
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __iter__(self) -> Iterator[UhfTag]:
+        for index in range(len(self._timestamps)):
+            yield self._create_tag(index)
+
+    def __getitem__(self, index: int) -> UhfTag:
+        if index < 0:
+            index += len(self._timestamps)
+        if not 0 <= index < len(self._timestamps):
+            raise IndexError("TagBatch index out of range")
+        return self._create_tag(index)
+
+    def __repr__(self) -> str:
+        return f"TagBatch({self.to_list()})"
+
+    def append(self, epc: Union[str, bytes], timestamp: float, tid: Union[str, bytes, None] = None,
+               rssi: int = 0, antenna: int = 0, seen_count: int = 1, phase: Optional[List[str]] = None) -> None:
+        """Add a transponder.
+
+        Args:
+            epc (Union[str, bytes]): The EPC value.
+
+            timestamp (float): The timestamp of the inventory.
+
+            tid (Union[str, bytes, None], optional): The TID value. Defaults to None.
+
+            rssi (int, optional): The RSSI value. Defaults to 0 (not available).
+
+            antenna (int, optional): The antenna. Defaults to 0 (not available).
+
+            seen_count (int, optional): The seen count. Defaults to 1.
+
+            phase (List[str], optional): The phase information. Defaults to None.
+        """
+        # disable 'Too many (positional) arguments' warning - pylint: disable=R0913,R0917
+        self._epc_data += epc.encode() if isinstance(epc, str) else epc
+        self._epc_ends.append(len(self._epc_data))
+        if tid:
+            self._tid_data += tid.encode() if isinstance(tid, str) else tid
+        self._tid_ends.append(len(self._tid_data))
+        self._rssi.append(rssi)
+        self._antennas.append(antenna)
+        self._seen_counts.append(seen_count)
+        self._timestamps.append(timestamp)
+        if phase is not None and self._phases is None:
+            self._phases = [None] * (len(self._timestamps) - 1)
+        if self._phases is not None:
+            self._phases.append(phase)
+
+    def extend(self, other: 'TagBatch') -> None:
+        """Add all transponders of another batch.
+
+        Args:
+            other (TagBatch): The batch to add.
+        """
+        # disable protected member access warning - pylint: disable=W0212
+        epc_offset: int = len(self._epc_data)
+        tid_offset: int = len(self._tid_data)
+        self._epc_data += other._epc_data
+        self._epc_ends.extend(end + epc_offset for end in other._epc_ends)
+        self._tid_data += other._tid_data
+        self._tid_ends.extend(end + tid_offset for end in other._tid_ends)
+        if other._phases is not None and self._phases is None:
+            self._phases = [None] * len(self._timestamps)
+        if self._phases is not None:
+            self._phases.extend(other._phases if other._phases is not None else [None] * len(other))
+        self._rssi.extend(other._rssi)
+        self._antennas.extend(other._antennas)
+        self._seen_counts.extend(other._seen_counts)
+        self._timestamps.extend(other._timestamps)
+
+    def set_antenna(self, antenna: int) -> None:
+        """Set the antenna of all transponders.
+
+        Args:
+            antenna (int): The antenna.
+        """
+        self._antennas = array('H', [antenna]) * len(self._timestamps)
+
+    def get_epcs(self) -> List[str]:
+        """Return the EPC values.
+
+        Returns:
+            List[str]: The EPC value of each transponder.
+        """
+        return self._split(self._epc_data, self._epc_ends)
+
+    def get_tids(self) -> List[str]:
+        """Return the TID values.
+
+        Returns:
+            List[str]: The TID value of each transponder, an empty string if not available.
+        """
+        return self._split(self._tid_data, self._tid_ends)
+
+    def get_rssi(self) -> array:
+        """Return the RSSI values.
+
+        Returns:
+            array: The RSSI value of each transponder, 0 if not available.
+        """
+        return self._rssi
+
+    def get_antennas(self) -> array:
+        """Return the antennas.
+
+        Returns:
+            array: The antenna of each transponder, 0 if not available.
+        """
+        return self._antennas
+
+    def get_seen_counts(self) -> array:
+        """Return the seen counts.
+
+        Returns:
+            array: The seen count of each transponder.
+        """
+        return self._seen_counts
+
+    def get_timestamps(self) -> array:
+        """Return the timestamps.
+
+        Returns:
+            array: The timestamp (first and last seen) of each transponder.
+        """
+        return self._timestamps
+
+    def to_list(self) -> List[UhfTag]:
+        """Return the transponders as `UhfTag` objects.
+
+        Returns:
+            List[UhfTag]: The transponders.
+        """
+        return list(self)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Return the columns as NumPy arrays. Requires the optional numpy package.
+
+        Raises:
+            ImportError: If numpy is not installed.
+
+        Returns:
+            Dict[str, Any]: arrays with the keys 'epc', 'tid', 'rssi', 'antenna', 'seen_count'
+            and 'timestamp'
+        """
+        # disable import outside toplevel warning - pylint: disable=C0415
+        try:
+            import numpy
+        except ImportError as err:
+            raise ImportError("TagBatch.to_numpy() requires numpy - pip install numpy") from err
+        return {'epc': numpy.array(self.get_epcs()),
+                'tid': numpy.array(self.get_tids()),
+                'rssi': numpy.array(self._rssi, dtype=numpy.int16),
+                'antenna': numpy.array(self._antennas, dtype=numpy.uint16),
+                'seen_count': numpy.array(self._seen_counts, dtype=numpy.uint32),
+                'timestamp': numpy.array(self._timestamps, dtype=numpy.float64)}
+
+    def _create_tag(self, index: int) -> UhfTag:
+        epc_start: int = self._epc_ends[index - 1] if index else 0
+        tid_start: int = self._tid_ends[index - 1] if index else 0
+        tag: UhfTag = UhfTag(self._epc_data[epc_start:self._epc_ends[index]].decode(), self._timestamps[index],
+                             tid=self._tid_data[tid_start:self._tid_ends[index]].decode() or None,
+                             seen_count=self._seen_counts[index], rssi=self._rssi[index] or None)
+        if self._phases is not None and self._phases[index] is not None:
+            tag['phase'] = self._phases[index]
+        if self._antennas[index]:
+            tag.set_antenna(self._antennas[index])
+        return tag
+
+    @staticmethod
+    def _split(data: bytearray, ends: array) -> List[str]:
+        text: str = data.decode()
+        values: List[str] = []
+        start: int = 0
+        for end in ends:
+            values.append(text[start:end])
+            start = end
+        return values
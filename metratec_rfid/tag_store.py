@@ -0,0 +1,146 @@
+"""Bounded store for the transponders of continuous inventories
+"""
+import copy
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+from .tag import Tag
+
+
+class TagStore():
+    """Store for the transponders found by continuous inventories without a callback.
+
+    Transponders with the same identifier are merged: the seen counts are added and the last seen
+    timestamp is updated. Merging is synchronous and needs constant time per transponder. The seen
+    counts are also summed up per antenna.
+
+    The number of stored transponders is limited. If the limit is reached, the transponder that was
+    not seen for the longest time is removed and counted as evicted.
+
+    The merged values are written to the first stored object of a transponder. If the added objects
+    are also passed to other consumers, the store can keep copies instead.
+    """
+
+    DEFAULT_MAX_SIZE: int = 100000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, copy_tags: bool = False) -> None:
+        """Create a new store.
+
+        Args:
+            max_size (int, optional): The maximum number of transponders, 0 for no limit.
+                Defaults to 100000.
+
+            copy_tags (bool, optional): Store copies of the added transponders, so the merges do not
+                change the added objects. Defaults to False.
+        """
+        # ordered by the time the transponders were last seen, the oldest first
+        self._tags: 'OrderedDict[str, Tag]' = OrderedDict()
+        self._max_size: int = max_size
+        self._copy_tags: bool = copy_tags
+        self._evicted: int = 0
+        # seen count totals by antenna, -1 for transponders without antenna information
+        self._antenna_counts: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __contains__(self, tag_id: object) -> bool:
+        return tag_id in self._tags
+
+    def get_max_size(self) -> int:
+        """Return the maximum number of transponders.
+
+        Returns:
+            int: The maximum number of transponders, 0 for no limit.
+        """
+        return self._max_size
+
+    def set_max_size(self, max_size: int) -> None:
+        """Set the maximum number of transponders. Removes the oldest transponders if the store is
+        larger than the new limit.
+
+        Args:
+            max_size (int): The maximum number of transponders, 0 for no limit.
+
+        Raises:
+            ValueError: If the maximum size is negative.
+        """
+        if max_size < 0:
+            raise ValueError(f"Maximum size must not be negative - {max_size}")
+        self._max_size = max_size
+        self._evict()
+
+    def get_evicted_count(self) -> int:
+        """Return the number of transponders that were removed because the store was full.
+
+        Returns:
+            int: The number of evicted transponders since the creation or the last `clear()`.
+        """
+        return self._evicted
+
+    def merge(self, inventory: Iterable[Tag]) -> None:
+        """Add the transponders of an inventory.
+
+        Args:
+            inventory (Iterable[Tag]): The transponders to add.
+        """
+        # disable protected member access warning - pylint: disable=W0212
+        # the merges use the internal setters, the compact transponders are frozen
+        tags = self._tags
+        antenna_counts = self._antenna_counts
+        for tag in inventory:
+            tag_id: str = tag.get_id()
+            seen_count: int = tag.get_seen_count()
+            antenna: int = tag.get_antenna()
+            antenna_counts[antenna] = antenna_counts.get(antenna, 0) + seen_count
+            current_tag = tags.get(tag_id)
+            if current_tag is None:
+                tags[tag_id] = copy.copy(tag) if self._copy_tags else tag
+                continue
+            current_tag._set_seen_count(current_tag.get_seen_count() + seen_count)
+            current_tag._set_last_seen(tag.get_last_seen())
+            tags.move_to_end(tag_id)
+        self._evict()
+
+    def pop_all(self, max_count: int = 0) -> List[Tag]:
+        """Remove and return the stored transponders.
+
+        Args:
+            max_count (int, optional): The maximum number of transponders to return, the least
+                recently seen are returned first. Defaults to 0 (all).
+
+        Returns:
+            List[Tag]: The transponders, the least recently seen first.
+        """
+        tags = self._tags
+        if max_count and max_count < len(tags):
+            return [tags.popitem(last=False)[1] for _ in range(max_count)]
+        inventory: List[Tag] = list(tags.values())
+        tags.clear()
+        return inventory
+
+    def pop_antenna_counts(self) -> Dict[int, int]:
+        """Return and reset the seen count totals per antenna.
+
+        Returns:
+            Dict[int, int]: The summed up seen counts of all merged transponders by antenna, with the
+            key -1 for transponders without antenna information.
+        """
+        antenna_counts: Dict[int, int] = self._antenna_counts
+        self._antenna_counts = {}
+        return antenna_counts
+
+    def clear(self) -> None:
+        """Remove all transponders and reset the evicted counter and the antenna totals.
+        """
+        self._tags.clear()
+        self._evicted = 0
+        self._antenna_counts = {}
+
+    def _evict(self) -> None:
+        if not self._max_size:
+            return
+        tags = self._tags
+        while len(tags) > self._max_size:
+            tags.popitem(last=False)
+            self._evicted += 1
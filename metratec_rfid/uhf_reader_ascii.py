@@ -24,12 +24,13 @@ class UhfReaderAscii(ReaderAscii):
         self._last_write_data: str = ""
         self._inv_called: bool = False
         self._last_inventory: Dict[str, Any] = {'timestamp': None, 'memory': ""}
+        self._inventory_response: Optional[asyncio.Future] = None
         self._input_debounce_time = 0.05
         self._tasks_input: Dict[int, asyncio.Task] = {}
 
     # @override
-    def set_cb_inventory(self, callback: Optional[Callable[[List[UhfTag]], None]]
-                         ) -> Optional[Callable[[List[UhfTag]], None]]:
+    def set_cb_inventory(self, callback: Optional[Callable[[List[UhfTag]], None]], window: float = 0.0,
+                         window_rounds: int = 0) -> Optional[Callable[[List[UhfTag]], None]]:
         """Set the callback for a new inventory.
 
         Define a callback which will be triggered whenever a new inventory
@@ -37,8 +38,18 @@ class UhfReaderAscii(ReaderAscii):
 
         * tags (List[UhfTag]) - List of transponders found in the inventory.
 
+        If a window is set, the continuous inventory rounds are coalesced and the callback is
+        called once per window, with the transponders merged by their identifier.
+
         Args:
             callback (Callable): Reference to the callback function to use.
+            window (float, optional): The window time in seconds, 0 for no time window.
+                Defaults to 0.0.
+            window_rounds (int, optional): The maximum number of rounds per window, 0 for no
+                limit. Defaults to 0.
+
+        Raises:
+            ValueError: If a window parameter is negative.
 
         Returns:
             Optional[Callable]: The old callback.
@@ -49,7 +60,7 @@ class UhfReaderAscii(ReaderAscii):
             >>>         print(tag.get_epc())
             >>> set_cb_inventory(my_callback)
         """
-        return super().set_cb_inventory(callback)
+        return super().set_cb_inventory(callback, window, window_rounds)
 
     # @override
     async def enable_input_events(self, enable: bool = True) -> None:
@@ -361,6 +372,7 @@ class UhfReaderAscii(ReaderAscii):
             an error `Dict['errors', List[UhfTag]]` and the timestamp
             of the execution `Dict['timestamp', float]`.
         """
+        # disable protected member access warning - pylint: disable=W0212
         if len(new_epc) % 4:
             raise RfidReaderException(" The new EPC length must be a multiple of 4")
         # prepare new data block 01 with the epc length
@@ -388,10 +400,10 @@ class UhfReaderAscii(ReaderAscii):
         response = await self.write_tag_memory(epc_data, 1, 'EPC', ssl)
         # Deactivate rfid field - so that the transponders are reset
         await self.disable_rfid_field()
-        # update transponders
+        # update transponders, the compact transponders are frozen
         for transponder in response["transponders"]:
-            transponder.set_value("old_epc", transponder.get_epc())
-            transponder.set_epc(new_epc)
+            transponder._set_value("old_epc", transponder.get_epc())
+            transponder._set_epc(new_epc)
         return response
 
     async def read_tag_tid(self, start: int = 0, length: int = 2, ssl: bool = False) -> Dict[str, Any]:
@@ -877,16 +889,13 @@ class UhfReaderAscii(ReaderAscii):
         try:
             self._last_inventory['timestamp'] = None
             self._last_inventory['request'] = self._prepare_command(command, *parameters)
+            self._inventory_response = self._create_response_event()
             self._send_command(command, *parameters)
-            max_time = time() + timeout
-            while max_time > time():
-                await asyncio.sleep(0.01)
-                if self._last_inventory['timestamp']:
-                    break
-            else:
+            if not await self._wait_for_response_event(self._inventory_response, timeout):
                 raise TimeoutError("no reader response for inventory command")
             return self._last_inventory
         finally:
+            self._inventory_response = None
             self._communication_lock.release()
 
     # @override
@@ -900,12 +909,13 @@ class UhfReaderAscii(ReaderAscii):
         lines_count = len(lines) - 1
         inventory: List[UhfTag] = []
         inventory_error: List[UhfTag] = []
+        tag_class: type = self._get_tag_class(UhfTag)
         i = 0
         while i < lines_count:
             line = lines[i]
             i += 1
             # check error or additional data
-            new_tag = UhfTag("", timestamp)
+            new_tag = tag_class("", timestamp)
             if 3 >= len(line) or line[3] == " ":
                 if line[0] == "A":
                     if line.startswith("ARP"):  # ARP  Antenna report
@@ -982,8 +992,9 @@ class UhfReaderAscii(ReaderAscii):
             if self._additional_trs:
                 new_tag.set_rssi(int(lines[i]))
                 i += 1
-        self._last_inventory['transponders'] = inventory
-        self._last_inventory['errors'] = inventory_error
+        self._last_inventory['transponders'] = self._freeze_tags(inventory)  # type: ignore
+        self._last_inventory['errors'] = self._freeze_tags(inventory_error)  # type: ignore
         self._last_inventory['timestamp'] = timestamp
+        self._set_response_event(self._inventory_response, timestamp)
         if self._inv_called:
             self._fire_inventory_event(inventory)  # type: ignore
@@ -4,8 +4,10 @@ metratec uhf reader gen2
 version 1.3.5
 """
 
+import asyncio
+from operator import methodcaller
 from time import time
-from typing import Callable, Optional, Any, Dict, List, Union
+from typing import Callable, Optional, Any, Dict, List, Tuple, Union
 
 from .connection.connection import Connection
 
@@ -13,6 +15,10 @@ from .reader_exception import RfidReaderException
 from .reader_at import ReaderAT
 from .reader import RfidReader
 from .uhf_tag import UhfTag
+from .compact_tag import CompactUhfTag
+from .tag_batch import TagBatch
+from .tag_store import TagStore
+from .inventory_stream import InventoryStream
 
 
 # disable 'Too many lines in module' warning - pylint: disable=C0302
@@ -26,16 +32,26 @@ class UhfReaderAT(ReaderAT):
     # disable 'Too many instance attributes' warning - pylint: disable=R0902
     # disable 'Too many arguments' warning - pylint: disable=R0913
 
+    # the commands of the settings with a single parameter, see `apply_settings()`
+    _SETTING_COMMANDS: Dict[str, str] = {'region': "AT+REG", 'power': "AT+PWR", 'channel_mask': "AT+CMSK",
+                                         'session': "AT+SES", 'rf_mode': "AT+RFM", 'antenna': "AT+ANT"}
+
     def __init__(self, instance: str, connection: Connection) -> None:
         super().__init__(instance, connection)
         self._cb_inventory_report: Optional[Callable[[List[UhfTag]], None]] = None
         self._fire_empty_reports = False
+        self._inventory_report: TagStore = TagStore()
+        self._inventory_report_event: asyncio.Event = asyncio.Event()
+        self._inventory_report_streams: List[InventoryStream] = []
         self._config: dict = {}
         self._ignore_errors = False
+        self._tag_batch: bool = False
+        # inventory event parsers for the current inventory settings, by prefix length and report mode
+        self._inventory_parsers: Dict[Tuple[int, bool], Callable[[List[bytes], float], List[UhfTag]]] = {}
 
     # @override
-    def set_cb_inventory(self, callback: Optional[Callable[[List[UhfTag]], None]]
-                         ) -> Optional[Callable[[List[UhfTag]], None]]:
+    def set_cb_inventory(self, callback: Optional[Callable[[List[UhfTag]], None]], window: float = 0.0,
+                         window_rounds: int = 0) -> Optional[Callable[[List[UhfTag]], None]]:
         """Set the callback for a new inventory.
 
         Define a callback which will be triggered whenever a new inventory
@@ -43,8 +59,18 @@ class UhfReaderAT(ReaderAT):
 
         * tags (List[UhfTag]) - List of transponders found in the inventory.
 
+        If a window is set, the continuous inventory rounds are coalesced and the callback is
+        called once per window, with the transponders merged by their identifier.
+
         Args:
             callback (Callable): Reference to the callback function to use.
+            window (float, optional): The window time in seconds, 0 for no time window.
+                Defaults to 0.0.
+            window_rounds (int, optional): The maximum number of rounds per window, 0 for no
+                limit. Defaults to 0.
+
+        Raises:
+            ValueError: If a window parameter is negative.
 
         Returns:
             Optional[Callable]: The old callback.
@@ -55,7 +81,7 @@ class UhfReaderAT(ReaderAT):
             >>>         print(tag.get_epc())
             >>> set_cb_inventory(my_callback)
         """
-        return super().set_cb_inventory(callback)
+        return super().set_cb_inventory(callback, window, window_rounds)
 
     def set_cb_inventory_report(self, callback: Optional[Callable[[List[UhfTag]], None]]
                                 ) -> Optional[Callable[[List[UhfTag]], None]]:
@@ -90,6 +116,25 @@ class UhfReaderAT(ReaderAT):
         """
         self._fire_empty_reports = enable
 
+    def enable_tag_batch(self, enable: bool = True) -> None:
+        """En-/disable columnar inventory results.
+
+        If enabled, `get_inventory()`, `get_inventory_report()`, `get_inventory_multi()` and the
+        continuous inventory callbacks provide a `TagBatch` instead of a list of `UhfTag` objects.
+        A `TagBatch` stores the tag values in arrays and creates the `UhfTag` objects only when
+        it is iterated, which is much faster and smaller for large inventories.
+
+        Args:
+            enable (bool, optional): Set to True, to enable tag batches. Defaults to True.
+        """
+        self._tag_batch = enable
+        self._inventory_parsers.clear()
+
+    # @override
+    def enable_compact_tags(self, enable: bool = True) -> None:
+        super().enable_compact_tags(enable)
+        self._inventory_parsers.clear()
+
     async def set_region(self, region: str) -> None:
         """Set the used UHF region.
 
@@ -113,7 +158,7 @@ class UhfReaderAT(ReaderAT):
         Returns:
             str: The currently used UHF region.
         """
-        response: List[str] = await self._send_command("AT+REG?")
+        response: List[str] = await self._query_setting("AT+REG?")
         # +REG: ETSI_LOWER
         try:
             return response[0][6:]
@@ -162,7 +207,7 @@ class UhfReaderAT(ReaderAT):
         Returns:
             int: The expected number of tags.
         """
-        response: List[str] = await self._send_command("AT+Q?")
+        response: List[str] = await self._query_setting("AT+Q?")
         # +Q: 4,2,15
         try:
             setting: List[str] = response[0][4:].split(",")
@@ -209,7 +254,7 @@ class UhfReaderAT(ReaderAT):
         Returns:
             dict: Dictionary with keys 'q_start', 'q_min' and 'q_max'.
         """
-        response: List[str] = await self._send_command("AT+Q?")
+        response: List[str] = await self._query_setting("AT+Q?")
         # +Q: 4,2,15
         try:
             setting: List[str] = response[0][4:].split(",")
@@ -229,7 +274,7 @@ class UhfReaderAT(ReaderAT):
         Returns:
             Dict[str, Any]: Dictionary with 'tag_size', 'min_tags' and 'max_tags' entries.
         """
-        response: List[str] = await self._send_command("AT+Q?")
+        response: List[str] = await self._query_setting("AT+Q?")
         # +Q: 4,2,15
         try:
             setting: List[str] = response[0][4:].split(",")
@@ -253,7 +298,7 @@ class UhfReaderAT(ReaderAT):
             'tid_query_length', 'standby_timeout' and 'sjc_step_size'.
         """
         try:
-            responses: List[str] = await self._send_command("AT+IST?")
+            responses: List[str] = await self._query_setting("AT+IST?")
             misc: Dict[str, Any] = {}
             for resp in responses:
                 split = resp[5:].split(",")
@@ -357,7 +402,7 @@ class UhfReaderAT(ReaderAT):
             Dict[str, Any]: Mask settings with keys 'memory', 'start',
             'mask' and 'bit_length'.
         """
-        responses: List[str] = await self._send_command('AT+BMSK?')
+        responses: List[str] = await self._query_setting('AT+BMSK?')
         # +BMSK: EPC,0,0000
         # +BMSK: OFF
         data: List[str] = responses[0][7:].split(',')
@@ -400,7 +445,7 @@ class UhfReaderAT(ReaderAT):
 
         """
 
-        response: List[str] = await self._send_command('AT+CMSK?')
+        response: List[str] = await self._query_setting('AT+CMSK?')
 
         # +CMSK: 0000FFFFFFFFFFFF
         try:
@@ -518,7 +563,7 @@ class UhfReaderAT(ReaderAT):
         Returns:
             int: The current power level in dBm.
         """
-        response: List[str] = await self._send_command("AT+PWR?")
+        response: List[str] = await self._query_setting("AT+PWR?")
         try:
             try:
                 # assuming single value "+PWR: 20"
@@ -544,7 +589,20 @@ class UhfReaderAT(ReaderAT):
             Dict[str, Any]: Inventory settings with keys 'only_new_tag', 'with_rssi',
             'with_tid', 'fast_start', 'phase', 'select' and 'target'.
         """
-        responses: List[str] = await self._send_command("AT+INVS?")
+        return self._parse_inventory_settings(await self._query_setting("AT+INVS?"))
+
+    def _parse_inventory_settings(self, responses: List[str]) -> Dict[str, Any]:
+        """Parse the response of the inventory settings query `AT+INVS?`
+
+        Args:
+            responses (List[str]): the response lines
+
+        Raises:
+            RfidReaderException: If the response is not expected
+
+        Returns:
+            Dict[str, Any]: the inventory settings
+        """
         # AT+INVS=ONT, RSSI, TID, FastStart, PHASE
         # +INVS: 0,1,0
         data: List[str] = responses[0][7:].split(',')
@@ -601,55 +659,71 @@ class UhfReaderAT(ReaderAT):
             RfidReaderException: If a reader error occurs.
         """
         # disable 'Too many positional arguments' warning - pylint: disable=R0917
-        # disable 'Too many branches' warning - pylint: disable=R0912
-        def bti(value: bool):
-            return '1' if value else '0'
+        parameters, update = self._prepare_inventory_settings({
+            'only_new_tag': only_new_tag, 'with_rssi': with_rssi, 'with_tid': with_tid, 'fast_start': fast_start,
+            'phase': phase, 'select': select, 'target': target, 'rssi_threshold': rssi_threshold})
+        await self._send_command("AT+INVS", *parameters)
+        # update configuration
+        self._config['inventory'].update(update)
+        self._inventory_parsers.clear()
+
+    async def apply_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply several reader settings at once.
+
+        All settings are sent to the reader in a single batch (see `send_batch()`),
+        which is much faster than calling the single setter methods one after
+        another, especially over a network connection.
+
+        The following keys are supported:
+
+        * 'region' (str) - see `set_region()`
+        * 'power' (int) - see `set_power()`
+        * 'q_value' (int or dict) - Start Q value or a dictionary with the
+          keys 'q_start', 'q_min' and 'q_max', see `set_q_value()`
+        * 'inventory_settings' (dict) - Keyword arguments of `set_inventory_settings()`
+        * 'mask' (dict) - Keyword arguments of `set_mask()` or None to reset the mask
+        * 'channel_mask' (str) - see `set_channel_mask()`
+        * 'session' (str) - see `set_selected_session()`
+        * 'rf_mode' (int) - see `set_rf_mode()`
+        * 'antenna' (int) - see `set_antenna()`
+        * 'antenna_powers' (List[int]) - see `set_antenna_powers()`, only for
+          readers with multiple antennas
+        * 'antenna_multiplex' (int or List[int]) - see `set_antenna_multiplex()`,
+          only for readers with multiple antennas
 
-        config: Dict[str, Any] = self._config['inventory']
-        config_size = len(config)
-
-        parameters: list[Any] = []
-        parameters.append(bti(only_new_tag) if only_new_tag is not None else bti(config['only_new_tag']))
-        parameters.append(bti(with_rssi) if with_rssi is not None else bti(config['with_rssi']))
-        parameters.append(bti(with_tid) if with_tid is not None else bti(config['with_tid']))
-        if config_size >= 4:
-            parameters.append(bti(fast_start) if fast_start is not None else bti(config['fast_start']))
-        if config_size >= 5:
-            parameters.append(bti(phase) if phase is not None else bti(config['phase']))
-        if config_size >= 6:
-            parameters.append(select if select is not None else config['select'])
-        if config_size >= 7:
-            parameters.append(target if target is not None else config['target'])
-        if config_size >= 8:
-            parameters.append(rssi_threshold if rssi_threshold is not None else config['rssi_threshold'])
+        Args:
+            settings (Dict[str, Any]): The settings to apply. The settings
+                are sent in the order of the dictionary.
 
-        await self._send_command("AT+INVS", *parameters)
+        Raises:
+            RfidReaderException: If a setting is unknown or a reader error occurs.
+                All settings are processed before the first error is raised, the
+                configuration of the successful settings is updated.
 
-        # update configuration
-        if only_new_tag is not None:
-            config['only_new_tag'] = only_new_tag
-        if with_rssi is not None:
-            config['with_rssi'] = with_rssi
-        if with_tid is not None:
-            config['with_tid'] = with_tid
-        if config_size >= 4 and fast_start is not None:
-            config['fast_start'] = fast_start
-        if config_size >= 5 and phase is not None:
-            config['phase'] = phase
-        if config_size >= 6 and select is not None:
-            config['select'] = select
-        if config_size >= 7 and target is not None:
-            config['target'] = target
-        if config_size >= 8 and rssi_threshold is not None:
-            config['rssi_threshold'] = rssi_threshold
+        Example:
+            >>> await apply_settings({'power': 20, 'q_value': 4,
+            >>>                       'inventory_settings': {'with_rssi': True}})
+        """
+        commands: List[Tuple[Any, ...]] = [self._prepare_setting_command(key, value)
+                                           for key, value in settings.items()]
+        responses: List[Any] = await self._send_commands(commands, raise_error=False)
+        error: Optional[RfidReaderException] = None
+        for (key, value), response in zip(settings.items(), responses):
+            if isinstance(response, RfidReaderException):
+                error = error if error else response
+            elif key == 'inventory_settings':
+                self._config['inventory'].update(self._prepare_inventory_settings(value)[1])
+                self._inventory_parsers.clear()
+            elif key == 'antenna':
+                self._config['antenna'] = value
+        if error:
+            raise error
 
     # @override
     async def get_inventory(self) -> List[UhfTag]:
         responses: List[str] = await self._send_command("AT+INV")
         inventory: List[UhfTag] = self._parse_inventory(responses, time())
-        current_antenna = self._config.get('antenna', 1)
-        for tag in inventory:
-            tag.set_antenna(current_antenna)
+        self._set_inventory_antenna(inventory, self._config.get('antenna', 1))
         self._fire_inventory_event(inventory, False)  # type: ignore
         return inventory
 
@@ -732,6 +806,7 @@ class UhfReaderAT(ReaderAT):
         responses: List[str] = await self._send_command("AT+READ", memory, start, length, epc_mask)
         timestamp: float = time()
         inventory: List[UhfTag] = []
+        tag_class: type = self._get_tag_class(UhfTag)
         for response in responses:
             # +READ: 3034257BF468D480000003EE,OK,0000
             # +READ: <No tags found>
@@ -742,7 +817,7 @@ class UhfReaderAT(ReaderAT):
                     pass
                 continue
             info: List[str] = response[7:].split(',')
-            tag: UhfTag = UhfTag(info[0], timestamp)
+            tag: UhfTag = tag_class(info[0], timestamp)
             try:
                 if info[1] == 'OK':
                     tag.set_value(memory.lower(), info[2])
@@ -753,7 +828,7 @@ class UhfReaderAT(ReaderAT):
                 # ignore index errors ... response not valid (+READ: <No tags found during inventory>)
                 pass
             inventory.append(tag)
-        return inventory
+        return self._freeze_tags(inventory)  # type: ignore
 
     async def read_tag_usr(self, start: int = 0, length: int = 1, epc_mask: Optional[str] = None) -> List[UhfTag]:
         """Read the user memory (USR) of all transponders found.
@@ -904,6 +979,8 @@ class UhfReaderAT(ReaderAT):
 
     async def _write_tag_epc(self, new_epc: str, start: int) -> List[UhfTag]:
         # disable 'Too many branches' warning - pylint: disable=R0912
+        # disable protected member access warning - pylint: disable=W0212
+        # the returned transponders are frozen, they are updated with the internal setters
         tags: dict[str, UhfTag] = {}
 
         epc_words: int = int(len(new_epc) / 4)
@@ -929,8 +1006,8 @@ class UhfReaderAT(ReaderAT):
             tags[tag.get_id()] = tag
             if not tag.has_error():
                 old_epc: str = tag.get_id()
-                tag.set_epc(new_epc)
-                tag.set_value("old_epc", old_epc)
+                tag._set_epc(new_epc)
+                tag._set_value("old_epc", old_epc)
         # write length
         pc_byte |= epc_length_byte
         inventory_pc = await self.write_tag_data(f"{pc_byte:04X}", 0, 'PC')
@@ -940,13 +1017,13 @@ class UhfReaderAT(ReaderAT):
                 if tag_pc.has_error():
                     if not tag_epc.has_error():
                         # write new epc length not ok
-                        tag_epc.set_error_message(f"EPC written, EPC length not updated: {tag_pc.get_error_message()}")
+                        tag_epc._set_error_message(f"EPC written, EPC length not updated: {tag_pc.get_error_message()}")
                     else:
                         # both not successful:
-                        tag_epc.set_error_message(f"EPC not written: {tag_epc.get_error_message()}")
+                        tag_epc._set_error_message(f"EPC not written: {tag_epc.get_error_message()}")
             elif not tag_pc.has_error():
                 # tag epc length was updated but tag not found in write EPC
-                tag_pc.set_error_message("EPC length updated, but EPC not written")
+                tag_pc._set_error_message("EPC length updated, but EPC not written")
                 tags[tag_pc.get_id()] = tag_pc
             # else: both epc write and epc length was not successful...ignore tag
         return list(tags.values())
@@ -1186,6 +1263,9 @@ class UhfReaderAT(ReaderAT):
             except RfidReaderException:
                 # ignore reader exceptions
                 pass
+        self._inventory_report.clear()
+        for stream in list(self._inventory_report_streams):
+            stream.close()
         return await super().disconnect()
 
     # @override
@@ -1202,6 +1282,67 @@ class UhfReaderAT(ReaderAT):
         """
         return await super().fetch_inventory(wait_for_tags)  # type: ignore
 
+    async def fetch_inventory_report(self, wait_for_tags: bool = True) -> Dict[str, Any]:
+        """
+        Can be called when a continuous inventory report has been started and no report callback is
+        set. Returns the transponders of all reports since the last call, merged by their EPC.
+
+        The seen counts of a transponder found in several reports are summed up. The seen counts are
+        also summed up per antenna, so the transponders found on several antennas are still counted
+        for each antenna.
+
+        Args:
+            wait_for_tags (bool): Set to true, to wait until transponders are available.
+
+        Returns:
+            Dict[str, Any]: The transponders `Dict['transponders', List[UhfTag]]` and the summed up
+            seen counts per antenna `Dict['antennas', Dict[int, int]]`.
+        """
+        if wait_for_tags:
+            while not self._inventory_report:
+                self._inventory_report_event.clear()
+                await self._inventory_report_event.wait()
+        return {'transponders': self._inventory_report.pop_all(),
+                'antennas': self._inventory_report.pop_antenna_counts()}
+
+    def stream_inventory_report(self, max_batch: int = 0, max_latency: float = 0.0, max_size: int = 10000,
+                                overflow: str = InventoryStream.OVERFLOW_DROP_OLDEST) -> InventoryStream:
+        """Return an async iterator for the transponders of continuous inventory reports.
+
+        Works like `stream_inventory()` for the reports of `start_inventory_report()`.
+
+            >>> async for tags in reader.stream_inventory_report(overflow="coalesce"):
+            >>>     print(len(tags))
+
+        Args:
+            max_batch (int, optional): The maximum number of transponders per batch, 0 for no limit.
+                Defaults to 0.
+            max_latency (float, optional): The time in seconds to wait for more transponders, before
+                a batch with less than `max_batch` transponders is returned. Defaults to 0.0.
+            max_size (int, optional): The maximum number of queued transponders. Defaults to 10000.
+            overflow (str, optional): "drop_oldest", "block" or "coalesce", see `stream_inventory()`.
+                Defaults to "drop_oldest".
+
+        Raises:
+            ValueError: If a parameter is not valid.
+
+        Returns:
+            InventoryStream: the stream, also provides the number of dropped transponders
+        """
+        return self._create_inventory_stream(self._inventory_report_streams, max_batch, max_latency, max_size,
+                                             overflow)
+
+    def get_inventory_report_store(self) -> TagStore:
+        """Return the store for the transponders of continuous inventory reports without a callback.
+
+        The transponders are returned by `fetch_inventory_report()`. Use the store to change the
+        maximum number of transponders or to get the number of evicted transponders.
+
+        Returns:
+            TagStore: the transponder store
+        """
+        return self._inventory_report
+
     async def call_impinj_authentication_service(self) -> List[Dict[str, Any]]:
         """Run the Impinj Authentication Service.
 
@@ -1252,7 +1393,7 @@ class UhfReaderAT(ReaderAT):
             str: The currently selected session.
 
         """
-        responses: List[str] = await self._send_command("AT+SES?")
+        responses: List[str] = await self._query_setting("AT+SES?")
         # +SES: AUTO
         return responses[0][6:]
 
@@ -1285,7 +1426,7 @@ class UhfReaderAT(ReaderAT):
             Dict[str, bool]: Settings 'fast_id' and 'tag_focus'.
 
         """
-        responses: List[str] = await self._send_command("AT+ICS?")
+        responses: List[str] = await self._query_setting("AT+ICS?")
         # +ICS: 0,0
         data: List[str] = responses[0][6:].split(',')
         try:
@@ -1332,7 +1473,7 @@ class UhfReaderAT(ReaderAT):
             int: The currently set RF mode value.
 
         """
-        responses: List[str] = await self._send_command("AT+RFM?")
+        responses: List[str] = await self._query_setting("AT+RFM?")
         # +RFM: 223
         return int(responses[0][6:])
 
@@ -1417,31 +1558,131 @@ class UhfReaderAT(ReaderAT):
     ###############################################################################################
 
     # @override
-    async def _prepare_reader_communication(self) -> None:
-        await super()._prepare_reader_communication()
-        await self.stop_inventory_report()
+    def _get_stop_commands(self) -> Tuple[str, ...]:
+        return super()._get_stop_commands() + ("AT+BINVR",)
+
+    # @override
+    def _get_profile_queries(self) -> Tuple[str, ...]:
+        return super()._get_profile_queries() + ("AT+INVS?",)
+
+    # @override
+    async def _query_config(self) -> None:
+        # the parsers depend on the inventory settings
+        self._inventory_parsers.clear()
+        self._config['inventory'] = self._parse_inventory_settings(self._take_profile_response("AT+INVS?"))
+        await super()._query_config()
+
+    # @override
+    def _get_profile_keys(self) -> Tuple[str, ...]:
+        return super()._get_profile_keys() + ('inventory',)
 
     # @override
-    async def _config_reader(self) -> None:
-        self._config['inventory'] = await self.get_inventory_settings()
-        await super()._config_reader()
+    def _get_setting_queries(self) -> Tuple[str, ...]:
+        return super()._get_setting_queries() + ("AT+REG?", "AT+PWR?", "AT+Q?", "AT+INVS?", "AT+BMSK?", "AT+CMSK?",
+                                                 "AT+SES?", "AT+ICS?", "AT+RFM?", "AT+IST?")
+
+    # @override
+    def _invalidate_settings(self, command: str) -> None:
+        if command == "AT+REG":
+            # the region limits the other rf settings
+            if self._settings_cache is not None:
+                self._settings_cache.clear()
+        elif command == "AT+MSK":
+            super()._invalidate_settings("AT+BMSK")
+        else:
+            super()._invalidate_settings(command)
+
+    def _prepare_inventory_settings(self, settings: Dict[str, Any]) -> Tuple[List[Any], Dict[str, Any]]:
+        """Prepare the AT+INVS parameters
+
+        Args:
+            settings (Dict[str, Any]): the new inventory settings, None or missing values are not changed
+
+        Raises:
+            RfidReaderException: if a setting is unknown
+
+        Returns:
+            Tuple[List[Any], Dict[str, Any]]: the command parameters and the resulting configuration update
+        """
+        def bti(value: bool):
+            return '1' if value else '0'
+
+        config: Dict[str, Any] = self._config['inventory']
+        # the reader supports the settings up to the number of values it reports
+        keys: List[str] = ['only_new_tag', 'with_rssi', 'with_tid', 'fast_start', 'phase', 'select', 'target',
+                           'rssi_threshold'][:max(len(config), 3)]
+        for key in settings:
+            if key not in ('only_new_tag', 'with_rssi', 'with_tid', 'fast_start', 'phase', 'select', 'target',
+                           'rssi_threshold'):
+                raise RfidReaderException(f"Unknown inventory setting {key}")
+        parameters: List[Any] = []
+        update: Dict[str, Any] = {}
+        for index, key in enumerate(keys):
+            value = settings.get(key)
+            if value is not None:
+                update[key] = value
+            else:
+                value = config[key]
+            parameters.append(bti(value) if index < 5 else value)
+        return parameters, update
+
+    def _prepare_setting_command(self, key: str, value: Any) -> Tuple[Any, ...]:
+        """Return the command for a setting of `apply_settings()`
+
+        Args:
+            key (str): the setting name
+
+            value (Any): the setting value
+
+        Raises:
+            RfidReaderException: if the setting is unknown or the value is invalid
+
+        Returns:
+            Tuple[Any, ...]: the command and its parameters
+        """
+        # disable 'Too many return statements' warning - pylint: disable=R0911
+        command: Optional[str] = self._SETTING_COMMANDS.get(key)
+        if command:
+            return (command, value)
+        if key == 'q_value':
+            if isinstance(value, dict):
+                q_min: int = value.get('q_min', -1)
+                q_max: int = value.get('q_max', -1)
+                if not (q_min >= 0 and q_max >= 0 or q_max < 0 and q_min < 0):
+                    raise RfidReaderException("Must set both q_min and q_max or none of the them")
+                return ("AT+Q", value['q_start'], q_min if q_min >= 0 else None, q_max if q_max >= 0 else None)
+            return ("AT+Q", value)
+        if key == 'inventory_settings':
+            return ("AT+INVS", *self._prepare_inventory_settings(value)[0])
+        if key == 'mask':
+            if not value:
+                return ('AT+MSK', "OFF")
+            bit_length: int = value.get('bit_length', 0)
+            if bit_length > 0:
+                return ('AT+BMSK', value.get('memory', "EPC"), value.get('start', 0), value['mask'], bit_length)
+            return ('AT+MSK', value.get('memory', "EPC"), value.get('start', 0), value['mask'])
+        raise RfidReaderException(f"Unknown setting {key}")
 
     # @override
     def _handle_inventory_events(self, msg: str, timestamp: float):
+        self._handle_inventory_events_bytes(msg.encode(), timestamp)
+
+    # @override
+    def _handle_inventory_events_bytes(self, msg: bytes, timestamp: float) -> None:
         # continuous inventory event
         try:
-            if msg[2] == 'M':  # +CMINV:
+            if msg[2] == 0x4D:  # +CMINV:
                 # '+CMINV: '
-                self._fire_inventory_event(self._parse_inventory(
-                    msg.split("\r"), timestamp, 8))  # type: ignore
-            elif msg[5] == 'R':
+                self._fire_inventory_event(self._parse_inventory_bytes(
+                    msg.split(b"\r"), timestamp, 8))  # type: ignore
+            elif msg[5] == 0x52:
                 # '+CINVR: '
-                self._fire_inventory_report_event(self._parse_inventory(
-                    msg.split("\r"), timestamp, 8, True))  # '+CINVR: '
+                self._fire_inventory_report_event(self._parse_inventory_bytes(
+                    msg.split(b"\r"), timestamp, 8, True))  # '+CINVR: '
             else:
                 # '+CINV: '
-                self._fire_inventory_event(self._parse_inventory(
-                    msg.split("\r"), timestamp, 7))  # type: ignore
+                self._fire_inventory_event(self._parse_inventory_bytes(
+                    msg.split(b"\r"), timestamp, 7))  # type: ignore
         except RfidReaderException as err:
             if self._status['status'] == RfidReader.WARNING and "antenna error" in self.get_status()['message'].lower():
                 # error is already set
@@ -1453,46 +1694,247 @@ class UhfReaderAT(ReaderAT):
             timestamp: float, split_index: int = 6, is_report: bool = False) -> List[UhfTag]:
         # +CINV: 3034257BF468D480000003EC,E200600311753E33,1755 +CINV=<ROUND FINISHED, ANT=2>
         # +INV: 0209202015604090990000145549021C,E200600311753F23,1807
-        # disable 'Too many branches' warning - pylint: disable=R0912
-        # disable 'Too many local variables' warning - pylint: disable=R0914
+        return self._parse_inventory_bytes([response.encode() for response in responses],
+                                           timestamp, split_index, is_report)
 
-        inventory: List[UhfTag] = []
-        with_tid: bool = self._config['inventory']['with_tid']
-        with_rssi: bool = self._config['inventory']['with_rssi']
-        with_phase: bool = self._config['inventory'].get('phase', False)
-        antenna: Optional[int] = None
-        error: Optional[str] = None
-        for response in responses:
-            if response[0] != '+':
-                continue
-            if response[split_index] == '<':
-                # inventory message, no tag
-                # messages: <Antenna Error> / <NO TAGS FOUND> / <ROUND FINISHED ANT=2>
-                if response[split_index+1] == 'N':  # NO TAGS FOUND
-                    pass
-                elif response[split_index+1] == 'R':
-                    if len(response) > split_index + 16:
-                        # ROUND FINISHED ANT2
-                        try:
-                            antenna = int(response[-2:-1])
-                        except (IndexError, ValueError) as err:
-                            self.get_logger().debug("Error parsing inventory response - %s", err)
-                elif self._ignore_errors:
-                    pass
-                else:
-                    print(f"error: {response[split_index+1:-1]} - {self._ignore_errors}")
-                    error = response[split_index+1:-1]
-                continue
-            info: List[str] = response[split_index:].split(',')
-            try:
-                new_tag = UhfTag(info[0], timestamp, tid=info[1] if with_tid else None,
-                                 rssi=int(info[2]) if with_rssi and with_tid else int(info[1]) if with_rssi else None,
-                                 seen_count=int(info[-1]) if is_report else 1)
-                if with_phase:
-                    new_tag['phase'] = [info[-2], info[-1]]
-                inventory.append(new_tag)
-            except IndexError as err:
-                self.get_logger().debug("Error parsing inventory transponder -%s", err)
+    def _parse_inventory_bytes(
+            self, responses: List[bytes],
+            timestamp: float, split_index: int = 6, is_report: bool = False) -> List[UhfTag]:
+        """Bytes variant of `_parse_inventory`.
+
+        Uses a parser specialized for the current inventory settings, see `_create_inventory_parser`.
+        """
+        parser = self._inventory_parsers.get((split_index, is_report))
+        if parser is None:
+            parser = self._create_inventory_parser(split_index, is_report)
+            self._inventory_parsers[(split_index, is_report)] = parser
+        return parser(responses, timestamp)
+
+    def _create_inventory_parser(
+            self, split_index: int, is_report: bool) -> Callable[[List[bytes], float], List[UhfTag]]:
+        """Create an inventory event parser for the current inventory settings.
+
+        The field positions of TID, RSSI, phase and seen count are resolved once. Only the tag fields
+        are decoded, the numbers are parsed from the bytes directly. The tags are filled with the same
+        items the UhfTag constructor sets, without the setter calls.
+
+        Args:
+            split_index (int): the length of the response prefix, e.g. len("+CINV: ")
+
+            is_report (bool): True for inventory reports, which end with the seen count
+
+        Returns:
+            Callable[[List[bytes], float], List[UhfTag]]: the parser for the response lines and timestamp
+        """
+        if self._tag_batch:
+            return self._create_tag_batch_parser(split_index, is_report)
+        if self._compact_tags:
+            return self._create_compact_inventory_parser(split_index, is_report)
+        config: Dict[str, Any] = self._config.get('inventory', {})
+        with_tid: bool = bool(config.get('with_tid'))
+        with_rssi: bool = bool(config.get('with_rssi'))
+        with_phase: bool = bool(config.get('phase'))
+        rssi_index: int = 2 if with_tid else 1
+        new_tag = UhfTag.__new__
+        parse_message = self._parse_inventory_message
+        finish_inventory = self._finish_inventory
+        logger = self.get_logger()
+
+        def parse(responses: List[bytes], timestamp: float) -> List[UhfTag]:
+            inventory: List[UhfTag] = []
+            antenna: Optional[int] = None
+            error: Optional[str] = None
+            for response in responses:
+                if response[:1] != b'+':
+                    continue
+                if response[split_index] == 0x3C:  # '<'
+                    antenna, error = parse_message(response.decode(), split_index, antenna, error)
+                    continue
+                info: List[bytes] = response[split_index:].split(b',')
+                try:
+                    tag: UhfTag = new_tag(UhfTag)
+                    if with_tid:
+                        tid: str = info[1].decode()
+                        if tid:
+                            tag['tid'] = tid
+                    tag['first_seen'] = timestamp
+                    tag['last_seen'] = timestamp
+                    epc: str = info[0].decode()
+                    tag['inventory_epc'] = epc
+                    tag['epc'] = epc
+                    if with_rssi:
+                        rssi: int = int(info[rssi_index])
+                        if rssi:
+                            tag['rssi'] = rssi
+                    seen_count: int = int(info[-1]) if is_report else 1
+                    if seen_count:
+                        tag['seen_count'] = seen_count
+                    if with_phase:
+                        tag['phase'] = [info[-2].decode(), info[-1].decode()]
+                    inventory.append(tag)
+                except IndexError as err:
+                    logger.debug("Error parsing inventory transponder -%s", err)
+            return finish_inventory(inventory, antenna, error)
+        return parse
+
+    def _create_compact_inventory_parser(
+            self, split_index: int, is_report: bool) -> Callable[[List[bytes], float], List[UhfTag]]:
+        """Create an inventory event parser for the current inventory settings, which returns
+        `CompactUhfTag` objects.
+
+        Args:
+            split_index (int): the length of the response prefix, e.g. len("+CINV: ")
+
+            is_report (bool): True for inventory reports, which end with the seen count
+
+        Returns:
+            Callable[[List[bytes], float], List[UhfTag]]: the parser for the response lines and timestamp
+        """
+        config: Dict[str, Any] = self._config.get('inventory', {})
+        with_tid: bool = bool(config.get('with_tid'))
+        with_rssi: bool = bool(config.get('with_rssi'))
+        with_phase: bool = bool(config.get('phase'))
+        rssi_index: int = 2 if with_tid else 1
+        parse_message = self._parse_inventory_message
+        finish_inventory = self._finish_inventory
+        logger = self.get_logger()
+
+        def parse(responses: List[bytes], timestamp: float) -> List[UhfTag]:
+            inventory: List[CompactUhfTag] = []
+            antenna: Optional[int] = None
+            error: Optional[str] = None
+            for response in responses:
+                if response[:1] != b'+':
+                    continue
+                if response[split_index] == 0x3C:  # '<'
+                    antenna, error = parse_message(response.decode(), split_index, antenna, error)
+                    continue
+                info: List[bytes] = response[split_index:].split(b',')
+                try:
+                    tag: CompactUhfTag = CompactUhfTag(
+                        info[0].decode(), timestamp, info[1].decode() if with_tid else None, None,
+                        int(info[-1]) if is_report else 1, int(info[rssi_index]) if with_rssi else None)
+                    if with_phase:
+                        tag.set_phase([info[-2].decode(), info[-1].decode()])  # type: ignore
+                    inventory.append(tag)
+                except IndexError as err:
+                    logger.debug("Error parsing inventory transponder -%s", err)
+            return finish_inventory(inventory, antenna, error)  # type: ignore
+        return parse
+
+    def _create_tag_batch_parser(
+            self, split_index: int, is_report: bool) -> Callable[[List[bytes], float], List[UhfTag]]:
+        """Create an inventory parser for the current inventory settings, which returns a `TagBatch`.
+
+        The tag lines are joined and split into their fields at once. The columns are then taken
+        from the field list with a fixed stride. Responses that do not have the expected layout, and
+        inventories with phase information, are parsed line by line.
+
+        Args:
+            split_index (int): the length of the response prefix, e.g. len("+CINV: ")
+
+            is_report (bool): True for inventory reports, which end with the seen count
+
+        Returns:
+            Callable[[List[bytes], float], List[UhfTag]]: the parser for the response lines and timestamp
+        """
+        config: Dict[str, Any] = self._config.get('inventory', {})
+        with_tid: bool = bool(config.get('with_tid'))
+        with_rssi: bool = bool(config.get('with_rssi'))
+        with_phase: bool = bool(config.get('phase'))
+        rssi_index: int = 2 if with_tid else 1
+        field_count: int = 1 + with_tid + with_rssi + is_report
+        count_separators = methodcaller('count', b',')
+        parse_message = self._parse_inventory_message
+        finish_inventory = self._finish_inventory
+        logger = self.get_logger()
+
+        def parse(responses: List[bytes], timestamp: float) -> List[UhfTag]:
+            if with_phase:
+                return parse_lines(responses, timestamp)
+            antenna: Optional[int] = None
+            error: Optional[str] = None
+            data: bytes = b"\r".join(responses)
+            lines: List[bytes] = responses
+            if b"<" in data:
+                # remove the inventory messages
+                lines = []
+                for response in responses:
+                    if response[split_index:split_index + 1] != b'<':
+                        lines.append(response)
+                    elif response[:1] == b'+':
+                        antenna, error = parse_message(response.decode(), split_index, antenna, error)
+                data = b"\r".join(lines)
+            if not lines:
+                return finish_inventory(TagBatch(), antenna, error)  # type: ignore
+            prefix: bytes = lines[0][:split_index]
+            values: bytes = data.replace(prefix, b"")
+            # all lines must start with the prefix and have the same number of fields
+            if (prefix[:1] != b'+' or len(data) - len(values) != len(prefix) * len(lines) or
+                    set(map(count_separators, values.split(b"\r"))) != {field_count - 1}):
+                return parse_lines(responses, timestamp)
+            fields: List[bytes] = values.replace(b"\r", b",").split(b",")
+            batch: TagBatch = TagBatch.from_columns(
+                fields[0::field_count], timestamp,
+                tids=fields[1::field_count] if with_tid else None,
+                rssi=list(map(int, fields[rssi_index::field_count])) if with_rssi else None,
+                seen_counts=list(map(int, fields[field_count - 1::field_count])) if is_report else None)
+            return finish_inventory(batch, antenna, error)  # type: ignore
+
+        def parse_lines(responses: List[bytes], timestamp: float) -> List[UhfTag]:
+            batch: TagBatch = TagBatch()
+            append = batch.append
+            antenna: Optional[int] = None
+            error: Optional[str] = None
+            for response in responses:
+                if response[:1] != b'+':
+                    continue
+                if response[split_index] == 0x3C:  # '<'
+                    antenna, error = parse_message(response.decode(), split_index, antenna, error)
+                    continue
+                info: List[bytes] = response[split_index:].split(b',')
+                try:
+                    append(info[0], timestamp, info[1] if with_tid else None,
+                           int(info[rssi_index]) if with_rssi else 0, 0,
+                           int(info[-1]) if is_report else 1,
+                           [info[-2].decode(), info[-1].decode()] if with_phase else None)
+                except IndexError as err:
+                    logger.debug("Error parsing inventory transponder -%s", err)
+            return finish_inventory(batch, antenna, error)  # type: ignore
+        return parse
+
+    def _parse_inventory_message(self, response: str, split_index: int, antenna: Optional[int],
+                                 error: Optional[str]) -> Tuple[Optional[int], Optional[str]]:
+        """Parse an inventory message without a tag
+
+        Returns:
+            Tuple[Optional[int], Optional[str]]: the updated antenna and error
+        """
+        # inventory message, no tag
+        # messages: <Antenna Error> / <NO TAGS FOUND> / <ROUND FINISHED ANT=2>
+        if response[split_index+1] == 'N':  # NO TAGS FOUND
+            pass
+        elif response[split_index+1] == 'R':
+            if len(response) > split_index + 16:
+                # ROUND FINISHED ANT2
+                try:
+                    antenna = int(response[-2:-1])
+                except (IndexError, ValueError) as err:
+                    self.get_logger().debug("Error parsing inventory response - %s", err)
+        elif self._ignore_errors:
+            pass
+        else:
+            print(f"error: {response[split_index+1:-1]} - {self._ignore_errors}")
+            error = response[split_index+1:-1]
+        return antenna, error
+
+    def _finish_inventory(self, inventory: List[UhfTag], antenna: Optional[int],
+                          error: Optional[str]) -> List[UhfTag]:
+        """Store the inventory error or set the antenna of the parsed tags
+
+        Raises:
+            RfidReaderException: if the inventory contains an error
+        """
         if error:
             error_detail = self._config.get('error', {})
             self._config.setdefault('error', error_detail)
@@ -1502,19 +1944,39 @@ class UhfReaderAT(ReaderAT):
                 error_detail['message'] = error
             raise RfidReaderException(f"{error}{f' - Antenna {antenna} ' if antenna else ''}")
         if antenna:
-            for tag in inventory:
-                tag.set_antenna(antenna)
-        return inventory
+            self._set_inventory_antenna(inventory, antenna)
+        return self._freeze_tags(inventory)  # type: ignore
+
+    @staticmethod
+    def _set_inventory_antenna(inventory: List[UhfTag], antenna: int) -> None:
+        """Set the antenna of all tags of the inventory"""
+        # disable protected member access warning - pylint: disable=W0212
+        if isinstance(inventory, TagBatch):
+            inventory.set_antenna(antenna)
+            return
+        # the parsed compact transponders are frozen
+        for tag in inventory:
+            tag._set_antenna(antenna)
 
     def _fire_inventory_report_event(self, inventory: List[UhfTag], continuous: bool = True) -> None:
         """ Checks the inventory and calls the inventory callback """
+        self._freeze_tags(inventory)  # type: ignore
+        if inventory and continuous:
+            for stream in self._inventory_report_streams:
+                stream.put(inventory)  # type: ignore
         if not self._cb_inventory_report:
-            if continuous:
-                self._update_inventory(inventory)  # type: ignore
+            if inventory and continuous and not self._inventory_report_streams:
+                self._update_inventory_report(inventory)
             return
         if not self._fire_empty_reports and not inventory:
             return
-        self._cb_inventory_report(inventory)
+        self._callback_dispatcher.dispatch(self._cb_inventory_report, inventory)
+
+    def _update_inventory_report(self, inventory: List[UhfTag]) -> None:
+        """ Adds the transponders to the report store and wakes up a waiting `fetch_inventory_report()` """
+        self._inventory_report.merge(inventory)  # type: ignore
+        if self._inventory_report:
+            self._inventory_report_event.set()
 
     def _parse_tag_responses(self, responses: list, prefix_length: int) -> List[UhfTag]:
         """Parsing the transponder responses. Used when the response list contains only the epc and the response code
@@ -1533,6 +1995,7 @@ class UhfReaderAT(ReaderAT):
         # prefix_length = len("+COMMAND: ")
         timestamp: float = time()
         tags: List[UhfTag] = []
+        tag_class: type = self._get_tag_class(UhfTag)
         for response in responses:
             if response[prefix_length] == '<':
                 # inventory message, no tag
@@ -1541,11 +2004,11 @@ class UhfReaderAT(ReaderAT):
                     pass
                 continue
             info: List[str] = response[prefix_length:].split(',')
-            tag: UhfTag = UhfTag(info[0], timestamp)
+            tag: UhfTag = tag_class(info[0], timestamp)
             if info[1] != 'OK':
                 tag.set_error_message(info[1])
             tags.append(tag)
-        return tags
+        return self._freeze_tags(tags)  # type: ignore
 
 
 class UhfReaderATMulti(UhfReaderAT):
@@ -1607,7 +2070,7 @@ class UhfReaderATMulti(UhfReaderAT):
             List[int]: The antenna port sequence.
 
         """
-        responses: List[str] = await self._send_command("AT+MUX?")
+        responses: List[str] = await self._query_setting("AT+MUX?")
         # +MUX: 1,2,3,....
         data: List[str] = responses[0][6:].split(',')
         if len(data) == 1:
@@ -1625,6 +2088,7 @@ class UhfReaderATMulti(UhfReaderAT):
 
         """
         await self._send_command("AT+PWR", *antenna_powers)
+        self._update_setting("AT+PWR?", ["+PWR: " + ",".join(str(power) for power in antenna_powers)])
 
     async def get_antenna_powers(self) -> List[int]:
         """Return a list of current power values for each antenna.
@@ -1635,7 +2099,7 @@ class UhfReaderATMulti(UhfReaderAT):
             List[int]: List with power values in dBm.
 
         """
-        responses: List[str] = await self._send_command("AT+PWR?")
+        responses: List[str] = await self._query_setting("AT+PWR?")
         # +PWR: 12,12,12,12
         data: List[str] = responses[0][6:].split(',')
         # return [int(i) for i in data]
@@ -1708,7 +2172,7 @@ class UhfReaderATMulti(UhfReaderAT):
         # +MINV: <ROUND FINISHED, ANT=4><CR>
 
         # split answers in antenna sections
-        inventory: List[UhfTag] = []
+        inventory: List[UhfTag] = TagBatch() if self._tag_batch else []  # type: ignore
         last_index: int = 0
         for index, item in enumerate(responses):
             if item.startswith("+MINV: <R"):
@@ -1740,3 +2204,21 @@ class UhfReaderATMulti(UhfReaderAT):
         """
 
         await self.stop_inventory()
+
+    ###############################################################################################
+    # Internal methods
+    ###############################################################################################
+
+    # @override
+    def _get_setting_queries(self) -> Tuple[str, ...]:
+        return super()._get_setting_queries() + ("AT+MUX?",)
+
+    # @override
+    def _prepare_setting_command(self, key: str, value: Any) -> Tuple[Any, ...]:
+        if key == 'antenna_powers':
+            return ("AT+PWR", *value)
+        if key == 'antenna_multiplex':
+            if isinstance(value, int):
+                return ("AT+MUX", value)
+            return ("AT+MUX", *value)
+        return super()._prepare_setting_command(key, value)
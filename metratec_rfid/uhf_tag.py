@@ -102,3 +102,7 @@ class UhfTag(Tag):
             phase (List[int]): The phase value to set.
         """
         self.set_value('phase', phase)
+
+    # the internal setters, see `Tag`
+    _set_epc = set_epc
+    _set_rssi = set_rssi
@@ -3,7 +3,13 @@ This file contains software utility functions that are not directly related
 to reader functionality and are thus independent from the reader objects.
 """
 
+import asyncio
 import importlib
+import ipaddress
+import json
+import os
+import re
+from collections.abc import Mapping
 from serial.tools import list_ports
 
 from .reader_at import ReaderAT
@@ -12,38 +18,68 @@ from .reader_exception import RfidReaderException
 from .connection.serial_connection import SerialConnection
 
 
+class _ReaderLookupTable(Mapping):
+    """
+    Firmware name to reader class lookup table, the reader modules are imported on first access.
+    """
+
+    def __init__(self, classes):
+        # firmware name -> (module, class name)
+        self._classes = classes
+
+    def __getitem__(self, fwname):
+        module_name, class_name = self._classes[fwname]
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def __contains__(self, fwname):
+        # without importing the module
+        return fwname in self._classes
+
+    def __iter__(self):
+        return iter(self._classes)
+
+    def __len__(self):
+        return len(self._classes)
+
+
 # firmware name to reader class lookup table
-FW_READER_LUT = {
+FW_READER_LUT = _ReaderLookupTable({
         # UHF ASCII reader (legacy)
-        "DESKID_UHF": importlib.import_module("metratec_rfid.deskid_uhf").DeskIdUhf,
-        "PULSAR_MX": importlib.import_module("metratec_rfid.pulsar_mx").PulsarMX,
+        "DESKID_UHF": ("metratec_rfid.deskid_uhf", "DeskIdUhf"),
+        "PULSAR_MX": ("metratec_rfid.pulsar_mx", "PulsarMX"),
         # HF ASCII reader (legacy)
-        "DESKID_ISO": importlib.import_module("metratec_rfid.deskid_iso").DeskIdIso,
-        "QuasarLR": importlib.import_module("metratec_rfid.quasar_lr").QuasarLR,
-        "QUASAR_MX": importlib.import_module("metratec_rfid.quasar_mx").QuasarMX,
+        "DESKID_ISO": ("metratec_rfid.deskid_iso", "DeskIdIso"),
+        "QuasarLR": ("metratec_rfid.quasar_lr", "QuasarLR"),
+        "QUASAR_MX": ("metratec_rfid.quasar_mx", "QuasarMX"),
         # UHF AT reader
-        "PULSAR_LR": importlib.import_module("metratec_rfid.pulsar_lr").PulsarLR,
-        "PLRM": importlib.import_module("metratec_rfid.plrm").Plrm,
-        "DeskID_UHF_v2_E": importlib.import_module("metratec_rfid.deskid_uhf").DeskIdUhfv2,
-        "DeskID_UHF_v2_F": importlib.import_module("metratec_rfid.deskid_uhf").DeskIdUhfv2FCC,
-        "QRG2_ETSI": importlib.import_module("metratec_rfid.qrg2").QRG2,
-        "QRG2_FCC": importlib.import_module("metratec_rfid.qrg2").QRG2FCC,
-        "DwarfG2_v2": importlib.import_module("metratec_rfid.dwarfg2_v2").DwarfG2v2,
-        "DwarfG2-Mini_v2": importlib.import_module("metratec_rfid.dwarfg2_v2").DwarfG2Miniv2,
-        "DwarfG2_XR_v2": importlib.import_module("metratec_rfid.dwarfg2_v2").DwarfG2XRv2,
+        "PULSAR_LR": ("metratec_rfid.pulsar_lr", "PulsarLR"),
+        "PLRM": ("metratec_rfid.plrm", "Plrm"),
+        "DeskID_UHF_v2_E": ("metratec_rfid.deskid_uhf", "DeskIdUhfv2"),
+        "DeskID_UHF_v2_F": ("metratec_rfid.deskid_uhf", "DeskIdUhfv2FCC"),
+        "QRG2_ETSI": ("metratec_rfid.qrg2", "QRG2"),
+        "QRG2_FCC": ("metratec_rfid.qrg2", "QRG2FCC"),
+        "DwarfG2_v2": ("metratec_rfid.dwarfg2_v2", "DwarfG2v2"),
+        "DwarfG2-Mini_v2": ("metratec_rfid.dwarfg2_v2", "DwarfG2Miniv2"),
+        "DwarfG2_XR_v2": ("metratec_rfid.dwarfg2_v2", "DwarfG2XRv2"),
         # NFC AT reader
-        "DeskID_NFC": importlib.import_module("metratec_rfid.deskid_nfc").DeskIdNfc,
-        "QR_NFC": importlib.import_module("metratec_rfid.qr_nfc").QrNfc,
-    }
+        "DeskID_NFC": ("metratec_rfid.deskid_nfc", "DeskIdNfc"),
+        "QR_NFC": ("metratec_rfid.qr_nfc", "QrNfc"),
+    })
 
 
-async def detect_readers(port_re="USB", verbose=False, legacy=False):
+async def detect_readers(port_re="USB", verbose=False, legacy=False, max_concurrency=8, cache_file=None):
     """
     Detect Metratec RFID readers connected to the system via USB.
 
     The RFID readers cannot be identified by USB information alone, therefore
     this function will try to establish a connection on all potential ports
     and query the reader firmware information by sending a command.
+    The ports are probed concurrently, at most `max_concurrency` at a time.
+
+    If a cache file is set, the firmware names of the detected readers are
+    stored by the USB VID:PID and serial number of the port. Ports found in
+    the cache are not probed again, so a restart finds the readers instantly.
+    Ports without an USB serial number are always probed.
 
     Make sure this process does not interrupt any other serial devices
     that may be connected to your PC.
@@ -52,6 +88,8 @@ async def detect_readers(port_re="USB", verbose=False, legacy=False):
         port_re (str, optional): Regular expression for filtering ports. Defaults to "USB".
         verbose (bool, optional): Whether to print debug information. Defaults to False.
         legacy (bool, optional): Whether to include legacy reader support. Defaults to False.
+        max_concurrency (int, optional): Maximum number of ports probed at the same time. Defaults to 8.
+        cache_file (str, optional): JSON file for the detected readers. Defaults to None (no cache).
 
     Returns:
         dict: Dictionary mapping port names to reader objects.
@@ -63,38 +101,29 @@ async def detect_readers(port_re="USB", verbose=False, legacy=False):
     ports = list(list_ports.grep(port_re))
     print(f"Found {len(ports)} ports matching '{port_re}'") if verbose else lambda: None
 
-    # must use different reader class for legacy readers to get reader info
-    classes = {}
-    for port in ports:
-        p = port[0]
-        reader = ReaderAT("", SerialConnection(p))
-        classes[p] = [reader]
+    cache = _load_detection_cache(cache_file) if cache_file else {}
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
 
-        if legacy:
-            reader = ReaderAscii("", SerialConnection(p))
-            classes[p].append(reader)
+    async def detect(port):
+        key = _get_port_key(port)
+        fwname = cache.get(key) if key else None
+        if fwname in FW_READER_LUT:
+            print(f"Reader {fwname} on port {port.device} found in cache") if verbose else lambda: None
+            return fwname
+        async with semaphore:
+            fwname = await _probe_port(port.device, verbose, legacy)
+        if fwname is not None and key:
+            cache[key] = fwname
+        return fwname
 
-    # determine on which port an RFID is connected
-    readers = {}
-    for p, reader_list in classes.items():
-        # try to open a connection and query device information
-        info = None
-        for reader in reader_list:
-            print(f"Try {type(reader).__name__} connection on port {p}") if verbose else lambda: None
-            reader.get_logger().setLevel("WARNING" if verbose else "CRITICAL")
-            try:
-                await reader.connect(timeout=3.0)
-                info = await reader.get_reader_info()
-                await reader.disconnect()
-                break
-            except RfidReaderException as e:
-                # connection failed or unexpected reader info
-                print(e) if verbose else lambda: None
+    fwnames = await asyncio.gather(*[detect(port) for port in ports])
 
+    readers = {}
+    for port, fwname in zip(ports, fwnames):
         # create reader object from firmware name
-        if info is None:
+        if fwname is None:
             continue
-        fwname = info["firmware"]
+        p = port.device
         try:
             reader = FW_READER_LUT[fwname](fwname, p)
         except KeyError:
@@ -105,4 +134,179 @@ async def detect_readers(port_re="USB", verbose=False, legacy=False):
         # add reader object to output
         readers[p] = reader
 
+    if cache_file:
+        _save_detection_cache(cache_file, cache)
+    return readers
+
+
+async def discover_readers(network, port=10001, timeout=1.0, max_time=10.0, max_concurrency=256,
+                           legacy=False, verbose=False):
+    """
+    Discover Metratec RFID readers in a network.
+
+    Connects to the TCP port of all addresses of the network concurrently and
+    identifies the readers by their firmware name (`ATI`, or `RFW` for legacy
+    readers). Only readers that support network connections are returned.
+
+    Args:
+        network (str): The network to probe in CIDR notation, e.g. "192.168.2.0/24",
+            or a single IP address.
+        port (int, optional): The TCP port of the readers. Defaults to 10001.
+        timeout (float, optional): Timeout in seconds for the connection and
+            the identification of a single address. Defaults to 1.0.
+        max_time (float, optional): Maximum time in seconds for the whole discovery,
+            addresses that are not identified by then are skipped. Defaults to 10.0.
+        max_concurrency (int, optional): Maximum number of addresses probed at
+            the same time. Defaults to 256.
+        legacy (bool, optional): Whether to include legacy reader support. Defaults to False.
+        verbose (bool, optional): Whether to print debug information. Defaults to False.
+
+    Raises:
+        ValueError: If the network is not valid.
+
+    Returns:
+        dict: Dictionary mapping IP addresses to reader objects, not connected yet.
+    """
+    # disable 'expression-not-assigned' warning - pylint: disable=W0106
+    # disable 'Too many arguments/local variables' warning - pylint: disable=R0913,R0914,R0917
+    ip_network = ipaddress.ip_network(network, strict=False)
+    hosts = [str(host) for host in ip_network.hosts()] if ip_network.num_addresses > 1 \
+        else [str(ip_network.network_address)]
+    print(f"Probe {len(hosts)} addresses in {ip_network}") if verbose else lambda: None
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def discover(host):
+        async with semaphore:
+            return await _probe_host(host, port, timeout, legacy)
+
+    tasks = [asyncio.ensure_future(discover(host)) for host in hosts]
+    if not tasks:
+        return {}
+    _, pending = await asyncio.wait(tasks, timeout=max_time)
+    for task in pending:
+        task.cancel()
+    if pending:
+        print(f"{len(pending)} addresses not probed within {max_time} seconds") if verbose else lambda: None
+        # let the cancelled probes close their connections
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    readers = {}
+    for host, task in zip(hosts, tasks):
+        if task in pending or task.result() is None:
+            continue
+        fwname = task.result()
+        print(f"Found {fwname} at {host}") if verbose else lambda: None
+        try:
+            reader = FW_READER_LUT[fwname](fwname, host, port)
+        except KeyError:
+            # firmware name not contained in LUT
+            print(f"WARNING: Unknown reader firmware at {host}: {fwname}")
+            continue
+        except TypeError:
+            # reader class only supports serial connections
+            print(f"WARNING: No network support for reader firmware {fwname} at {host}")
+            continue
+        readers[host] = reader
     return readers
+
+
+async def _probe_host(host, port, timeout, legacy):
+    """
+    Connect to the TCP port and return the firmware name of the reader or None.
+    """
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    try:
+        return await asyncio.wait_for(_identify_reader(reader, writer, legacy), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    finally:
+        writer.close()
+
+
+async def _identify_reader(reader, writer, legacy):
+    """
+    Query the firmware name of the reader, returns None if it is not a (supported) reader.
+    """
+    writer.write(b"ATI\r")
+    data = b""
+    while True:
+        received = await reader.read(1024)
+        if not received:
+            return None
+        data += received
+        # +SW: PULSAR_LR 0110
+        match = re.search(rb"\+SW: (\S+) \S+[\r\n]", data)
+        if match:
+            return match.group(1).decode(errors="replace")
+        if re.search(rb"(^|[\r\n])(OK|ERROR)[\r\n]", data):
+            # AT reader without firmware information
+            return None
+        if re.search(rb"(^|[\r\n])(UCO|UPA|CER)[\r]", data):
+            # error of a legacy ascii reader (unknown command, ...)
+            break
+    if not legacy:
+        return None
+    writer.write(b"RFW\r")
+    # DESKID_ISO      0312
+    response = (await reader.readuntil(b"\r")).decode(errors="replace")
+    return response[0:-5].strip() or None
+
+
+async def _probe_port(p, verbose, legacy):
+    """
+    Try to connect to a reader on the port and return its firmware name or None.
+    """
+    # disable 'expression-not-assigned' warning - pylint: disable=W0106
+
+    # must use different reader class for legacy readers to get reader info
+    reader_list = [ReaderAT("", SerialConnection(p))]
+    if legacy:
+        reader_list.append(ReaderAscii("", SerialConnection(p)))
+
+    # try to open a connection and query device information, the first answering protocol wins
+    for reader in reader_list:
+        print(f"Try {type(reader).__name__} connection on port {p}") if verbose else lambda: None
+        reader.get_logger().setLevel("WARNING" if verbose else "CRITICAL")
+        try:
+            await reader.connect(timeout=3.0)
+            info = await reader.get_reader_info()
+            await reader.disconnect()
+            return info["firmware"]
+        except RfidReaderException as e:
+            # connection failed or unexpected reader info
+            print(e) if verbose else lambda: None
+    return None
+
+
+def _get_port_key(port):
+    """
+    Return the cache key of a serial port or None if the port has no USB serial number.
+    """
+    if port.vid is None or port.pid is None or not port.serial_number:
+        return None
+    return f"{port.vid:04X}:{port.pid:04X}:{port.serial_number}"
+
+
+def _load_detection_cache(path):
+    """
+    Load the detected firmware names by port key, an unreadable cache file is ignored.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            cache = json.load(file)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_detection_cache(path, cache):
+    """
+    Write the detected firmware names by port key.
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(cache, file, indent=2, sort_keys=True)
+    os.replace(temp_path, path)